@@ -15,6 +15,10 @@
 __OBJECT_REGISTRY = {};
 __WRAPPER_REGISTRY = {};
 __GLOBAL_SCOPE_WRAPPERS = undefined;
+__PREPARED_FUNCTIONS = {};
+__TRANSACTION = undefined;
+__CURRENT_JOB = undefined;
+__PLUG_PLUG = undefined;
 
 // This adds a "unique_id" method to any object that's defined.
 (function() {
@@ -83,14 +87,14 @@ with their concrete-object equivalent.
 :param params: The list of arguments to prepare.
 */
 function prepare_arguments(params) {
-    prepped = [];
+    var prepped = [];
     
     if (params == undefined) {
         return prepped;
     }
 
     for (var i=0; i<params.length; i++) {
-        arg = params[i];
+        var arg = params[i];
 
         if (arg instanceof Array) {
             prepped.push(prepare_arguments(arg));
@@ -336,6 +340,650 @@ function rpc_call(uid, params, bound_parent_uid) {
     }
 }
 
+/*
+Gets the value of the given property path on the given object. The path can be
+a single property name, or a dotted path like "fullName.fsName", in which case
+each property is looked up in turn.
+
+:param obj: The concrete object to get the value from.
+:param path: The property name or dotted property path.
+*/
+function resolve_property(obj, path) {
+    var names = String(path).split(".");
+    var value = obj;
+
+    for (var i=0; i<names.length; i++) {
+        if (value === undefined || value === null) {
+            return undefined;
+        }
+        value = value[names[i]];
+    }
+
+    return value;
+}
+
+/*
+Tests whether the given value is a primitive that can be JSON encoded as is.
+
+:param value: The value to test.
+
+:rtype: boolean
+*/
+function is_primitive(value) {
+    var value_type = typeof value;
+    return (
+        value === null ||
+        value_type == 'string' ||
+        value_type == 'number' ||
+        value_type == 'boolean'
+    );
+}
+
+/*
+Converts the given value into plain data that can be JSON encoded without any
+wrapping. Primitives are returned as is, arrays are converted item by item, and
+anything else (enumerator values, UnitValues, Files, ...) is converted to its
+string representation, such as "LayerKind.TEXT" or "72 px".
+
+:param value: The value to convert.
+*/
+function serialize_value(value) {
+    if (value === undefined || value === null) {
+        return null;
+    }
+    else if (is_primitive(value)) {
+        return value;
+    }
+    else if (value instanceof Array) {
+        var values = [];
+
+        for (var i=0; i<value.length; i++) {
+            values.push(serialize_value(value[i]));
+        }
+
+        return values;
+    }
+
+    return String(value);
+}
+
+/*
+Gets the values of several properties of the concrete object identified by the
+given unique id in a single evaluation. Properties that can not be read, like
+the fullName of a document that has never been saved, are omitted from the
+result.
+
+:param uid: The unique id of the concrete object.
+:param names: The list of property names or dotted property paths to get. If
+    empty, all properties of the object holding a primitive value are returned.
+*/
+function rpc_snapshot(uid, names) {
+    var obj = __OBJECT_REGISTRY[uid];
+    var snapshot = {};
+    var primitives_only = false;
+
+    if (names == undefined || names.length == 0) {
+        names = [];
+        primitives_only = true;
+
+        var properties = obj.reflect.properties;
+
+        for (var i=0; i<properties.length; i++) {
+            var prop_name = properties[i].name;
+
+            if (prop_name.indexOf("__") != 0 && prop_name != "reflect") {
+                names.push(prop_name);
+            }
+        }
+    }
+
+    for (var i=0; i<names.length; i++) {
+        var value;
+
+        try {
+            value = resolve_property(obj, names[i]);
+        }
+        catch(e) {
+            continue;
+        }
+
+        if (primitives_only && !is_primitive(value)) {
+            continue;
+        }
+
+        snapshot[names[i]] = serialize_value(value);
+    }
+
+    return JSON.stringify(snapshot);
+}
+
+/*
+Serializes each item of the given collection, and recursively the items of
+their own child collections, into plain data.
+
+:param collection: The collection of concrete objects to serialize.
+:param children_name: The name of the property holding an item's children.
+:param fields: The list of property names or dotted property paths to record
+    for each item. Fields that can not be read on an item are omitted.
+:param max_depth: The number of levels to serialize. A negative value means
+    that there is no depth limit.
+:param include_handles: If true, each item is also wrapped and recorded under
+    "handle" so that it can be used as a proxy object by the caller.
+:param depth: The depth of the given collection, starting at 1.
+*/
+function serialize_tree(collection, children_name, fields, max_depth, include_handles, depth) {
+    var nodes = [];
+
+    for (var i=0; i<collection.length; i++) {
+        var item = collection[i];
+        var node = {};
+
+        for (var j=0; j<fields.length; j++) {
+            try {
+                node[fields[j]] = serialize_value(resolve_property(item, fields[j]));
+            }
+            catch(e) {
+                // Not every item type has every field, like the "kind" of a
+                // layer set. We just skip those.
+            }
+        }
+
+        if (include_handles) {
+            node["handle"] = wrap_item(item, item.name);
+        }
+
+        var children;
+
+        try {
+            children = item[children_name];
+        }
+        catch(e) {
+            children = undefined;
+        }
+
+        if (children != undefined && children.length != undefined) {
+            if (max_depth < 0 || depth < max_depth) {
+                node["children"] = serialize_tree(
+                    children,
+                    children_name,
+                    fields,
+                    max_depth,
+                    include_handles,
+                    depth + 1
+                );
+            }
+        }
+
+        nodes.push(node);
+    }
+
+    return nodes;
+}
+
+/*
+Serializes the tree of objects found under the given child collection of the
+concrete object identified by the given unique id. This allows a whole layer
+hierarchy to be returned in a single evaluation.
+
+:param uid: The unique id of the concrete object at the root of the tree.
+:param options: An object with the following properties:
+    children: The name of the property holding the child collections.
+    fields: The list of property names or dotted property paths to record.
+    max_depth: The number of levels to serialize, or a negative value for no
+        limit.
+    handles: Whether to include a wrapped handle for each item.
+*/
+function rpc_tree(uid, options) {
+    var obj = __OBJECT_REGISTRY[uid];
+    var tree = serialize_tree(
+        obj[options.children],
+        options.children,
+        options.fields,
+        options.max_depth,
+        options.handles,
+        1
+    );
+
+    return JSON.stringify(tree);
+}
+
+/*
+Tests whether the given object matches all of the given conditions. Each
+condition compares the plain data value of a property, as returned by
+serialize_value(), to an expected value. An object that doesn't have one of the
+properties does not match.
+
+:param obj: The concrete object to test.
+:param where: An object mapping property names or dotted property paths to
+    their expected values.
+
+:rtype: boolean
+*/
+function matches_conditions(obj, where) {
+    for (var name in where) {
+        if (!where.hasOwnProperty(name)) {
+            continue;
+        }
+
+        var value;
+
+        try {
+            value = serialize_value(resolve_property(obj, name));
+        }
+        catch(e) {
+            return false;
+        }
+
+        if (value !== where[name]) {
+            return false;
+        }
+    }
+
+    return true;
+}
+
+/*
+Collects the items of the given collection that match the given conditions,
+optionally descending into the child collection of each item.
+
+:param collection: The collection of concrete objects to search.
+:param options: The query options, as described in rpc_query().
+:param matches: The list that matching items are added to.
+*/
+function collect_matches(collection, options, matches) {
+    for (var i=0; i<collection.length; i++) {
+        var item = collection[i];
+
+        if (matches_conditions(item, options.where)) {
+            if (options.select.length == 0) {
+                matches.push(wrap_item(item, item.name));
+            }
+            else {
+                var node = {};
+
+                for (var j=0; j<options.select.length; j++) {
+                    try {
+                        node[options.select[j]] = serialize_value(
+                            resolve_property(item, options.select[j])
+                        );
+                    }
+                    catch(e) {
+                        // Missing fields are omitted, as with rpc_tree().
+                    }
+                }
+
+                if (options.handles) {
+                    node["handle"] = wrap_item(item, item.name);
+                }
+
+                matches.push(node);
+            }
+        }
+
+        if (options.recursive) {
+            var children;
+
+            try {
+                children = item[options.children];
+            }
+            catch(e) {
+                children = undefined;
+            }
+
+            if (children != undefined && children.length != undefined) {
+                collect_matches(children, options, matches);
+            }
+        }
+    }
+}
+
+/*
+Searches the collection identified by the given unique id for the items that
+match a set of conditions, and returns only those. This allows the filtering to
+happen here rather than transferring the whole collection to the caller.
+
+:param uid: The unique id of the concrete collection to search.
+:param options: An object with the following properties:
+    where: An object mapping property names or dotted property paths to their
+        expected values.
+    select: The list of property names or dotted property paths to return for
+        each match. If empty, wrappers of the matching items are returned.
+    handles: Whether to include a wrapped handle for each match when a
+        selection is given.
+    recursive: Whether to search the child collection of each item as well.
+    children: The name of the property holding an item's child collection.
+*/
+function rpc_query(uid, options) {
+    var collection = __OBJECT_REGISTRY[uid];
+    var matches = [];
+
+    collect_matches(collection, options, matches);
+
+    return JSON.stringify(matches);
+}
+
+/*
+Defines a function that can later be called by name using rpc_invoke(). The
+source is only parsed once, here, rather than every time the function is used.
+
+:param name: The name to register the function under.
+:param source: The source code of a function expression, such as
+    "function(doc, name) { return doc.layers.getByName(name); }".
+*/
+function rpc_prepare(name, source) {
+    var func = eval("(" + source + ")");
+
+    if (typeof func != 'function') {
+        throw new Error("The source of " + name + " is not a function.");
+    }
+
+    __PREPARED_FUNCTIONS[name] = func;
+}
+
+/*
+Calls the function registered under the given name by rpc_prepare(). Parameters
+given will be prepared for use in the local runtime using prepare_arguments()
+and then passed on to the function at call time.
+
+:param name: The name the function was registered under.
+:param params: The list of arguments to provide the function when it is called.
+*/
+function rpc_invoke(name, params) {
+    var result = __PREPARED_FUNCTIONS[name].apply(this, prepare_arguments(params));
+
+    if (result != undefined) {
+        return JSON.stringify(wrap_item(result, name));
+    }
+    else {
+        return;
+    }
+}
+
+/*
+Replaces the given value with its concrete object if it is a wrapper object.
+
+:param value: The value to resolve.
+*/
+function unwrap_value(value) {
+    if (value != undefined && typeof value == 'object' && is_wrapper(value)) {
+        return __OBJECT_REGISTRY[value['__uniqueid']];
+    }
+
+    return value;
+}
+
+/*
+Sets the property of the given name on each of the concrete objects identified
+by the given unique ids, in a single evaluation. A failure to set one of the
+values does not prevent the others from being set.
+
+:param options: An object with the following properties:
+    uids: The list of unique ids of the concrete objects.
+    name: The name of the property to set.
+    values: The list of values to set, one per object.
+
+:returns: A JSON encoded list holding, for each object, either an empty object
+    or an object with an "error" property describing why setting the value
+    failed.
+*/
+function rpc_set_many(options) {
+    var results = [];
+
+    for (var i=0; i<options.uids.length; i++) {
+        try {
+            var obj = __OBJECT_REGISTRY[options.uids[i]];
+            obj[options.name] = unwrap_value(options.values[i]);
+            results.push({});
+        }
+        catch(e) {
+            results.push({error: String(e)});
+        }
+    }
+
+    return JSON.stringify(results);
+}
+
+/*
+Calls the method of the given name on each of the concrete objects identified
+by the given unique ids, in a single evaluation. A failed call does not prevent
+the others from being made.
+
+:param options: An object with the following properties:
+    uids: The list of unique ids of the concrete objects.
+    name: The name of the method to call.
+    args: The list of argument lists to call the method with, one per object.
+
+:returns: A JSON encoded list holding, for each object, either an object with a
+    "result" property holding the wrapped value returned by the method, or an
+    object with an "error" property describing why the call failed.
+*/
+function rpc_call_many(options) {
+    var results = [];
+
+    for (var i=0; i<options.uids.length; i++) {
+        try {
+            var obj = __OBJECT_REGISTRY[options.uids[i]];
+            var args = prepare_arguments(options.args[i]);
+            var result = obj[options.name].apply(obj, args);
+
+            if (result != undefined) {
+                results.push({result: wrap_item(result, options.name)});
+            }
+            else {
+                results.push({result: null});
+            }
+        }
+        catch(e) {
+            results.push({error: String(e)});
+        }
+    }
+
+    return JSON.stringify(results);
+}
+
+/*
+Resolves a value recorded as part of a transaction. References to the result of
+a previous operation are replaced with that result, and wrapper objects with
+their concrete object.
+
+:param value: The recorded value to resolve.
+:param results: The list of results of the operations run so far.
+*/
+function resolve_transaction_value(value, results) {
+    if (value instanceof Array) {
+        var values = [];
+
+        for (var i=0; i<value.length; i++) {
+            values.push(resolve_transaction_value(value[i], results));
+        }
+
+        return values;
+    }
+    else if (value != undefined && typeof value == 'object' && value['__step'] != undefined) {
+        return results[value['__step']];
+    }
+
+    return unwrap_value(value);
+}
+
+/*
+Runs the operations of the current transaction in order, recording the result
+of each of them. Running stops at the first failure, which is recorded as the
+transaction's error.
+*/
+function run_transaction_operations() {
+    var transaction = __TRANSACTION;
+
+    for (var i=0; i<transaction.operations.length; i++) {
+        var operation = transaction.operations[i];
+
+        try {
+            var target = $.global;
+
+            if (operation.target != undefined) {
+                target = resolve_transaction_value(operation.target, transaction.results);
+            }
+
+            if (operation.op == "set") {
+                target[operation.name] = resolve_transaction_value(
+                    operation.value,
+                    transaction.results
+                );
+                transaction.results.push(undefined);
+            }
+            else {
+                var args = resolve_transaction_value(operation.args, transaction.results);
+                transaction.results.push(target[operation.name].apply(target, args));
+            }
+        }
+        catch(e) {
+            transaction.error = "Operation " + i + " (" + operation.op + " " +
+                operation.name + ") failed: " + e;
+            return;
+        }
+    }
+}
+
+/*
+Runs a list of recorded operations in a single evaluation. If a history name is
+given and the host supports it, the operations are grouped in a single history
+state of the active document, which is reverted if one of them fails.
+
+:param options: An object with the following properties:
+    operations: The list of operations to run. Each operation has an "op" of
+        either "set" or "call", a "target" that is either a wrapper object, a
+        reference to the result of a previous operation as {__step: index}, or
+        null for the global scope, the "name" of the property or method, and
+        either the "value" to set or the list of "args" to call the method with.
+    history_name: The name of the history state to group the operations under.
+
+:returns: A JSON encoded object with either a "results" list holding the
+    wrapped value returned by each operation, or an "error" describing the
+    failed operation.
+*/
+function rpc_transaction(options) {
+    __TRANSACTION = {
+        operations: options.operations,
+        results: [],
+        error: undefined
+    };
+
+    var doc = undefined;
+
+    if (options.history_name) {
+        try {
+            doc = app.activeDocument;
+        }
+        catch(e) {
+            doc = undefined;
+        }
+    }
+
+    if (doc != undefined && doc.suspendHistory != undefined) {
+        var history_state = doc.activeHistoryState;
+
+        doc.suspendHistory(options.history_name, "run_transaction_operations()");
+
+        if (__TRANSACTION.error != undefined) {
+            // Revert everything that was done before the failure.
+            doc.activeHistoryState = history_state;
+        }
+    }
+    else {
+        run_transaction_operations();
+    }
+
+    var transaction = __TRANSACTION;
+    __TRANSACTION = undefined;
+
+    if (transaction.error != undefined) {
+        return JSON.stringify({error: transaction.error});
+    }
+
+    var results = [];
+
+    for (var i=0; i<transaction.results.length; i++) {
+        var result = transaction.results[i];
+
+        if (result != undefined) {
+            results.push(wrap_item(result, transaction.operations[i].name));
+        }
+        else {
+            results.push(null);
+        }
+    }
+
+    return JSON.stringify({results: results});
+}
+
+/*
+Reports the progress of the job currently being run. This is meant to be called
+by long-running functions, such as prepared functions, that are executed as a
+job. The report is dispatched as an event to the CEP extension, which forwards
+it to the client that started the job. Outside of a job, this does nothing.
+
+:param progress: The progress value, from 0.0 to 1.0.
+:param message: An optional message describing the current step.
+*/
+function rpc_report_progress(progress, message) {
+    if (__CURRENT_JOB == undefined) {
+        return;
+    }
+
+    try {
+        if (__PLUG_PLUG == undefined) {
+            __PLUG_PLUG = new ExternalObject("lib:PlugPlugExternalObject");
+        }
+
+        var event = new CSXSEvent();
+        event.type = "com.sg.basic.adobe.job_progress";
+        event.data = JSON.stringify({
+            job_id: __CURRENT_JOB,
+            progress: progress,
+            message: message
+        });
+        event.dispatch();
+    }
+    catch(e) {
+        // Progress reports are informative only, and must never cause the
+        // job itself to fail.
+    }
+}
+
+/*
+Describes the active document, if any. This is used by the CEP extension to
+keep clients informed of changes to the active document.
+
+:returns: A JSON encoded object with the "path", "name" and "saved" state of the
+    active document, or null if there is no active document. The path is null
+    if the document has never been saved.
+*/
+function rpc_active_document_state() {
+    var doc = undefined;
+
+    try {
+        doc = app.activeDocument;
+    }
+    catch(e) {
+        return JSON.stringify(null);
+    }
+
+    var state = {
+        path: null,
+        name: doc.name,
+        saved: doc.saved
+    };
+
+    try {
+        state.path = doc.fullName.fsName;
+    }
+    catch(e) {
+        // The document has never been saved.
+    }
+
+    return JSON.stringify(state);
+}
+
 /*
 Wraps the given concrete object according to its type. If a name is given, that
 name will be passed to the wrapper class during instantiation in order to be
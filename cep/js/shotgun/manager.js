@@ -36,14 +36,57 @@ sg_manager.Manager = new function() {
     // remember if pyside was unavailable
     var __pyside_unavailable = false;
 
-    // keep track of the active document
+    // keep track of the active document, as the JSON description returned
+    // by rpc_active_document_state
     var __active_document = undefined;
 
+    // the timer of the pending active document check, if any
+    var __active_document_timer = undefined;
+
+    // whether the active document is currently being probed, and whether
+    // it needs to be probed again once done
+    var __active_document_probing = false;
+    var __active_document_reprobe = false;
+
+    // how long to wait for more events before checking the active document,
+    // in milliseconds
+    const _active_document_check_delay = 100;
+
+    // the startup timeline, as a list of phases and marks timed in
+    // milliseconds since the manager was loaded. see _add_startup_phase
+    var __startup_timeline = [];
+
+    // the name of the file the startup timeline is written to, in the log
+    // folder
+    const _startup_timeline_file_name = "tk-framework-adobe.startup_timeline.json";
+
+    // how to spawn python, as worked out by the first bootstrap
+    var __python_spawn_info = undefined;
+
+    // the standby python process, if any. it has done its imports already
+    // and waits to be handed off the bootstrap settings through stdin, so
+    // that it can take over on reload or if python dies without paying for
+    // the python startup and imports. the toolkit bootstrap, engine startup
+    // and Qt setup still happen after the handoff. set
+    // SHOTGUN_ADOBE_DISABLE_STANDBY to not keep one around.
+    var __standby_process = undefined;
+
+    // the number of times python died and was replaced by the standby
+    // process, and how many times that may happen before giving up
+    var __python_recoveries = 0;
+    const _max_python_recoveries = 3;
+
+    // whether the manager is shutting down
+    var __shutting_down = false;
+
     // ---- public methods
 
     // Setup the Shotgun integration within the app.
     this.on_load = function() {
 
+        __startup_timeline = [];
+        _add_startup_phase("js", "manager_load", 0, performance.now());
+
         // Execute the startup payload and catch *any* errors. If there are
         // errors, display them in the panel if possible.
         try {
@@ -148,20 +191,16 @@ sg_manager.Manager = new function() {
     // Also emits an event for listeners to respond to manager shutdown.
     this.shutdown = function() {
 
+        __shutting_down = true;
+
         // alert listeners that the manager is shutting down
         sg_manager.SHUTTING_DOWN.emit();
 
+        // the standby process is of no use anymore
+        _kill_standby();
+
         // ensure the python process is shut down
-        if (typeof this.python_process !== "undefined") {
-            sg_logging.debug("Terminating python process...");
-            try {
-                this.python_process.kill();
-                sg_logging.debug("Python process terminated successfully.");
-            } catch(error) {
-                sg_logging.warning(
-                    "Unable to terminate python process: " + error.stack);
-            }
-        }
+        _terminate_python();
 
         // shut down socket.io server
         sg_socket_io.SocketManager.stop_socket_server();
@@ -178,8 +217,42 @@ sg_manager.Manager = new function() {
             host_capabilities.SUPPORT_HTML_EXTENSIONS;
     };
 
+    // Schedules a check of the active document. Document events tend to come
+    // in bursts, during tab switches for instance, so the check is debounced:
+    // it only happens once no event has been received for a short while.
     const _active_document_check = function(event) {
-        _cs_interface.evalScript(
+        if ( __active_document_timer !== undefined ) {
+            clearTimeout(__active_document_timer);
+        }
+
+        __active_document_timer = setTimeout(function() {
+            __active_document_timer = undefined;
+            _probe_active_document();
+        }, _active_document_check_delay);
+    };
+
+    // Evaluates the state of the active document, and alerts clients if it
+    // has changed since the last probe. Only one probe is in flight at any
+    // time. Checks requested in the meantime are coalesced into a single new
+    // probe made once the current one completes.
+    const _probe_active_document = function() {
+        // The rpc helpers are loaded along with the socket server, and
+        // there are no clients to tell before that.
+        if ( sg_socket_io.SocketManager.evaluate === undefined ) {
+            return;
+        }
+
+        if ( __active_document_probing ) {
+            __active_document_reprobe = true;
+            return;
+        }
+
+        __active_document_probing = true;
+
+        // The probe goes through the socket server's queue at control
+        // priority, so that it doesn't interleave with client commands and
+        // isn't held back by bulk work.
+        sg_socket_io.SocketManager.evaluate(
             // NOTE: Hopefully this is the same across all Adobe CC
             // products. If it isn't, then we'll likely want to make
             // a manager method that abstracts it away and returns
@@ -189,30 +262,36 @@ sg_manager.Manager = new function() {
             // case you look up the current project and get the path
             // from that. This is going to need to be abstracted
             // somehow when we break this out of being PS only.
-            "app.activeDocument.fullName.fsName",
+            "rpc_active_document_state()",
             function(result) {
-                // If the above command fails, then it's because the
-                // active document is an unsaved file.
+                __active_document_probing = false;
+
+                if ( __active_document_reprobe ) {
+                    // Things changed while we were waiting, so this result
+                    // may already be outdated.
+                    __active_document_reprobe = false;
+                    _probe_active_document();
+                    return;
+                }
+
+                // If the above command fails, there's nothing we can tell
+                // clients.
                 if ( result == "EvalScript error." ) {
-                    // If we previously had a path stored and we're in
-                    // this undefined state, then we've switched from a
-                    // saved document to one that isn't and we still
-                    // need to alert clients.
-                    if ( __active_document !== undefined ) {
-                        sg_logging.debug("Active document changed to undefined");
-                        __active_document = undefined;
-                        sg_socket_io.rpc_active_document_changed("");
-                    }
+                    sg_logging.warn(
+                        "Unable to probe the active document: " + result);
+                    return;
                 }
-                else {
-                    // If it's changed, then alert clients.
-                    if ( __active_document !== result ) {
-                        sg_logging.debug("Active document changed to " + result);
-                        __active_document = result;
-                        sg_socket_io.rpc_active_document_changed(result);
-                    }
+
+                // If it's changed, then alert clients. The state includes
+                // the path, name and saved state of the document, so saving
+                // the active document counts as a change as well.
+                if ( __active_document !== result ) {
+                    sg_logging.debug("Active document changed to " + result);
+                    __active_document = result;
+                    sg_socket_io.rpc_active_document_changed(JSON.parse(result));
                 }
-            }
+            },
+            "control"
         );
     };
 
@@ -222,7 +301,6 @@ sg_manager.Manager = new function() {
     // python process with a bootstrapped toolkit core.
     const _bootstrap_python = function(framework_folder, port) {
 
-        const child_process = require("child_process");
         const path = require("path");
 
         const app_id = _cs_interface.hostEnvironment.appId;
@@ -254,6 +332,10 @@ sg_manager.Manager = new function() {
         // establishing a socket client connection.
         process.env.SHOTGUN_ADOBE_PORT = port;
 
+        // Python reports the bootstrap progress as JSON lines through an
+        // extra pipe, which is the python process' file descriptor 3.
+        process.env.SHOTGUN_ADOBE_BOOTSTRAP_CHANNEL_FD = "3";
+
         // get the bootstrap python script from the bootstrap python dir
         const plugin_bootstrap_py = path.join(plugin_python_path,
             "tk_framework_adobe_utils", "plugin_bootstrap.py");
@@ -273,34 +355,57 @@ sg_manager.Manager = new function() {
             python_exe_path = process.env.SHOTGUN_ADOBE_PYTHON;
         }
 
+        __python_spawn_info = {
+            python_exe_path: python_exe_path,
+            plugin_bootstrap_py: plugin_bootstrap_py,
+            plugin_python_path: plugin_python_path,
+            port: port,
+            engine_name: engine_name,
+            app_id: app_id
+        };
+
+        this.python_process = _spawn_python([
+            // path to the python bootstrap script
+            plugin_bootstrap_py,
+            port,
+            engine_name,
+            app_id
+        ]);
+
+        _add_startup_phase("js", "python_spawned", performance.now(), 0);
+
+        _attach_python_process(this.python_process);
+
+    }.bind(this);
+
+    // Spawn python with the given arguments, from the plugin's python dir.
+    //
+    // Returns the `child_process.ChildProcess` object.
+    const _spawn_python = function(args) {
+
+        const child_process = require("child_process");
+
+        const python_exe_path = __python_spawn_info.python_exe_path;
+        const plugin_python_path = __python_spawn_info.plugin_python_path;
+
         sg_logging.debug("Spawning child process... ");
         sg_logging.debug("Python executable: " + python_exe_path);
         sg_logging.debug("Current working directory: " + plugin_python_path);
         sg_logging.debug("Executing command: " +
-            [
-                python_exe_path,
-                plugin_bootstrap_py,
-                port,
-                engine_name,
-                app_id
-            ].join(" ")
+            [python_exe_path].concat(args).join(" ")
         );
 
         try {
-            this.python_process = child_process.spawn(
+            return child_process.spawn(
                 python_exe_path,
-                [
-                    // path to the python bootstrap script
-                    plugin_bootstrap_py,
-                    port,
-                    engine_name,
-                    app_id
-                ],
+                args,
                 {
                     // start the process from this dir
                     cwd: plugin_python_path,
                     // the environment to use for bootstrapping
-                    env: process.env
+                    env: process.env,
+                    // stdin, stdout, stderr and the bootstrap channel
+                    stdio: ["pipe", "pipe", "pipe", "pipe"]
                 }
             );
         }
@@ -308,26 +413,287 @@ sg_manager.Manager = new function() {
             sg_logging.error("Child process failed to spawn:  " + error);
             throw error;
         }
+    };
 
-        this.python_process.on("error", function(error) {
+    // Make the given python process the one the manager works with: log its
+    // output, follow its bootstrap, and handle it shutting down.
+    const _attach_python_process = function(python_process) {
+
+        python_process.on("error", function(error) {
             sg_logging.error("Python process error: " + error);
         });
 
         // log stdout from python process
-        this.python_process.stdout.on("data", function(data) {
+        python_process.stdout.on("data", function(data) {
             sg_logging.python(data.toString());
         });
 
         // log stderr from python process
-        this.python_process.stderr.on("data", function(data) {
+        python_process.stderr.on("data", function(data) {
             sg_logging.python(data.toString());
         });
 
+        // handle messages received through the bootstrap channel
+        _read_bootstrap_channel(python_process.stdio[3]);
+
         // handle python process disconnection
-        this.python_process.on("close", _handle_python_close);
+        python_process.on("close", _handle_python_close);
+    };
+
+    // Spawn a standby python process, unless there is one already or it has
+    // been disabled through the environment.
+    const _spawn_standby = function() {
+
+        if (__standby_process !== undefined || __shutting_down ||
+                __python_spawn_info === undefined ||
+                process.env.SHOTGUN_ADOBE_DISABLE_STANDBY) {
+            return;
+        }
+
+        sg_logging.debug("Spawning a standby python process...");
+
+        var standby_process = undefined;
+
+        try {
+            standby_process = _spawn_python([
+                __python_spawn_info.plugin_bootstrap_py,
+                "--standby"
+            ]);
+        } catch (error) {
+            // the standby process is an optimization. carry on without it.
+            return;
+        }
+
+        standby_process.on("error", function(error) {
+            sg_logging.debug("Standby python process error: " + error);
+        });
+
+        // read the output of the standby process, so that it never blocks
+        // on a full pipe. it only writes anything if preloading failed.
+        standby_process.stdout.on("data", function(data) {
+            sg_logging.debug("Standby python process: " + data.toString());
+        });
+        standby_process.stderr.on("data", function(data) {
+            sg_logging.warn("Standby python process: " + data.toString());
+        });
+
+        // if the standby process dies before it is used, forget about it
+        standby_process.on("close", function(code, signal) {
+            sg_logging.debug("Standby python process exited: " + code);
+            if (__standby_process === standby_process) {
+                __standby_process = undefined;
+            }
+        });
+
+        __standby_process = standby_process;
+    };
+
+    // Terminate the current python process, if any. Its exit is expected,
+    // and is not handled as a crash.
+    const _terminate_python = function() {
+
+        const python_process = this.python_process;
+
+        if (typeof python_process === "undefined") {
+            return;
+        }
+
+        this.python_process = undefined;
+        python_process.removeAllListeners("close");
+
+        sg_logging.debug("Terminating python process...");
+        try {
+            python_process.kill();
+            sg_logging.debug("Python process terminated successfully.");
+        } catch(error) {
+            sg_logging.warn(
+                "Unable to terminate python process: " + error.stack);
+        }
+    }.bind(this);
+
+    // Kill the standby python process, if any.
+    const _kill_standby = function() {
+
+        if (__standby_process === undefined) {
+            return;
+        }
+
+        const standby_process = __standby_process;
+        __standby_process = undefined;
+
+        try {
+            standby_process.kill();
+        } catch(error) {
+            sg_logging.debug("Unable to terminate standby python process: " + error);
+        }
+    };
+
+    // Hand the bootstrap settings off to the standby python process, which
+    // then replaces the current python process, if any. The current python
+    // process must have been shut down already.
+    //
+    // Returns whether there was a standby process to hand off to.
+    const _promote_standby = function() {
+
+        if (__standby_process === undefined) {
+            return false;
+        }
+
+        const standby_process = __standby_process;
+        __standby_process = undefined;
+
+        sg_logging.debug("Handing off to the standby python process...");
+
+        // the standby process is now handled like any python process
+        standby_process.removeAllListeners("close");
+        standby_process.removeAllListeners("error");
+        standby_process.stdout.removeAllListeners("data");
+        standby_process.stderr.removeAllListeners("data");
+
+        __startup_timeline = [];
+        _add_startup_phase("js", "standby_handoff", performance.now(), 0);
+
+        this.python_process = standby_process;
+        _attach_python_process(standby_process);
 
+        standby_process.stdin.write(JSON.stringify({
+            port: __python_spawn_info.port,
+            engine_name: __python_spawn_info.engine_name,
+            app_id: __python_spawn_info.app_id,
+            env: {
+                SHOTGUN_ADOBE_PORT: String(__python_spawn_info.port)
+            }
+        }) + "\n");
+
+        return true;
     }.bind(this);
 
+    // Handle the JSON lines written by python to the bootstrap channel. The
+    // progress messages are forwarded to the panel, and the timing of each
+    // bootstrap phase is logged.
+    const _read_bootstrap_channel = function(channel) {
+
+        if (!channel) {
+            return;
+        }
+
+        // the end of the last line received, if it was incomplete
+        var partial_line = "";
+
+        channel.on("data", function(data) {
+
+            var lines = (partial_line + data.toString()).split("\n");
+            partial_line = lines.pop();
+
+            lines.forEach(function(line) {
+
+                if (!line.trim()) {
+                    return;
+                }
+
+                var message = undefined;
+
+                try {
+                    message = JSON.parse(line);
+                } catch (error) {
+                    sg_logging.warn("Invalid bootstrap channel message: " + line);
+                    return;
+                }
+
+                // python and js clocks are unrelated, so python phases are
+                // placed on the timeline by the time they were received.
+                const now = performance.now();
+
+                if (message.type == "progress") {
+                    sg_manager.BOOTSTRAP_PROGRESS.emit({
+                        progress: message.progress,
+                        message: message.message
+                    });
+                } else if (message.type == "phase") {
+                    sg_logging.debug(
+                        "Bootstrap phase '" + message.name + "' took " +
+                        message.duration.toFixed(3) + "s."
+                    );
+                    const duration = message.duration * 1000;
+                    _add_startup_phase(
+                        "python", message.name, now - duration, duration);
+                } else if (message.type == "mark") {
+                    _add_startup_phase("python", message.name, now, 0);
+                } else if (message.type == "complete") {
+                    _add_startup_phase("python", "bootstrap_complete", now, 0);
+                    _report_startup_timeline(message.log_folder);
+
+                    // get a process ready to take over from this one
+                    _spawn_standby();
+                }
+            });
+        });
+
+        channel.on("error", function(error) {
+            sg_logging.debug("Bootstrap channel error: " + error);
+        });
+    };
+
+    // Adds a phase to the startup timeline. Marks are phases that have no
+    // duration.
+    const _add_startup_phase = function(source, name, start, duration) {
+        __startup_timeline.push({
+            source: source,
+            name: name,
+            start: start,
+            duration: duration
+        });
+    };
+
+    // Logs the startup timeline, and writes it as JSON to the given folder.
+    const _report_startup_timeline = function(log_folder) {
+
+        const timeline = __startup_timeline.slice().sort(function(a, b) {
+            return a.start - b.start;
+        });
+
+        var lines = ["Startup timeline (milliseconds since the manager was loaded):"];
+
+        timeline.forEach(function(phase) {
+            var line = "  " + phase.start.toFixed(0).padStart(7) + "  " +
+                phase.source.padEnd(7) + phase.name;
+
+            if (phase.duration) {
+                line += " (" + phase.duration.toFixed(0) + " ms)";
+            }
+
+            lines.push(line);
+        });
+
+        sg_logging.info(lines.join("\n"));
+
+        if (!log_folder) {
+            return;
+        }
+
+        const fs = require("fs");
+        const path = require("path");
+
+        const report = {
+            app_id: _cs_interface.hostEnvironment.appId,
+            created: new Date().toISOString(),
+            total: timeline.reduce(function(total, phase) {
+                return Math.max(total, phase.start + phase.duration);
+            }, 0),
+            timeline: timeline
+        };
+
+        const report_path = path.join(log_folder, _startup_timeline_file_name);
+
+        fs.writeFile(report_path, JSON.stringify(report, null, 2), function(error) {
+            if (error) {
+                sg_logging.warn("Unable to write the startup timeline: " + error);
+            } else {
+                sg_logging.debug("Startup timeline written to " + report_path);
+            }
+        });
+    };
+
     // Python should never be shut down by anything other than the manager.
     // So if we're here, something caused it to exit early. Handle any known
     // status codes accordingly.
@@ -341,6 +707,14 @@ sg_manager.Manager = new function() {
             __python_disconnected = true;
             sg_logging.error("Python exited because PySide is unavailable.");
             sg_manager.PYSIDE_NOT_AVAILABLE.emit();
+        } else if (!__shutting_down &&
+                __python_recoveries < _max_python_recoveries &&
+                _promote_standby()) {
+            // The standby process took over.
+            ++__python_recoveries;
+            sg_logging.warn(
+                "Python exited unexpectedly. The standby python process " +
+                "took over.");
         } else {
             // Fallback case where we don't know why it shut down.
             sg_logging.error("Python exited unexpectedly.");
@@ -473,7 +847,13 @@ sg_manager.Manager = new function() {
     // Callback for when an open port is found.
     const _on_server_port_found = function(port) {
 
+        _add_startup_phase("js", "server_port_found", performance.now(), 0);
+
+        const server_start = performance.now();
         sg_socket_io.SocketManager.start_socket_server(port, _cs_interface);
+        _add_startup_phase(
+            "js", "start_socket_server", server_start,
+            performance.now() - server_start);
 
         // Register the socket manager for logging.
         sg_logging.rpc = sg_socket_io;
@@ -492,8 +872,31 @@ sg_manager.Manager = new function() {
     };
 
     // Reloads the manager
+    //
+    // A full reload, as requested by the panel's developer menu, relaunches
+    // the manager, which bootstraps python from scratch and so picks up any
+    // changes made to the extension, framework and core code. Other reloads,
+    // like restarts requested after an error, just replace python with the
+    // standby process if there is one. That is quicker, but the standby
+    // process has imported the framework and core when it was started, so
+    // it won't see changes made to them since then. A new standby process
+    // is started once it has bootstrapped.
     const _reload = function(event) {
 
+        const full = Boolean(event && event.data && event.data.full);
+
+        if (!full && __standby_process !== undefined) {
+            sg_logging.debug("Restarting python using the standby process...");
+
+            _terminate_python();
+            _promote_standby();
+
+            // the panel closed itself when requesting the reload
+            _cs_interface.requestOpenExtension(
+                sg_constants.extension_info["panel"]["id"]);
+            return;
+        }
+
         sg_logging.debug("Reloading the manager...");
 
         // shutdown the python process
@@ -565,11 +968,14 @@ sg_manager.Manager = new function() {
         // NOTE: A useful answer from an Adobe employee in the below:
         // https://forums.adobe.com/thread/1380138#
         //
-        sg_logging.debug("Registering documentAfterActivate event...");
-        _cs_interface.addEventListener(
+        sg_logging.debug("Registering active document events...");
+        [
             'documentAfterActivate',
-            _active_document_check
-        );
+            'documentAfterDeactivate',
+            'documentAfterSave'
+        ].forEach(function(event_type) {
+            _cs_interface.addEventListener(event_type, _active_document_check);
+        });
         _manager_close_listener();
         sg_logging.debug("Event listeners created.");
     };
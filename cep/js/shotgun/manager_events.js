@@ -25,6 +25,16 @@ sg_event.create_event(sg_manager, "UPDATE_CONTEXT_THUMBNAIL");
 // provides the toolkit log file path for display in panel
 sg_event.create_event(sg_manager, "UPDATE_LOG_FILE_PATH");
 
+// reports the progress of the python bootstrap, as received through the
+// structured bootstrap channel. the emitted event will contain a dictionary of
+// the following form:
+//
+//      {
+//         progress: <the startup progress, from 0.0 to 1.0>
+//         message: <a message that indicates what is happening during startup>
+//      }
+sg_event.create_event(sg_manager, "BOOTSTRAP_PROGRESS");
+
 // sent when the python side cannot determine a context for the current document
 sg_event.create_event(sg_manager, "UNKNOWN_CONTEXT");
 
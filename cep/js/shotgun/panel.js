@@ -46,6 +46,10 @@ sg_panel.Panel = new function() {
 
     var _previous_log_level = "debug";
 
+    // whether bootstrap progress has been received through the bootstrap
+    // channel, in which case log messages don't need to be searched for it
+    var _structured_progress = false;
+
     var _log_file_path = undefined;
 
     var _support_url = "https://www.autodesk.com/support";
@@ -234,9 +238,15 @@ sg_panel.Panel = new function() {
 
     // Request reload of the manager.
     //
+    // A full reload relaunches the manager and bootstraps python from
+    // scratch, which picks up changes made to the extension, framework and
+    // core code. Otherwise, the manager may just replace python with its
+    // standby process, which is quicker but runs the code that was current
+    // when the standby process was started.
+    //
     // After requesting manager reload, simply shuts down this extension
     // since the manager will restart it.
-    this.reload = function() {
+    this.reload = function(full) {
 
         sg_logging.debug("Closing the panel.");
 
@@ -244,7 +254,7 @@ sg_panel.Panel = new function() {
         _make_persistent(false);
 
         // request manager reload and close the panel
-        sg_panel.REQUEST_MANAGER_RELOAD.emit();
+        sg_panel.REQUEST_MANAGER_RELOAD.emit({full: Boolean(full)});
         _cs_interface.closeExtension();
     };
 
@@ -575,9 +585,9 @@ sg_panel.Panel = new function() {
                 this.open_external_url(debug_url);
                 break;
 
-            // reload extension
+            // reload extension, along with any changes made to the code
             case "sg_dev_reload":
-                this.reload();
+                this.reload(true);
                 break;
 
             // about the extension
@@ -755,8 +765,10 @@ sg_panel.Panel = new function() {
         // way to get access to them. For example, during toolkit
         // bootstrap, we can only gain access to progress via stdio pipe
         // maintained between js process and the spawned python process.
-        // So we intercept messages formatted to relay progress.
-        if (message.includes("PLUGIN_BOOTSTRAP_PROGRESS")) {
+        // So we intercept messages formatted to relay progress, unless the
+        // progress has been received through the bootstrap channel already.
+        if (!_structured_progress &&
+                message.includes("PLUGIN_BOOTSTRAP_PROGRESS")) {
 
             // It is possible that the message contains multiple
             // progress messages packaged together. Identify all of them
@@ -779,7 +791,13 @@ sg_panel.Panel = new function() {
                 _set_progress_info(msg_parts[1] * 100, msg_parts[3]);
             });
 
-            return;
+            // log messages written around the progress may have been read
+            // along with it. log whatever is left.
+            message = message.replace(multi_regex, "");
+
+            if (!message.trim()) {
+                return;
+            }
         }
 
         var log_source = from_python ? "py" : "js";
@@ -1000,6 +1018,14 @@ sg_panel.Panel = new function() {
         // Handle pyside not being installed
         sg_manager.PYSIDE_NOT_AVAILABLE.connect(_on_pyside_unavailable);
 
+        // Updates the progress bar with the python bootstrap progress
+        sg_manager.BOOTSTRAP_PROGRESS.connect(
+            function(event) {
+                _structured_progress = true;
+                _set_progress_info(event.data.progress * 100, event.data.message);
+            }
+        );
+
         // Updates the panel with the current commands from python
         sg_manager.UPDATE_COMMANDS.connect(
             function(event) {
@@ -31,29 +31,70 @@ sg_socket_io.emit = function(message_type, payload) {
 /*
 Emits a message that informs any listeners of a change in active document within
 the host application.
+
+:param active_document: An object describing the active document, with its
+    "path", "name" and "saved" state, or null if there is no active document.
 */
-sg_socket_io.rpc_active_document_changed = function(active_document_path) {
+sg_socket_io.rpc_active_document_changed = function(active_document) {
     sg_logging.debug("Emitting 'active_document_changed' message via socket.io.");
     var msg = {
-        active_document_path: active_document_path
+        active_document_path: (active_document && active_document.path) || "",
+        active_document: active_document
     };
     sg_socket_io.emit("active_document_changed", msg);
 };
 
+// The log records waiting to be emitted, and the timer that will emit them.
+sg_socket_io._log_records = [];
+sg_socket_io._log_timer = undefined;
+
+// Log records are emitted in batches, at most this many milliseconds after
+// they were logged, or as soon as this many records are waiting.
+sg_socket_io._log_flush_interval = 100;
+sg_socket_io._log_batch_size = 200;
+
+/*
+Emits the log records waiting to be emitted as a single "logging_batch"
+message from the currently open socket.io server. The payload is a list of
+objects with "level" and "message" properties, in the order they were logged.
+*/
+sg_socket_io.flush_log = function() {
+    if ( sg_socket_io._log_timer !== undefined ) {
+        clearTimeout(sg_socket_io._log_timer);
+        sg_socket_io._log_timer = undefined;
+    }
+
+    if ( !sg_socket_io._log_records.length ) {
+        return;
+    }
+
+    var records = sg_socket_io._log_records;
+    sg_socket_io._log_records = [];
+    sg_socket_io.emit("logging_batch", records);
+};
+
 /*
-Emits a "logging" message from the currently open socket.io server. The log
-message string and level are combined into a single payload object with "level"
-and "message" properties that is JSON encoded before emission.
+Queues a log message to be emitted from the currently open socket.io server
+with the next "logging_batch" message. The log message string and level are
+combined into a single record object with "level" and "message" properties.
 
 :param level: The severity level of the logging message.
 :param message: The logging message.
 */
 sg_socket_io.rpc_log = function(level, message) {
-    var msg = {
+    sg_socket_io._log_records.push({
         level: level,
         message: message
-    };
-    sg_socket_io.emit("logging", msg);
+    });
+
+    if ( sg_socket_io._log_records.length >= sg_socket_io._log_batch_size ) {
+        sg_socket_io.flush_log();
+    } else if ( sg_socket_io._log_timer === undefined ) {
+        sg_socket_io._log_timer = setTimeout(
+            sg_socket_io.flush_log,
+            sg_socket_io._log_flush_interval
+        );
+    }
 };
 
 /*
@@ -135,6 +176,13 @@ sg_socket_io.SocketManager = new function() {
         }
     };
 
+    /*
+    The beginning of the command used to invoke each prepared function, by
+    function name. These are built once per function rather than on every
+    invocation.
+    */
+    var _invoke_prefixes = {};
+
     /*
     Starts the socket.io server and defines the JSON-RPC interface that is made
     publicly available to clients.
@@ -176,14 +224,619 @@ sg_socket_io.SocketManager = new function() {
         sg_logging.debug("Sourcing rpc.js: " + cmd);
         csLib.evalScript(cmd);
 
+        /*
+        The jobs started by clients that haven't finished yet. Job ids are only
+        unique per client, so jobs are recorded by a key combining the id of
+        the client's socket and the job id.
+        */
+        var jobs = {};
+
+        /*
+        Emits a message to the given socket only, stringified as JSON.
+
+        :param socket: The socket to emit the message to.
+        :param message_type: The type of message to emit.
+        :param payload: The payload data to emit as a message.
+        */
+        var emit_to = function(socket, message_type, payload) {
+            socket.emit(message_type, JSON.stringify(payload));
+        };
+
+        /*
+        The queues of commands waiting to be evaluated, by priority class.
+        ExtendScript evaluates one command at a time, so rather than handing
+        every command to evalScript as it arrives, commands are queued here
+        and evaluated one after the other, highest priority first. This keeps
+        quick control and interactive commands from waiting behind queued
+        bulk work, such as a series of exports.
+        */
+        var lanes = {
+            control: [],
+            interactive: [],
+            bulk: []
+        };
+
+        /*
+        The priority classes, highest priority first.
+        */
+        const lane_order = ["control", "interactive", "bulk"];
+
+        /*
+        Whether a command is currently being evaluated by ExtendScript.
+        */
+        var evaluating = false;
+
+        /*
+        The results of cacheable commands, by cache scope and command. Clients
+        tag the reads whose results can be reused with a scope: "session" for
+        data that never changes while the host is running, like enumerators
+        and application metadata, and "document" for data read from documents.
+
+        Document results are only reused by a run of cached reads: they are
+        forgotten as soon as any other command is evaluated, when documents
+        are switched or saved, and once they are older than
+        document_cache_lifetime, which bounds how long edits made by the
+        user in the host go unnoticed.
+        */
+        var cache = {
+            session: new Map(),
+            document: new Map()
+        };
+
+        /*
+        The maximum number of results recorded in each cache scope. The oldest
+        results are dropped first.
+        */
+        const cache_size = 1000;
+
+        /*
+        The time, in milliseconds, after which a document result is not
+        reused anymore.
+        */
+        const document_cache_lifetime = 1000;
+
+        /*
+        The RPC methods whose results may be cached, if the client asks for it.
+        */
+        const cacheable_methods = [
+            "call",
+            "get",
+            "get_index",
+            "is_equal",
+            "query",
+            "snapshot",
+            "tree"
+        ];
+
+        /*
+        The RPC methods that never touch documents. Any other command that
+        isn't answered from the cache is assumed to modify documents, and
+        clears the document cache.
+        */
+        const document_neutral_methods = [
+            "get_global_scope",
+            "prepare"
+        ];
+
+        /*
+        Forgets the cached results of the given scope.
+
+        :param scope: The cache scope to clear.
+        */
+        var clear_cache = function(scope) {
+            if (cache[scope].size > 0) {
+                log_network_debug("Clearing the " + scope + " cache.");
+                cache[scope].clear();
+            }
+        };
+
+        /*
+        Builds the options used to evaluate the commands of an RPC method from
+        the options given by the client.
+
+        :param method_name: The name of the RPC method.
+        :param options: The options given by the client.
+        */
+        var execution_options = function(method_name, options) {
+            var cacheable = cacheable_methods.indexOf(method_name) !== -1;
+            var scope = cacheable ? options.cache : undefined;
+
+            if (cache[scope] === undefined) {
+                scope = undefined;
+            }
+
+            return {
+                priority: options.priority,
+                cache: scope,
+                mutating: (
+                    scope === undefined &&
+                    document_neutral_methods.indexOf(method_name) === -1
+                )
+            };
+        };
+
+        // Documents can change behind our back when the user switches to or
+        // saves another document.
+        [
+            "documentAfterActivate",
+            "documentAfterDeactivate",
+            "documentAfterSave"
+        ].forEach(function(event_type) {
+            csLib.addEventListener(event_type, function() {
+                clear_cache("document");
+            });
+        });
+
+        /*
+        Evaluates the next queued command, if no other command is currently
+        being evaluated.
+        */
+        var evaluate_next = function() {
+            if (evaluating) {
+                return;
+            }
+
+            var item = undefined;
+
+            for (var i = 0; i < lane_order.length; i++) {
+                if (lanes[lane_order[i]].length > 0) {
+                    item = lanes[lane_order[i]].shift();
+                    break;
+                }
+            }
+
+            if (item === undefined) {
+                return;
+            }
+
+            if (item.job !== undefined) {
+                emit_job_progress(item.job, 0.0);
+            }
+
+            evaluating = true;
+
+            csLib.evalScript(item.cmd, function(result) {
+                evaluating = false;
+
+                if (item.mutating) {
+                    clear_cache("document");
+                }
+                else if (item.cache !== undefined && result !== "EvalScript error.") {
+                    var results = cache[item.cache];
+
+                    if (results.size >= cache_size) {
+                        results.delete(results.keys().next().value);
+                    }
+                    results.set(item.cmd, {result: result, time: Date.now()});
+                }
+
+                item.callback(result);
+                evaluate_next();
+            });
+        };
+
+        /*
+        Removes the queued commands of the given job. Their callbacks are
+        called without a result, which reports the job as cancelled.
+
+        :param job_key: The key of the job to drop.
+        */
+        var drop_queued_job = function(job_key) {
+            lane_order.forEach(function(name) {
+                lanes[name] = lanes[name].filter(function(item) {
+                    if (item.job === job_key) {
+                        item.callback(undefined);
+                        return false;
+                    }
+                    return true;
+                });
+            });
+        };
+
+        /*
+        Queues the given command for evaluation in ExtendScript.
+
+        :param cmd: The ExtendScript command to evaluate.
+        :param callback: The callback to call with the result of the evaluation.
+        :param options: The optional execution options of the command. The
+            priority class of the command is given by options.priority, and
+            defaults to "interactive". If options.cache names a cache scope,
+            the cached result of the same command is used when there is one.
+            Commands flagged by options.mutating clear the document cache. If
+            the command is run as part of a job, options.job holds the key of
+            the job, which is made available to ExtendScript as __CURRENT_JOB
+            while the command is evaluated.
+        */
+        var evaluate = function(cmd, callback, options) {
+            options = options || {};
+
+            if (options.job !== undefined) {
+                // the job is forgotten once the command is done, so that
+                // later commands don't report progress under its name. the
+                // try statement evaluates to the result of the command.
+                cmd = (
+                    "try { __CURRENT_JOB = " + JSON.stringify(options.job) + "; " +
+                    cmd + "\n} finally { __CURRENT_JOB = undefined; }"
+                );
+            }
+            else if (options.cache !== undefined && cache[options.cache].has(cmd)) {
+                var entry = cache[options.cache].get(cmd);
+
+                if (
+                    options.cache !== "document" ||
+                    Date.now() - entry.time < document_cache_lifetime
+                ) {
+                    log_network_debug("Cached: " + cmd);
+                    setImmediate(callback, entry.result);
+                    return;
+                }
+
+                cache[options.cache].delete(cmd);
+            }
+
+            var lane = lanes[options.priority];
+
+            if (lane === undefined) {
+                lane = lanes.interactive;
+            }
+
+            lane.push({
+                cmd: cmd,
+                callback: callback,
+                job: options.job,
+                cache: options.job === undefined ? options.cache : undefined,
+                mutating: options.mutating
+            });
+
+            log_network_debug(
+                "Queued commands: " + lane_order.map(function(name) {
+                    return name + "=" + lanes[name].length;
+                }).join(", ")
+            );
+
+            evaluate_next();
+        };
+
+        /*
+        Emits a "job_progress" message for the given job to the client that
+        started it.
+
+        :param job_key: The key of the job.
+        :param progress: The progress value, from 0.0 to 1.0.
+        :param message: An optional message describing the current step.
+        */
+        var emit_job_progress = function(job_key, progress, message) {
+            var job = jobs[job_key];
+
+            if (job === undefined || job.cancelled) {
+                return;
+            }
+
+            emit_to(job.socket, "job_progress", {
+                job_id: job.id,
+                progress: progress,
+                message: message
+            });
+        };
+
+        // Progress reports are dispatched by rpc_report_progress in
+        // ExtendScript while a job is running.
+        csLib.addEventListener("com.sg.basic.adobe.job_progress", function(event) {
+            var data = event.data;
+
+            if (typeof data === "string") {
+                data = JSON.parse(data);
+            }
+
+            emit_job_progress(data.job_id, data.progress, data.message);
+        });
+
+        /*
+        The sockets of the clients subscribed to each host event, by event
+        name. Events are either standard CEP events, like documentAfterSave,
+        or Photoshop events, named "photoshop:" followed by the string id of
+        the event, like "photoshop:make".
+        */
+        var subscriptions = {};
+
+        /*
+        The listeners registered with the host for the subscribed events, by
+        event name. Photoshop events are recorded by their type id, or null
+        while their type id is being looked up.
+        */
+        var host_listeners = {};
+
+        /*
+        The names of the Photoshop events registered for notification, by
+        type id.
+        */
+        var photoshop_events = {};
+
+        const photoshop_prefix = "photoshop:";
+
+        /*
+        The delay, in milliseconds, during which host events are collected
+        before being pushed to clients. Identical events received during that
+        time are coalesced into one.
+        */
+        const host_event_delay = 50;
+
+        /*
+        The host events waiting to be pushed, by socket id.
+        */
+        var pending_host_events = {};
+
+        /*
+        Pushes the pending host events of the given client.
+
+        :param socket_id: The id of the client's socket.
+        */
+        var flush_host_events = function(socket_id) {
+            var pending = pending_host_events[socket_id];
+            delete pending_host_events[socket_id];
+
+            if (pending.socket.connected) {
+                emit_to(pending.socket, "host_events", pending.events.map(
+                    function(event) {
+                        return {
+                            event: event.event,
+                            data: event.data,
+                            count: event.count
+                        };
+                    }
+                ));
+            }
+        };
+
+        /*
+        Queues a host event for the clients subscribed to it.
+
+        :param event_name: The name of the event.
+        :param data: The data sent with the event.
+        */
+        var queue_host_event = function(event_name, data) {
+            var key = JSON.stringify(data);
+
+            (subscriptions[event_name] || []).forEach(function(socket) {
+                var pending = pending_host_events[socket.id];
+
+                if (pending === undefined) {
+                    pending = {socket: socket, events: []};
+                    pending_host_events[socket.id] = pending;
+                    setTimeout(flush_host_events, host_event_delay, socket.id);
+                }
+
+                var previous = pending.events.find(function(event) {
+                    return event.event === event_name && event.key === key;
+                });
+
+                if (previous !== undefined) {
+                    previous.count += 1;
+                }
+                else {
+                    pending.events.push({
+                        event: event_name,
+                        data: data,
+                        count: 1,
+                        key: key
+                    });
+                }
+            });
+        };
+
+        /*
+        Asks Photoshop to start or stop notifying the extension of the event of
+        the given type id.
+
+        :param event_type: Either "com.adobe.PhotoshopRegisterEvent" or
+            "com.adobe.PhotoshopUnRegisterEvent".
+        :param type_id: The type id of the event.
+        */
+        var dispatch_photoshop_registration = function(event_type, type_id) {
+            var event = new CSEvent(event_type, "APPLICATION");
+            event.extensionId = csLib.getExtensionID();
+            event.data = String(type_id);
+            csLib.dispatchEvent(event);
+        };
+
+        /*
+        Starts listening to the given host event.
+
+        :param event_name: The name of the event.
+        */
+        var add_host_listener = function(event_name) {
+            if (!event_name.startsWith(photoshop_prefix)) {
+                var listener = function(event) {
+                    queue_host_event(event_name, event.data);
+                };
+                csLib.addEventListener(event_name, listener);
+                host_listeners[event_name] = listener;
+                return;
+            }
+
+            // Photoshop events are registered by type id, which needs to be
+            // looked up first.
+            var string_id = event_name.substr(photoshop_prefix.length);
+            host_listeners[event_name] = null;
+
+            evaluate(
+                "stringIDToTypeID(" + JSON.stringify(string_id) + ")",
+                function(result) {
+                    if (result === "EvalScript error.") {
+                        sg_logging.warn("Unable to listen to host event " + event_name);
+                        delete host_listeners[event_name];
+                        return;
+                    }
+
+                    // Nobody is interested anymore.
+                    if (host_listeners[event_name] !== null) {
+                        return;
+                    }
+
+                    host_listeners[event_name] = result;
+                    photoshop_events[result] = event_name;
+                    dispatch_photoshop_registration(
+                        "com.adobe.PhotoshopRegisterEvent", result
+                    );
+                },
+                {priority: "control"}
+            );
+        };
+
+        /*
+        Stops listening to the given host event.
+
+        :param event_name: The name of the event.
+        */
+        var remove_host_listener = function(event_name) {
+            var listener = host_listeners[event_name];
+            delete host_listeners[event_name];
+
+            if (!event_name.startsWith(photoshop_prefix)) {
+                csLib.removeEventListener(event_name, listener);
+            }
+            else if (listener !== null && listener !== undefined) {
+                delete photoshop_events[listener];
+                dispatch_photoshop_registration(
+                    "com.adobe.PhotoshopUnRegisterEvent", listener
+                );
+            }
+        };
+
+        /*
+        Subscribes the given client to the given host event.
+
+        :param socket: The socket of the client.
+        :param event_name: The name of the event.
+        */
+        var subscribe = function(socket, event_name) {
+            var sockets = subscriptions[event_name] || [];
+
+            if (sockets.indexOf(socket) !== -1) {
+                return;
+            }
+
+            sockets.push(socket);
+            subscriptions[event_name] = sockets;
+
+            if (sockets.length === 1) {
+                add_host_listener(event_name);
+            }
+        };
+
+        /*
+        Unsubscribes the given client from the given host event.
+
+        :param socket: The socket of the client.
+        :param event_name: The name of the event.
+        */
+        var unsubscribe = function(socket, event_name) {
+            var sockets = subscriptions[event_name] || [];
+            var index = sockets.indexOf(socket);
+
+            if (index === -1) {
+                return;
+            }
+
+            sockets.splice(index, 1);
+
+            if (sockets.length === 0) {
+                delete subscriptions[event_name];
+                remove_host_listener(event_name);
+            }
+        };
+
+        // Photoshop notifies the extension of the events it registered for
+        // through a single event type, with data of the form
+        // "ver1,{eventID: type_id, eventData: {...}}".
+        csLib.addEventListener(
+            "com.adobe.PhotoshopJSONCallback" + csLib.getExtensionID(),
+            function(event) {
+                var data = event.data;
+
+                if (typeof data === "string") {
+                    data = JSON.parse(data.substring(data.indexOf(",") + 1));
+                }
+
+                var event_name = photoshop_events[data.eventID];
+
+                if (event_name !== undefined) {
+                    queue_host_event(event_name, data.eventData);
+                }
+            }
+        );
+
         sg_logging.info("Establishing jrpc interface.");
 
         /*
         The object that defines the JSON-RPC interface exposed by the socket.io
         server. Each method on this object becomes a callable method over the
-        socket.io connection.
+        socket.io connection. Methods also accept optional execution options,
+        which are passed on to evaluate() when a method is called internally,
+        such as when it is run as part of a job.
+
+        :param socket: The socket of the client the interface is exposed to.
         */
-        function RPCInterface() {
+        function RPCInterface(socket) {
+
+            var self = this;
+
+            /*
+            Starts running an RPC command as a job. The call returns as soon as
+            the job has been started, and the completion of the command is
+            later reported with a "job_finished" message. Progress is reported
+            with "job_progress" messages.
+
+            :param params: The list of parameters associated with the rpc call.
+                [{job_id: job_id, method: method_name, params: method_params}]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.job_start = function(params, next) {
+                var job_options = params.shift();
+                var job_id = job_options.job_id;
+                var method = self[job_options.method];
+
+                if (method === undefined || job_options.method.startsWith("job_")) {
+                    next(true, "Unknown job method: " + job_options.method);
+                    return;
+                }
+
+                var job_key = socket.id + "/" + job_id;
+
+                jobs[job_key] = {
+                    id: job_id,
+                    socket: socket,
+                    cancelled: false
+                };
+                next(false, JSON.stringify(job_id));
+
+                method(job_options.params, function(error, result) {
+                    var job = jobs[job_key];
+                    var msg = {job_id: job_id};
+
+                    delete jobs[job_key];
+
+                    if (job.cancelled) {
+                        msg.state = "cancelled";
+                    }
+                    else if (error) {
+                        msg.state = "failed";
+                        msg.error = result;
+                    }
+                    else {
+                        msg.state = "done";
+                        msg.result = result;
+                    }
+
+                    log_network_debug("Job " + job_key + " " + msg.state + ".");
+                    emit_to(socket, "job_finished", msg);
+                }, Object.assign(
+                    execution_options(job_options.method, {}),
+                    {job: job_key, priority: job_options.priority || "bulk"}
+                ));
+            };
 
             /*
             Maps the global scope of ExtendScript and returns a list of wrapper
@@ -195,10 +848,10 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the next RPC call queued
                  up to be processed.
             */
-            this.get_global_scope = function(params, next) {
+            this.get_global_scope = function(params, next, options) {
                 const cmd = "map_global_scope()";
                 log_network_debug(cmd);
-                csLib.evalScript(cmd, _eval_callback.bind(this, next));
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
             /*
@@ -211,11 +864,56 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the next RPC call queued
                 up to be processed.
             */
-            this.eval = function(params, next) {
+            this.eval = function(params, next, options) {
                 log_network_debug(params[0]);
-                csLib.evalScript(params[0], function(result) {
+                evaluate(params[0], function(result) {
                     next(false, result);
-                });
+                }, options);
+            };
+
+            /*
+            Defines a named function in ExtendScript that can then be called
+            using invoke without its source being sent and parsed again.
+
+            :param params: The list of parameters associated with the rpc call.
+                [function_name, function_source]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.prepare = function(params, next, options) {
+                var name = params.shift();
+                var source = params.shift();
+                var args = [JSON.stringify(name), JSON.stringify(source)].join();
+                var cmd = "rpc_prepare(" + args + ")";
+                log_network_debug(cmd);
+
+                _invoke_prefixes[name] = "rpc_invoke(" + JSON.stringify(name) + ",";
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
+            };
+
+            /*
+            Calls a function previously defined using prepare.
+
+            :param params: The list of parameters associated with the rpc call.
+                [{name: function_name, args: [arg_1, ...]}]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.invoke = function(params, next, options) {
+                var rpc_options = params.shift();
+                var prefix = _invoke_prefixes[rpc_options.name];
+
+                if (prefix === undefined) {
+                    prefix = "rpc_invoke(" + JSON.stringify(rpc_options.name) + ",";
+                }
+
+                var cmd = prefix + JSON.stringify(rpc_options.args) + ")";
+                log_network_debug(cmd);
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
             /*
@@ -229,16 +927,13 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the next RPC call queued
                 up to be processed.
             */
-            this.new = function(params, next) {
+            this.new = function(params, next, options) {
                 var class_name = JSON.stringify(params.shift());
                 var param_str = JSON.stringify(params);
                 var cmd = "rpc_new(" + class_name + ", " + param_str + ")";
                 log_network_debug(cmd);
 
-                csLib.evalScript(
-                    cmd,
-                    _eval_callback.bind(this, next)
-                );
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
             /*
@@ -250,17 +945,73 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the next RPC call queued
                 up to be processed.
             */
-            this.get = function(params, next) {
+            this.get = function(params, next, options) {
                 var base = JSON.parse(params.shift());
                 var property = params.shift();
                 var args = [base.__uniqueid, JSON.stringify(property)].join();
                 var cmd = "rpc_get(" + args + ")";
                 log_network_debug(cmd);
 
-                csLib.evalScript(
-                    cmd,
-                    _eval_callback.bind(this, next)
-                );
+                evaluate(cmd, _eval_callback.bind(this, next), options);
+            };
+
+            /*
+            Gets the values of several properties of the given object in a
+            single evaluation.
+
+            :param params: The list of parameters associated with the rpc call.
+                [object, property_name_1, ...]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.snapshot = function(params, next, options) {
+                var base = JSON.parse(params.shift());
+                var args = [base.__uniqueid, JSON.stringify(params)].join();
+                var cmd = "rpc_snapshot(" + args + ")";
+                log_network_debug(cmd);
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
+            };
+
+            /*
+            Serializes the tree of objects found under a child collection of
+            the given object in a single evaluation.
+
+            :param params: The list of parameters associated with the rpc call.
+                [object, options]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.tree = function(params, next, options) {
+                var base = JSON.parse(params.shift());
+                var rpc_options = params.shift();
+                var args = [base.__uniqueid, JSON.stringify(rpc_options)].join();
+                var cmd = "rpc_tree(" + args + ")";
+                log_network_debug(cmd);
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
+            };
+
+            /*
+            Searches the given collection for the items matching a set of
+            conditions in a single evaluation.
+
+            :param params: The list of parameters associated with the rpc call.
+                [collection, options]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.query = function(params, next, options) {
+                var base = JSON.parse(params.shift());
+                var rpc_options = params.shift();
+                var args = [base.__uniqueid, JSON.stringify(rpc_options)].join();
+                var cmd = "rpc_query(" + args + ")";
+                log_network_debug(cmd);
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
             /*
@@ -273,17 +1024,14 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the next RPC call queued
                 up to be processed.
             */
-            this.get_index = function(params, next) {
+            this.get_index = function(params, next, options) {
                 var base = JSON.parse(params.shift());
                 var index = JSON.stringify(params.shift());
                 var args = [base.__uniqueid, index].join();
                 var cmd = "rpc_get_index(" + args + ")";
                 log_network_debug(cmd);
 
-                csLib.evalScript(
-                    cmd,
-                    _eval_callback.bind(this, next)
-                );
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
             /*
@@ -299,7 +1047,7 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the next RPC call queued
                 up to be processed.
             */
-            this.is_equal = function(params, next) {
+            this.is_equal = function(params, next, options) {
                 var left = params.shift();
                 var right = params.shift();
 
@@ -315,10 +1063,7 @@ sg_socket_io.SocketManager = new function() {
 
                 var cmd = left_value + " == " + right_value;
                 log_network_debug(cmd);
-                csLib.evalScript(
-                    cmd,
-                    _eval_callback.bind(this, next)
-                );
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
             /*
@@ -330,7 +1075,7 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the
                 next RPC call queued up to be processed.
             */
-            this.set = function(params, next) {
+            this.set = function(params, next, options) {
                 var base = JSON.parse(params.shift());
                 var property = params.shift();
                 var value = params.shift();
@@ -343,10 +1088,60 @@ sg_socket_io.SocketManager = new function() {
                 var cmd = "rpc_set(" + args + ")";
                 log_network_debug(cmd);
 
-                csLib.evalScript(
-                    cmd,
-                    _eval_callback.bind(this, next)
-                );
+                evaluate(cmd, _eval_callback.bind(this, next), options);
+            };
+
+            /*
+            Sets the value of the given property on many objects in a single
+            evaluation.
+
+            :param params: The list of parameters associated with the rpc call.
+                [options]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.set_many = function(params, next, options) {
+                var rpc_options = params.shift();
+                var cmd = "rpc_set_many(" + JSON.stringify(rpc_options) + ")";
+                log_network_debug(cmd);
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
+            };
+
+            /*
+            Calls the given method on many objects in a single evaluation.
+
+            :param params: The list of parameters associated with the rpc call.
+                [options]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.call_many = function(params, next, options) {
+                var rpc_options = params.shift();
+                var cmd = "rpc_call_many(" + JSON.stringify(rpc_options) + ")";
+                log_network_debug(cmd);
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
+            };
+
+            /*
+            Runs a list of recorded operations in a single evaluation, grouped
+            in a single history state when the host supports it.
+
+            :param params: The list of parameters associated with the rpc call.
+                [options]
+            :param next: The handle to the "next" callback that triggers the
+                return of data to the caller and causes the next RPC call queued
+                up to be processed.
+            */
+            this.transaction = function(params, next, options) {
+                var rpc_options = params.shift();
+                var cmd = "rpc_transaction(" + JSON.stringify(rpc_options) + ")";
+                log_network_debug(cmd);
+
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
             /*
@@ -358,7 +1153,7 @@ sg_socket_io.SocketManager = new function() {
                 return of data to the caller and causes the next RPC call queued
                 up to be processed.
             */
-            this.call = function(params, next) {
+            this.call = function(params, next, options) {
                 var base = JSON.parse(params.shift());
                 // The parent object of the method being called. Since we
                 // need to know what the method is bound to in order to
@@ -380,15 +1175,25 @@ sg_socket_io.SocketManager = new function() {
                 var cmd = "rpc_call(" + args + ")";
                 log_network_debug(cmd);
 
-                csLib.evalScript(
-                    cmd,
-                    _eval_callback.bind(this, next)
-                );
+                evaluate(cmd, _eval_callback.bind(this, next), options);
             };
 
         }
 
         // Stops the socket server.
+        /*
+        Queues the given command for evaluation in ExtendScript, in turn with
+        the commands of clients. This is used by the manager for its own
+        queries of the host, which must not interleave with client commands.
+
+        :param cmd: The ExtendScript command to evaluate.
+        :param callback: The callback to call with the result of the evaluation.
+        :param priority: The priority class of the command.
+        */
+        this.evaluate = function(cmd, callback, priority) {
+            evaluate(cmd, callback, {priority: priority});
+        };
+
         this.stop_socket_server = function() {
             sg_logging.debug("Shutting down socket server.");
             io.close();
@@ -396,27 +1201,112 @@ sg_socket_io.SocketManager = new function() {
 
         sg_logging.info("Setting up connection handling...");
 
-        const remote = new jrpc();
-        remote.expose(new RPCInterface());
+        /*
+        Creates the JSON-RPC endpoint serving the given client socket. Each
+        client gets its own endpoint, so that responses are only sent back to
+        the client that made the request, and request ids only need to be
+        unique per client.
 
-        remote.setTransmitter(function(message, next) {
-            try {
-                io.emit("return", message);
-                return next(false);
-            } catch (e) {
-                return next(true);
-            }
-        });
+        :param socket: The socket of the client to serve.
+        */
+        var create_remote = function(socket) {
+            const remote = new jrpc();
+            const rpc_interface = new RPCInterface(socket);
+
+            // Requests that carry execution options have them moved into
+            // their params by the "execute_command" handler, so each method
+            // is exposed through a function that unpacks them again.
+            Object.keys(rpc_interface).forEach(function(name) {
+                remote.expose(name, function(params, next) {
+                    if (Array.isArray(params)) {
+                        rpc_interface[name](
+                            params, next, execution_options(name, {})
+                        );
+                    }
+                    else {
+                        rpc_interface[name](
+                            params.params, next, execution_options(name, params.options)
+                        );
+                    }
+                });
+            });
+
+            remote.setTransmitter(function(message, next) {
+                try {
+                    socket.emit("return", message);
+                    return next(false);
+                } catch (e) {
+                    return next(true);
+                }
+            });
+
+            return remote;
+        };
 
         // Define the root namespace interface. This will receive all
         // commands for interacting with ExtendScript.
         io.on("connection", function(socket) {
             sg_logging.info("Connection received!");
 
+            const remote = create_remote(socket);
+
+            socket.on("disconnect", function() {
+                // Nobody is left to receive the results of the client's jobs.
+                Object.keys(jobs).forEach(function(job_key) {
+                    if (jobs[job_key].socket === socket) {
+                        jobs[job_key].cancelled = true;
+                        drop_queued_job(job_key);
+                    }
+                });
+                Object.keys(subscriptions).forEach(function(event_name) {
+                    unsubscribe(socket, event_name);
+                });
+                remote.shutdown();
+            });
+
+            socket.on("subscribe", function(json_event_name) {
+                // The client wants to be notified of a host event.
+                var event_name = JSON.parse(json_event_name);
+                sg_logging.debug("Subscribing client to host event: " + event_name);
+                subscribe(socket, event_name);
+            });
+
+            socket.on("unsubscribe", function(json_event_name) {
+                // The client no longer wants to be notified of a host event.
+                var event_name = JSON.parse(json_event_name);
+                sg_logging.debug("Unsubscribing client from host event: " + event_name);
+                unsubscribe(socket, event_name);
+            });
+
             socket.on("execute_command", function(message) {
+                // JSON-RPC methods only receive the params of a request, so
+                // the execution options of the request, such as its priority,
+                // are passed along with them.
+                if (typeof message === "object" && message.options !== undefined) {
+                    message.params = {
+                        params: message.params || [],
+                        options: message.options
+                    };
+                    delete message.options;
+                }
                 remote.receive(message);
             });
 
+            socket.on("cancel_job", function(json_job_id) {
+                // The client no longer wants the result of a job. Jobs still
+                // queued are dropped without being evaluated. ExtendScript
+                // can't be interrupted, so a job already being evaluated is
+                // only flagged, and reported as cancelled once it's complete.
+                var job_key = socket.id + "/" + JSON.parse(json_job_id);
+                var job = jobs[job_key];
+                sg_logging.debug("Cancelling job from client: " + json_job_id);
+
+                if (job !== undefined) {
+                    job.cancelled = true;
+                    drop_queued_job(job_key);
+                }
+            });
+
             socket.on("set_commands", function(json_commands) {
                 // The client is setting the commands
                 var commands = JSON.parse(json_commands);
@@ -468,6 +1358,39 @@ sg_socket_io.SocketManager = new function() {
                 var log_data = JSON.parse(json_log_data);
                 sg_logging._log(log_data.level, log_data.msg, false)
             });
+
+            socket.on("log_messages", function(json_log_records) {
+                // log a batch of messages from python. consecutive messages
+                // of the same level are logged together, which keeps the
+                // number of events sent to the panel down.
+                var log_records = JSON.parse(json_log_records);
+                var level = undefined;
+                var lines = [];
+
+                var log_lines = function() {
+                    if (lines.length) {
+                        sg_logging._log(level, lines.join("\n"), false);
+                    }
+                    lines = [];
+                };
+
+                log_records.forEach(function(log_record) {
+                    if (log_record.level !== level) {
+                        log_lines();
+                        level = log_record.level;
+                    }
+
+                    var msg = log_record.msg;
+
+                    if (log_record.count > 1) {
+                        msg += " (repeated " + log_record.count + " times)";
+                    }
+
+                    lines.push(msg);
+                });
+
+                log_lines();
+            });
         });
     };
 };
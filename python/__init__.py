@@ -1,4 +1,5 @@
 import sys
+import importlib
 
 try:
     from . import tk_framework_adobe
@@ -7,10 +8,44 @@ except ImportError:
     pass
 
 
-from .tk_framework_adobe import adobe_bridge
+# The modules below pull in Qt, the socket.io client and its dependencies, so
+# they are only imported when first accessed, by their relative import path.
+_LAZY_MODULES = {
+    "adobe_bridge": ".tk_framework_adobe.adobe_bridge",
+    "document_registry": ".tk_framework_adobe.document_registry",
+    "win_32_api": ".tk_framework_adobe_utils.win_32_api",
+}
 
-from sgtk import util
 
+def _is_lazy_module(name):
+    """
+    Whether the given name is a lazily imported module available on the
+    current platform.
 
-if util.is_windows():
-    from .tk_framework_adobe_utils import win_32_api
+    :param str name: The name of the attribute.
+    """
+    if name == "win_32_api":
+        return sys.platform == "win32"
+
+    return name in _LAZY_MODULES
+
+
+def __getattr__(name):
+    """
+    Imports the lazily imported modules on first access.
+
+    :param str name: The name of the attribute accessed.
+    """
+    if not _is_lazy_module(name):
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    module = importlib.import_module(_LAZY_MODULES[name], __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    """
+    Lists the module's attributes, including the lazily imported modules.
+    """
+    return sorted(set(globals()) | set(filter(_is_lazy_module, _LAZY_MODULES)))
@@ -9,4 +9,4 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 from .classic_init import toolkit_classic_bootstrap
-from .plugin_init import toolkit_plugin_bootstrap
+from .plugin_init import toolkit_plugin_bootstrap, toolkit_plugin_preload
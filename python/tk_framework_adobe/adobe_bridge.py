@@ -10,6 +10,7 @@
 import os
 import functools
 import threading
+import time
 import json
 
 from .rpc import Communicator
@@ -61,6 +62,9 @@ class MessageEmitter(QtCore.QObject):
     :signal logging_received(str, str): Fires when a logging call has been
         received. The first string is the logging level (debug, info, warning,
         or error) and the second string is the message.
+    :signal logging_received_batch(list): Fires when a batch of logging calls
+        has been received. The list holds (level, message) tuples, in the
+        order the logging calls were made.
     :signal command_received(int): Fires when an engine command has been
         received. The integer value is the unique id of the engine command
         that was requested to be executed.
@@ -71,13 +75,21 @@ class MessageEmitter(QtCore.QObject):
     :signal active_document_changed(str): Fires when alerted to a change in active
         document by the RPC server. The string value is the path to the new
         active document, or an empty string if the active document is unsaved.
+    :signal host_event_received(str, object): Fires when a host event that was
+        subscribed to has been received. The string is the name of the event,
+        and the object is the data sent with the event.
+    :signal reconnected: Fires when the connection to the RPC server has been
+        restored after being lost. Host events may have been missed.
     """
 
     logging_received = QtCore.Signal(str, str)
+    logging_received_batch = QtCore.Signal(object)
     command_received = QtCore.Signal(int)
     run_tests_request_received = QtCore.Signal()
     state_requested = QtCore.Signal()
     active_document_changed = QtCore.Signal(str)
+    host_event_received = QtCore.Signal(str, object)
+    reconnected = QtCore.Signal()
 
 
 class AdobeBridge(Communicator):
@@ -102,6 +114,20 @@ class AdobeBridge(Communicator):
         ),
     )
 
+    # The layer properties recorded by default by get_layer_tree().
+    LAYER_TREE_FIELDS = ["name", "visible", "kind", "typename"]
+
+    # Log messages are sent to the server in batches: a batch is sent once
+    # it holds LOG_BATCH_SIZE records, or once its oldest record has waited
+    # for LOG_FLUSH_INTERVAL seconds. No batch is sent while waiting for an
+    # RPC response, and if more than LOG_BUFFER_LIMIT records pile up in the
+    # meantime, the oldest ones are dropped. Records of the LOG_URGENT_LEVELS
+    # are sent right away, along with the records buffered before them.
+    LOG_BATCH_SIZE = 50
+    LOG_FLUSH_INTERVAL = 0.25
+    LOG_BUFFER_LIMIT = 1000
+    LOG_URGENT_LEVELS = ("error", "critical")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -115,12 +141,56 @@ class AdobeBridge(Communicator):
             "is %s" % self.SHOTGUN_ADOBE_HEARTBEAT_TIMEOUT
         )
 
+        # A local mirror of the state of the active document, fed by the
+        # active_document_changed messages pushed by the server, and the
+        # property cache epoch it was recorded at. Commands that may change
+        # the state of the host bump the epoch, which makes the mirror stale.
+        self._active_document = None
+        self._active_document_epoch = None
+
+        # The active document path last forwarded with the
+        # active_document_changed signal.
+        self._active_document_path = None
+
+        # The callbacks registered for each host event subscribed to.
+        self._subscriptions = dict()
+
+        # The log records waiting to be sent, when the oldest of them was
+        # recorded, and how many records were dropped since the last batch.
+        self._log_lock = threading.RLock()
+        self._log_records = []
+        self._log_buffered_since = None
+        self._log_dropped = 0
+
+        # Sends the buffered records once they have waited long enough, when
+        # nothing else does. The timer lives in the thread the bridge was
+        # created in, which runs the Qt event loop.
+        self._log_timer = QtCore.QTimer()
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(int(self.LOG_FLUSH_INTERVAL * 1000))
+        self._log_timer.timeout.connect(self.__flush_log_timer)
+
+        # The number of RPC responses being waited for. Log batches are held
+        # back until they have all arrived.
+        self._awaiting_responses = 0
+
+        # Whether the logging_received signal is emitted for each of the
+        # logging calls received in batches, or None to only do so while
+        # nothing is connected to the logging_received_batch signal.
+        self._emit_logging_per_record = None
+
+        # The JSON encoded panel state last sent, by message name, so that an
+        # engine reusing the bridge only sends the state that changed.
+        self._panel_state = dict()
+
         self._emitter = MessageEmitter()
         self._io.on("logging", self._forward_logging)
+        self._io.on("logging_batch", self._forward_logging_batch)
         self._io.on("command", self._forward_command)
         self._io.on("run_tests", self._forward_run_tests)
         self._io.on("state_requested", self._forward_state_request)
         self._io.on("active_document_changed", self._forward_active_document_changed)
+        self._io.on("host_events", self._forward_host_events)
 
     ##########################################################################################
     # properties
@@ -133,6 +203,14 @@ class AdobeBridge(Communicator):
         """
         return self._emitter.active_document_changed
 
+    @property
+    def host_event_received(self):
+        """
+        The signal that is emitted when a host event that was subscribed to
+        arrives via RPC.
+        """
+        return self._emitter.host_event_received
+
     @property
     def logging_received(self):
         """
@@ -141,6 +219,31 @@ class AdobeBridge(Communicator):
         """
         return self._emitter.logging_received
 
+    @property
+    def logging_received_batch(self):
+        """
+        The signal that is emitted when a batch of logging messages has
+        arrived via RPC.
+        """
+        return self._emitter.logging_received_batch
+
+    @property
+    def emit_logging_per_record(self):
+        """
+        Whether the logging_received signal is emitted for each logging
+        message of the batches received, in addition to the
+        logging_received_batch signal. The default, None, only emits it while
+        nothing is connected to the batch signal, so that clients still
+        connected to logging_received only are not left without logs, and
+        clients connected to the batch signal don't handle every message
+        twice.
+        """
+        return self._emit_logging_per_record
+
+    @emit_logging_per_record.setter
+    def emit_logging_per_record(self, state):
+        self._emit_logging_per_record = None if state is None else bool(state)
+
     @property
     def command_received(self):
         """
@@ -149,6 +252,14 @@ class AdobeBridge(Communicator):
         """
         return self._emitter.command_received
 
+    @property
+    def reconnected(self):
+        """
+        The signal that is emitted when the connection to the RPC server has
+        been restored.
+        """
+        return self._emitter.reconnected
+
     @property
     def run_tests_request_received(self):
         """
@@ -181,7 +292,7 @@ class AdobeBridge(Communicator):
 
         :returns: The active document, or None.
         """
-        with self.response_logging_silenced():
+        with self.response_logging_silenced(), self.rpc_priority(self.PRIORITY_CONTROL):
             try:
                 doc = self.app.activeDocument
             except Exception:
@@ -199,35 +310,235 @@ class AdobeBridge(Communicator):
         :returns: The active document's file path on disk as a str, or
                   None if the document has never been saved.
         """
+        state = self.get_active_document_state()
+
+        if not state:
+            return None
+
+        return state["path"]
+
+    def get_active_document_state(self):
+        """
+        Describes the currently-active document. The state pushed by the
+        server whenever the active document changes or is saved is used
+        when it is known to be current, which is the case unless a command
+        that may have changed the state of the host has been sent since.
+        Otherwise, the state is looked up in the host and recorded.
+
+        Note that edits made by the user in the host application don't
+        update the saved state until the next change of active document.
+
+        :returns: A dictionary with the "path" of the document, or None if
+                  it has never been saved, its "name", and whether it is
+                  "saved", or None if there is no active document or it
+                  can't be described.
+        :rtype: dict
+        """
+        if self._active_document_epoch == self._property_cache_epoch:
+            return dict(self._active_document) if self._active_document else None
+
+        epoch = self._property_cache_epoch
         doc = self.get_active_document()
 
         if not doc:
-            return None
+            state = None
+        else:
+            with self.response_logging_silenced(), self.rpc_priority(
+                self.PRIORITY_CONTROL
+            ):
+                try:
+                    snapshot = self.rpc_snapshot(
+                        doc, ["name", "saved", "fullName.fsName"]
+                    )
+                except Exception:
+                    # the document may have been closed in the meantime.
+                    # don't record anything, the state is unknown.
+                    self.logger.debug("Unable to describe the active document.")
+                    return None
+
+            state = dict(
+                path=snapshot.get("fullName.fsName"),
+                name=snapshot.get("name"),
+                saved=snapshot.get("saved"),
+            )
+
+        # A newer state may have been pushed while we were waiting.
+        if epoch == self._property_cache_epoch:
+            self.__record_active_document(state)
+
+        return dict(state) if state else None
+
+    def get_layer_tree(self, doc, fields=None, max_depth=None, include_handles=False):
+        """
+        Gets the layer hierarchy of the given document in a single round
+        trip. Each layer is returned as a dictionary holding the requested
+        fields as plain data, with a "children" list for layer sets.
+
+        ..Example:
+            [
+                {
+                    "name": "Group 1",
+                    "visible": True,
+                    "typename": "LayerSet",
+                    "children": [
+                        {
+                            "name": "Title",
+                            "visible": True,
+                            "kind": "LayerKind.TEXT",
+                            "typename": "ArtLayer",
+                        },
+                    ],
+                },
+            ]
+
+        :param doc: The document to get the layer tree of.
+        :param list fields: The layer properties to get. Defaults to
+                            LAYER_TREE_FIELDS.
+        :param int max_depth: The number of levels of nested layers to get.
+                              If not given, the whole tree is returned.
+        :param bool include_handles: Whether to include a proxy object for
+                                     each layer under the "handle" key.
+
+        :returns: The list of top-level layer nodes.
+        :rtype: list
+        """
+        return self.rpc_get_tree(
+            doc,
+            "layers",
+            fields or self.LAYER_TREE_FIELDS,
+            max_depth=max_depth,
+            include_handles=include_handles,
+        )
 
-        with self.response_logging_silenced():
-            try:
-                path = doc.fullName.fsName
-            except Exception:
-                path = None
+    def detach(self):
+        """
+        Releases the bridge without disconnecting from the socket.io server,
+        so that an engine restarted in-process, for instance to switch to
+        another context, gets it back from get_or_create() instead of
+        connecting again. The log messages waiting to be sent are sent, and
+        the host events subscribed to are unsubscribed from, since their
+        callbacks belong to the engine being torn down. The signals are
+        replaced, so that the slots connected by that engine are not called
+        anymore, even for messages received before the bridge is reused.
+        """
+        self.flush_log_messages()
 
-            if path is not None:
-                path = str(path)
+        for event_name in self._subscriptions:
+            self._io.emit("unsubscribe", sgtk.util.json.dumps(event_name))
 
-        return path
+        self._subscriptions.clear()
+        self._emitter = MessageEmitter()
+        super().detach()
+
+    def disconnect(self):
+        """
+        Sends the log messages waiting to be sent, then disconnects from the
+        socket.io server.
+        """
+        self.flush_log_messages()
+        super().disconnect()
+
+    def flush_log_messages(self):
+        """
+        Sends the log messages waiting to be sent right away, without
+        waiting for the batch to fill up or for pending RPC responses.
+        """
+        self.__send_log_batch(force=True)
 
     def log_message(self, level, msg):
         """
         Log a message from python so that it is visible on js side.
 
+        The message is buffered and sent with the next batch of messages,
+        at most LOG_FLUSH_INTERVAL seconds later unless an RPC response is
+        being waited for. Error and critical messages are sent right away.
+        A message identical to the previous one is not buffered again, and
+        is sent once along with the number of times it was repeated.
+
         :param level: The js log level name.
         :param msg: The message to log.
         """
+        # NOTE: do not log in this method
+        with self._log_lock:
+            records = self._log_records
 
-        log_data = {"level": level, "msg": msg}
+            if records and records[-1]["level"] == level and records[-1]["msg"] == msg:
+                records[-1]["count"] += 1
+            else:
+                if len(records) >= self.LOG_BUFFER_LIMIT:
+                    records.pop(0)
+                    self._log_dropped += 1
 
-        # NOTE: do not log in this method
-        json_log_data = json.dumps(log_data)
-        self._io.emit("log_message", json_log_data)
+                records.append(dict(level=level, msg=msg, count=1))
+
+                if self._log_buffered_since is None:
+                    self._log_buffered_since = time.time()
+
+                    # start the timer through the event loop, since this may
+                    # be called from any thread.
+                    QtCore.QMetaObject.invokeMethod(
+                        self._log_timer, "start", QtCore.Qt.QueuedConnection
+                    )
+
+        self.__send_log_batch(force=level in self.LOG_URGENT_LEVELS)
+
+    def process_new_messages(self, *args, **kwargs):
+        """
+        Sends the log messages that have waited long enough, then processes
+        new messages that have arrived but that have not been previously
+        handled.
+
+        See Communicator.process_new_messages for the parameters.
+        """
+        self.__send_log_batch()
+        super().process_new_messages(*args, **kwargs)
+
+    def subscribe(self, event_name, callback):
+        """
+        Subscribes to the given host event. The server listens to the event
+        in the host application and pushes it when it occurs, at which time
+        the given callback is called with the name of the event and the data
+        sent with it. Identical events occurring in quick succession are
+        coalesced into one. The host_event_received signal is emitted for
+        all subscribed events as well.
+
+        Events are either standard CEP events, like "documentAfterActivate",
+        "documentAfterDeactivate" or "documentAfterSave", or Photoshop events
+        named "photoshop:" followed by the string id of the event, like
+        "photoshop:make", "photoshop:set" or "photoshop:delete", which notably
+        cover changes to layers.
+
+        ..Example:
+            adobe.subscribe("documentAfterSave", on_document_saved)
+
+        :param str event_name: The name of the event to subscribe to.
+        :param callback: The callable to call when the event occurs.
+        """
+        callbacks = self._subscriptions.setdefault(event_name, [])
+
+        if not callbacks:
+            self.logger.debug("Subscribing to host event %s" % event_name)
+            self._io.emit("subscribe", sgtk.util.json.dumps(event_name))
+
+        callbacks.append(callback)
+
+    def unsubscribe(self, event_name, callback):
+        """
+        Unregisters a callback registered with subscribe(). The server stops
+        pushing the event once no callbacks are registered for it.
+
+        :param str event_name: The name of the event subscribed to.
+        :param callback: The callable to unregister.
+        """
+        callbacks = self._subscriptions.get(event_name, [])
+
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+        if not callbacks and event_name in self._subscriptions:
+            self.logger.debug("Unsubscribing from host event %s" % event_name)
+            del self._subscriptions[event_name]
+            self._io.emit("unsubscribe", sgtk.util.json.dumps(event_name))
 
     def send_commands(self, commands):
         """
@@ -240,6 +551,7 @@ class AdobeBridge(Communicator):
         json_commands = json.dumps(commands)
         self.logger.debug("Sending commands: %s" % json_commands)
         self._io.emit("set_commands", json_commands)
+        self._panel_state["set_commands"] = json_commands
 
     def send_context_display(self, context_display):
         """
@@ -252,6 +564,7 @@ class AdobeBridge(Communicator):
         json_context_display = json.dumps(context_display)
         self.logger.debug("Sending context display.")
         self._io.emit("set_context_display", json_context_display)
+        self._panel_state["set_context_display"] = json_context_display
 
     def send_context_thumbnail(self, context_thumbnail):
         """
@@ -264,6 +577,38 @@ class AdobeBridge(Communicator):
         json_context_thumbnail = json.dumps(context_thumbnail)
         self.logger.debug("Sending context thumb path: %s" % json_context_thumbnail)
         self._io.emit("set_context_thumbnail", json_context_thumbnail)
+        self._panel_state["set_context_thumbnail"] = json_context_thumbnail
+
+    def send_panel_state(
+        self, commands=None, context_display=None, context_thumbnail=None
+    ):
+        """
+        Sends the given panel state to js, skipping the parts identical to
+        what was last sent. This is used by an engine reusing the bridge of
+        a previous engine, after a context switch for instance, to bring the
+        panel up to date without sending it everything again.
+
+        :param list commands: The engine commands, as given to send_commands.
+        :param dict context_display: The context display, as given to
+                                     send_context_display.
+        :param str context_thumbnail: The context thumbnail path, as given to
+                                      send_context_thumbnail.
+        """
+        state = [
+            ("set_context_display", context_display, self.send_context_display),
+            ("set_context_thumbnail", context_thumbnail, self.send_context_thumbnail),
+            ("set_commands", commands, self.send_commands),
+        ]
+
+        for message, value, send in state:
+            if value is None:
+                continue
+
+            if self._panel_state.get(message) == json.dumps(value):
+                self.logger.debug("Panel state %s is unchanged." % message)
+                continue
+
+            send(value)
 
     def send_log_file_path(self, log_file):
         """
@@ -290,47 +635,120 @@ class AdobeBridge(Communicator):
         self.logger.debug("Sending context about to change message.")
         self._io.emit("context_about_to_change")
 
-    def export_image(self, doc, file_path, settings):
+    def export_image(self, doc, file_path, settings, as_job=False):
         """
         Export the document as an image to the filesystem.
 
         :param doc:  The document to export
         :param file_path:  Path to the image we want to export the document to
         :param settings:  Dictionary of export settings we want to use to create the image
+        :param bool as_job: Whether to run the export as a job, returning
+                            without waiting for it to complete.
+
+        :returns: A Job tracking the export if as_job is True, else None.
         """
 
         opts = self.ExportOptionsSaveForWeb()
 
         for setting_name, setting_value in settings.items():
             if setting_name == "format":
-                opts.format = getattr(self.SaveDocumentType, setting_value)
+                with self.cached(self.CACHE_SESSION):
+                    setting_value = getattr(self.SaveDocumentType, setting_value)
+                opts.format = setting_value
             else:
                 setattr(opts, setting_name, setting_value)
 
-        doc.exportDocument(self.File(file_path), self.ExportType.SAVEFORWEB, opts)
+        with self.cached(self.CACHE_SESSION):
+            export_type = self.ExportType.SAVEFORWEB
 
-    def save_as(self, doc, file_path):
+        args = [self.File(file_path), export_type, opts]
+
+        if as_job:
+            return self.rpc_call_async(doc.exportDocument, args, parent=doc)
+
+        doc.exportDocument(*args)
+
+    def query(
+        self,
+        collection,
+        where=None,
+        select=None,
+        include_handles=False,
+        recursive=False,
+    ):
+        """
+        Searches the given collection, typically the layers of a document,
+        for the items matching the given conditions. The search happens in
+        the Adobe product and only the matches are sent back. Recursive
+        queries also search the layers of nested layer sets.
+
+        ..Example:
+            adobe.query(
+                doc.layers,
+                where={"visible": True, "kind": "LayerKind.TEXT"},
+                select=["name"],
+                recursive=True,
+            )
+
+        :param collection: The collection to search.
+        :param dict where: The conditions that items must match. Enumerator
+                           values are compared by name, like "LayerKind.TEXT".
+        :param list select: The properties to get for each match. If not
+                            given, the matching items themselves are returned.
+        :param bool include_handles: Whether to include the matching item
+                                     under the "handle" key when a selection
+                                     is given.
+        :param bool recursive: Whether to search nested layer sets.
+
+        :returns: A list of items, or of dictionaries of selected values.
+        :rtype: list
+        """
+        return self.rpc_query(
+            collection,
+            where=where,
+            select=select,
+            include_handles=include_handles,
+            recursive=recursive,
+            children_property="layers",
+        )
+
+    def save_as(self, doc, file_path, as_job=False):
         """
         Performs a save-as operation on the given document, saving to the
         given file path. The purpose of this method is to abstract away the
         additional processing required to save a .psb file, as compared to
         a more-typical .psd file save-as.
 
+        Saving large documents can take a long time. When run as a job, the
+        call returns as soon as the save has started, which lets callers
+        keep their UI responsive and report progress while waiting on the
+        returned Job.
+
         :param doc: The document to be saved.
         :param str file_path: The destination file path.
+        :param bool as_job: Whether to run the save as a job, returning
+                            without waiting for it to complete.
+
+        :returns: A Job tracking the save if as_job is True, else None.
         """
         (root, ext) = os.path.splitext(file_path)
 
         if ext.lower() == ".psb":
-            self.save_as_psb(file_path)
+            return self.save_as_psb(file_path, as_job=as_job)
+        elif as_job:
+            return self.rpc_call_async(doc.saveAs, [self.File(file_path)], parent=doc)
         else:
             doc.saveAs(self.File(file_path))
 
-    def save_as_psb(self, file_path):
+    def save_as_psb(self, file_path, as_job=False):
         """
         Saves a PSB file.
 
         :param str file_path: The PSB file path to save to.
+        :param bool as_job: Whether to run the save as a job, returning
+                            without waiting for it to complete.
+
+        :returns: A Job tracking the save if as_job is True, else None.
         """
         # script listener generates this sequence of statements.
         # var idsave = charIDToTypeID( "save" );
@@ -351,30 +769,56 @@ class AdobeBridge(Communicator):
         # introduced in CS1 (aka 8.0). It might be that this value is ignored by Photoshop when the
         # extension is PSB? However, it's not clear why saving an empty canvas sometimes saves with
         # pht8 and sometimes pht3.
+        #
+        # The type ids and the dialog mode never change, so the server can
+        # answer those lookups from its cache.
+        with self.cached(self.CACHE_SESSION):
+            id_save = self.charIDToTypeID("save")
+            id_as = self.charIDToTypeID("As  ")
+            id_pht_8 = self.charIDToTypeID("Pht8")
+            id_in = self.charIDToTypeID("In  ")
+            dialog_mode = self.DialogModes.NO
+
         desc_29 = self.ActionDescriptor()
-        id_save = self.charIDToTypeID("save")
-        id_as = self.charIDToTypeID("As  ")
         desc_30 = self.ActionDescriptor()
-        id_pht_8 = self.charIDToTypeID("Pht8")
         desc_29.putObject(id_as, id_pht_8, desc_30)
-        id_in = self.charIDToTypeID("In  ")
         desc_29.putPath(id_in, self.File(file_path))
-        self.executeAction(id_save, desc_29, self.DialogModes.NO)
+
+        if as_job:
+            return self.rpc_call_async(
+                self.executeAction, [id_save, desc_29, dialog_mode]
+            )
+
+        self.executeAction(id_save, desc_29, dialog_mode)
 
     ##########################################################################################
     # internal methods
 
     def _forward_active_document_changed(self, response):
         """
-        Forwards the notification that the host application's active document
-        has changed.
-
-        :param response: The data received with the message. This
-                         is disregarded.
+        Records the new state of the active document, and forwards the
+        notification that the host application's active document has changed
+        as a Qt Signal. The server also notifies of changes that leave the
+        path of the active document as it was, like saves and renames, which
+        only update the recorded state.
+
+        :param response: The data received with the message, describing
+                         the active document.
         """
-        self.logger.debug("Emitting active_document_changed signal.")
+        self.invalidate_property_cache()
         response = sgtk.util.json.loads(response)
-        self.active_document_changed.emit(response.get("active_document_path"))
+
+        if "active_document" in response:
+            self.__record_active_document(response["active_document"])
+
+        path = response.get("active_document_path")
+
+        if path == self._active_document_path:
+            return
+
+        self._active_document_path = path
+        self.logger.debug("Emitting active_document_changed signal.")
+        self.active_document_changed.emit(path)
 
     def _forward_command(self, response):
         """
@@ -387,6 +831,30 @@ class AdobeBridge(Communicator):
         self.logger.debug("Emitting command_received signal.")
         self.command_received.emit(int(sgtk.util.json.loads(response)))
 
+    def _forward_host_events(self, response):
+        """
+        Calls the callbacks subscribed to the received host events, and
+        forwards them as Qt Signals.
+
+        :param response: The data received with the message. This will
+                         take the form of a JSON encoded list of dictionaries
+                         with the "event" name, its "data", and the "count" of
+                         identical events coalesced into it.
+        """
+        for event in sgtk.util.json.loads(response):
+            event_name = event["event"]
+            data = event.get("data")
+
+            for callback in list(self._subscriptions.get(event_name, [])):
+                try:
+                    callback(event_name, data)
+                except Exception:
+                    self.logger.exception(
+                        "Error handling host event %s with %s" % (event_name, callback)
+                    )
+
+            self.host_event_received.emit(event_name, data)
+
     def _forward_logging(self, response):
         """
         Forwards the logging request received as a Qt Signal.
@@ -403,6 +871,34 @@ class AdobeBridge(Communicator):
             response.get("message"),
         )
 
+    def _forward_logging_batch(self, response):
+        """
+        Forwards a batch of logging requests received as a single Qt Signal,
+        and also as one Qt Signal per request if emit_logging_per_record says
+        so.
+
+        :param response: The data received with the message. This will
+                         take the form of a JSON encoded list of dictionaries
+                         with "level" and "message" keys.
+        """
+        records = [
+            (record.get("level"), record.get("message"))
+            for record in sgtk.util.json.loads(response)
+        ]
+
+        self.logging_received_batch.emit(records)
+
+        per_record = self._emit_logging_per_record
+
+        if per_record is None:
+            per_record = not self._emitter.receivers(
+                QtCore.SIGNAL("logging_received_batch(PyObject)")
+            )
+
+        if per_record:
+            for level, message in records:
+                self.logging_received.emit(level, message)
+
     def _forward_run_tests(self, response):
         """
         Forwards the request for tests to be run as a Qt Signal.
@@ -423,6 +919,23 @@ class AdobeBridge(Communicator):
         self.logger.debug("Emitting state_requested signal.")
         self.state_requested.emit()
 
+    def _handle_reconnect(self, *args):
+        """
+        Subscribes to the host events subscribed to again after reconnecting,
+        since the server forgets the subscriptions of disconnected clients,
+        and forwards the reconnection as a Qt Signal.
+        """
+        super()._handle_reconnect(*args)
+
+        # the panel state may have been lost along with the server.
+        self._panel_state.clear()
+
+        for event_name in self._subscriptions:
+            self._io.emit("subscribe", sgtk.util.json.dumps(event_name))
+
+        self.logger.debug("Emitting reconnected signal.")
+        self.reconnected.emit()
+
     @timeout(SHOTGUN_ADOBE_RESPONSE_TIMEOUT, "Timed out waiting for response.")
     def _wait_for_response(self, uid):
         """
@@ -435,7 +948,80 @@ class AdobeBridge(Communicator):
 
         :returns: The raw returned results data.
         """
-        return super()._wait_for_response(uid)
+        self._awaiting_responses += 1
+
+        try:
+            return super()._wait_for_response(uid)
+        finally:
+            self._awaiting_responses -= 1
+
+    ##########################################################################################
+    # private methods
+
+    def __flush_log_timer(self):
+        """
+        Sends the buffered log messages once they have waited long enough,
+        and waits again if they were held back by a pending RPC response.
+        """
+        # NOTE: do not log in this method
+        with self._log_lock:
+            if self._awaiting_responses:
+                self._log_timer.start()
+            else:
+                self.__send_log_batch(force=True)
+
+    def __send_log_batch(self, force=False):
+        """
+        Sends the buffered log messages as a single batch, if the batch is
+        full or its oldest message has waited long enough, and no RPC
+        response is being waited for.
+
+        :param bool force: If True, sends the batch regardless.
+        """
+        # NOTE: do not log in this method
+        with self._log_lock:
+            records = self._log_records
+
+            if not records:
+                return
+
+            if not force:
+                if self._awaiting_responses:
+                    return
+
+                if len(records) < self.LOG_BATCH_SIZE and (
+                    time.time() - self._log_buffered_since < self.LOG_FLUSH_INTERVAL
+                ):
+                    return
+
+            if self._log_dropped:
+                records.insert(
+                    0,
+                    dict(
+                        level="warn",
+                        msg="%d log messages were dropped." % self._log_dropped,
+                        count=1,
+                    ),
+                )
+
+            self._log_records = []
+            self._log_buffered_since = None
+            self._log_dropped = 0
+
+            self._io.emit("log_messages", json.dumps(records))
+
+    def __record_active_document(self, state):
+        """
+        Records the given state of the active document as current.
+
+        :param dict state: The state of the active document, or None if
+                           there is no active document.
+        """
+        if state and not state.get("path"):
+            state = dict(state, path=None)
+
+        self._active_document = state
+        self._active_document_epoch = self._property_cache_epoch
 
 
 ##########################################################################################
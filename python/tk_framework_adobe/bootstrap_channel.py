@@ -0,0 +1,216 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+import os
+import sys
+import json
+import time
+import contextlib
+import types
+import threading
+
+# The environment variable holding the file descriptor of the channel, as
+# set by the js process that spawned python.
+CHANNEL_FD_ENV_VAR = "SHOTGUN_ADOBE_BOOTSTRAP_CHANNEL_FD"
+
+# The framework may be imported more than once in the same process, under
+# different module names: by the bootstrap script, and by toolkit when the
+# engine loads it. The channel is shared by all of them through a module
+# registered in sys.modules under this name.
+_SHARED_STATE_NAME = "_tk_framework_adobe_bootstrap_channel"
+
+
+class BootstrapChannel(object):
+    """
+    A structured channel to the js process that spawned python, used during
+    bootstrap to report progress and the duration of each bootstrap phase.
+
+    Messages are written as JSON lines to a pipe dedicated to the channel,
+    separate from stdout, so that the js process doesn't have to search the
+    log output for them. Each message is a dictionary with a "type" key:
+
+        {"type": "progress", "progress": 0.5, "message": "..."}
+        {"type": "phase", "name": "...", "start": 0.1, "duration": 1.2}
+        {"type": "mark", "name": "...", "time": 2.5}
+
+    Times are in seconds, relative to when the channel was opened.
+    """
+
+    def __init__(self, stream):
+        """
+        Constructor.
+
+        :param stream: The writable text stream of the channel.
+        """
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+
+    ##########################################################################################
+    # properties
+
+    @property
+    def closed(self):
+        """
+        Whether the channel is closed, or can't be written to anymore.
+        """
+        return self._stream is None
+
+    ##########################################################################################
+    # context managers
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Times the execution of the block, and reports it as a bootstrap
+        phase once the block is exited.
+
+        :param str name: The name of the phase.
+        """
+        start = time.monotonic()
+
+        try:
+            yield
+        finally:
+            self.record_phase(name, start, time.monotonic())
+
+    ##########################################################################################
+    # public methods
+
+    def close(self):
+        """
+        Closes the channel. Messages sent afterward are discarded.
+        """
+        with self._lock:
+            if self._stream is not None:
+                try:
+                    self._stream.close()
+                except Exception:
+                    pass
+                self._stream = None
+
+    def mark(self, name):
+        """
+        Reports that a point of the bootstrap has been reached.
+
+        :param str name: The name of the mark.
+        """
+        self.send("mark", name=name, time=round(time.monotonic() - self._start, 6))
+
+    def progress(self, value, message):
+        """
+        Reports bootstrap progress.
+
+        :param float value: The startup progress, from 0.0 to 1.0.
+        :param str message: A message that indicates what is happening.
+        """
+        self.send("progress", progress=float(value), message=message)
+
+    def record_phase(self, name, start, end):
+        """
+        Reports a bootstrap phase that has already been timed.
+
+        :param str name: The name of the phase.
+        :param float start: The time.monotonic() value the phase started at.
+        :param float end: The time.monotonic() value the phase ended at.
+        """
+        self.send(
+            "phase",
+            name=name,
+            start=round(start - self._start, 6),
+            duration=round(end - start, 6),
+        )
+
+    def send(self, message_type, **data):
+        """
+        Sends a message through the channel.
+
+        :param str message_type: The type of the message.
+        :param data: The data of the message.
+        """
+        data["type"] = message_type
+        line = json.dumps(data) + "\n"
+
+        with self._lock:
+            if self._stream is None:
+                return
+
+            try:
+                self._stream.write(line)
+                self._stream.flush()
+            except Exception:
+                # the js process stopped reading. don't try again.
+                self._stream = None
+
+
+def get_channel():
+    """
+    Gets the bootstrap channel set up by the js process that spawned python,
+    opening it on first call.
+
+    :returns: The BootstrapChannel, or None if no channel was set up or it is
+              closed, in which case progress must be reported through
+              stdout.
+    """
+    state = _get_shared_state()
+
+    with state.lock:
+        if state.channel is None:
+            fd = os.environ.get(CHANNEL_FD_ENV_VAR)
+
+            if not fd:
+                return None
+
+            # don't let processes started by toolkit inherit the channel
+            os.environ.pop(CHANNEL_FD_ENV_VAR, None)
+
+            try:
+                stream = os.fdopen(int(fd), "w", encoding="utf-8")
+            except (OSError, ValueError):
+                return None
+
+            state.channel = BootstrapChannel(stream)
+
+        if state.channel.closed:
+            return None
+
+        return state.channel
+
+
+def phase(name):
+    """
+    Times a bootstrap phase, if the js process set up a bootstrap channel.
+
+    :param str name: The name of the phase.
+
+    :returns: A context manager timing the block it wraps.
+    """
+    channel = get_channel()
+
+    if channel:
+        return channel.phase(name)
+
+    return contextlib.nullcontext()
+
+
+def _get_shared_state():
+    """
+    Gets the state shared by all of the imports of this module.
+
+    :returns: A module with "channel" and "lock" attributes.
+    """
+    state = sys.modules.get(_SHARED_STATE_NAME)
+
+    if state is None:
+        state = types.ModuleType(_SHARED_STATE_NAME)
+        state.channel = None
+        state.lock = threading.Lock()
+        state = sys.modules.setdefault(_SHARED_STATE_NAME, state)
+
+    return state
@@ -10,6 +10,7 @@
 
 import os
 from . import log
+from .bootstrap_channel import phase
 
 
 def toolkit_classic_bootstrap():
@@ -21,19 +22,24 @@ def toolkit_classic_bootstrap():
     logger = sgtk.LogManager.get_logger(__name__)
 
     # ---- setup logging
-    log_handler = log.get_sgtk_logger(sgtk)
-    logger.info("Launching Toolkit in classic mode.")
-    logger.debug("TANK_CONTEXT and TANK_ENGINE variables found.")
+    log_handler = log.get_sgtk_logger(sgtk, queued=True)
+
+    try:
+        logger.info("Launching Toolkit in classic mode.")
+        logger.debug("TANK_CONTEXT and TANK_ENGINE variables found.")
+
+        # Deserialize the Context object and use that when starting
+        # the engine.
+        context = sgtk.context.deserialize(os.environ["TANK_CONTEXT"])
+        engine_name = os.environ["TANK_ENGINE"]
+
+        logger.info("Starting %s using context %s..." % (engine_name, context))
+        with phase("start_engine"):
+            sgtk.platform.start_engine(engine_name, context.tank, context)
+    finally:
+        # ---- tear down logging
+        sgtk.LogManager().root_logger.removeHandler(log_handler)
+        log_handler.close()
+        logger.debug("Removed bootstrap log handler from root logger...")
 
-    # Deserialize the Context object and use that when starting
-    # the engine.
-    context = sgtk.context.deserialize(os.environ["TANK_CONTEXT"])
-    engine_name = os.environ["TANK_ENGINE"]
-
-    logger.info("Starting %s using context %s..." % (engine_name, context))
-    sgtk.platform.start_engine(engine_name, context.tank, context)
-
-    # ---- tear down logging
-    sgtk.LogManager().root_logger.removeHandler(log_handler)
-    logger.debug("Removed bootstrap log handler from root logger...")
     logger.info("Toolkit Bootstrapped!")
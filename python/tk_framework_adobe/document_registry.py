@@ -0,0 +1,289 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+import os
+
+
+class DocumentRegistry(object):
+    """
+    A local mirror of the documents open in the host application, kept up
+    to date from the host events pushed by an AdobeBridge.
+
+    The registry is built with a full scan of the open documents, and then
+    updated incrementally: activating or saving a document refreshes that
+    document only, and closing a document removes it. Only Photoshop reports
+    which document was closed. In other hosts, deactivating a document,
+    which also happens when it is closed, leads to a full scan. Events only
+    flag what needs updating, and the updates are made the next time the
+    registry is accessed, which means that no RPC calls are made while the
+    bridge is processing its messages. A full scan is made again after the
+    bridge reconnects to the server.
+
+    Each document is described by a dictionary with its "id", "name", the
+    "path" of its file, or None if it has never been saved, whether it is
+    "saved", and a "handle", which is the proxy object of the document.
+
+    ..Example:
+        registry = DocumentRegistry(adobe)
+        for document in registry.documents:
+            print(document["name"], document["path"])
+    """
+
+    # The host events the registry is updated from.
+    REFRESH_EVENTS = ("documentAfterActivate", "documentAfterSave")
+
+    # The host events reporting which document was closed, by host
+    # application id.
+    CLOSE_EVENTS = {"PHSP": "photoshop:close", "PHXS": "photoshop:close"}
+
+    # The host event leading to a full scan in hosts without a close event.
+    RESYNC_EVENT = "documentAfterDeactivate"
+
+    # The document properties recorded for each document.
+    FIELDS = ["id", "name", "fullName.fsName", "saved"]
+
+    def __init__(self, bridge):
+        """
+        Constructor.
+
+        :param bridge: The AdobeBridge to get documents and events from.
+        """
+        self._bridge = bridge
+        self._documents = dict()
+        self._paths = dict()
+        self._active_id = None
+
+        # The updates waiting to be made.
+        self._needs_resync = True
+        self._needs_active_refresh = False
+        self._closed_ids = set()
+
+        for event_name in self.REFRESH_EVENTS:
+            self._bridge.subscribe(event_name, self._on_document_event)
+
+        # hosts that don't report which document was closed are scanned
+        # again whenever a document may have been closed.
+        self._close_event = self.CLOSE_EVENTS.get(os.environ.get("SHOTGUN_ADOBE_APPID"))
+
+        if self._close_event:
+            self._bridge.subscribe(self._close_event, self._on_close_event)
+        else:
+            self._bridge.subscribe(self.RESYNC_EVENT, self._on_resync_event)
+
+        self._bridge.reconnected.connect(self.invalidate)
+
+    ##########################################################################################
+    # properties
+
+    @property
+    def active_document(self):
+        """
+        The description of the active document, or None.
+        """
+        self.__update()
+        return self._documents.get(self._active_id)
+
+    @property
+    def documents(self):
+        """
+        The list of descriptions of the open documents.
+        """
+        self.__update()
+        return list(self._documents.values())
+
+    ##########################################################################################
+    # public methods
+
+    def close(self):
+        """
+        Stops following host events. The registry is not updated anymore.
+        """
+        for event_name in self.REFRESH_EVENTS:
+            self._bridge.unsubscribe(event_name, self._on_document_event)
+
+        if self._close_event:
+            self._bridge.unsubscribe(self._close_event, self._on_close_event)
+        else:
+            self._bridge.unsubscribe(self.RESYNC_EVENT, self._on_resync_event)
+
+        self._bridge.reconnected.disconnect(self.invalidate)
+
+    def get(self, document_id):
+        """
+        Gets the description of the open document of the given id.
+
+        :param int document_id: The id of the document.
+
+        :returns: The description of the document, or None if no such
+                  document is open.
+        :rtype: dict
+        """
+        self.__update()
+        return self._documents.get(document_id)
+
+    def get_by_path(self, path):
+        """
+        Gets the description of the open document saved to the given path.
+
+        :param str path: The file path of the document.
+
+        :returns: The description of the document, or None if no open
+                  document is saved to that path.
+        :rtype: dict
+        """
+        self.__update()
+        return self._documents.get(self._paths.get(path))
+
+    def invalidate(self):
+        """
+        Requests a full scan of the open documents on next access. This is
+        only needed when documents may have been opened or closed without
+        the registry being notified, like by scripts run in the host.
+        """
+        self._needs_resync = True
+
+    ##########################################################################################
+    # internal methods
+
+    def _on_close_event(self, event_name, data):
+        """
+        Flags the closed document for removal. If the host didn't tell which
+        document was closed, a full scan is made instead.
+
+        :param str event_name: The name of the event.
+        :param data: The data sent with the event.
+        """
+        document_id = (data or {}).get("documentID")
+
+        if document_id is None:
+            self._needs_resync = True
+        else:
+            self._closed_ids.add(document_id)
+
+        self._needs_active_refresh = True
+
+    def _on_document_event(self, event_name, data):
+        """
+        Flags the active document for refresh.
+
+        :param str event_name: The name of the event.
+        :param data: The data sent with the event.
+        """
+        self._needs_active_refresh = True
+
+    def _on_resync_event(self, event_name, data):
+        """
+        Flags the open documents for a full scan, in hosts that don't report
+        which document was closed.
+
+        :param str event_name: The name of the event.
+        :param data: The data sent with the event.
+        """
+        self._needs_resync = True
+
+    ##########################################################################################
+    # private methods
+
+    def __describe(self, values, handle):
+        """
+        Builds the description of a document.
+
+        :param dict values: The values of the FIELDS of the document.
+        :param handle: The proxy object of the document.
+
+        :rtype: dict
+        """
+        return dict(
+            id=values.get("id"),
+            name=values.get("name"),
+            path=values.get("fullName.fsName"),
+            saved=values.get("saved"),
+            handle=handle,
+        )
+
+    def __record(self, document):
+        """
+        Records the given document, replacing any previous description.
+
+        :param dict document: The description of the document.
+        """
+        self.__remove(document["id"])
+        self._documents[document["id"]] = document
+
+        if document["path"]:
+            self._paths[document["path"]] = document["id"]
+
+    def __remove(self, document_id):
+        """
+        Forgets the document of the given id.
+
+        :param int document_id: The id of the document.
+        """
+        document = self._documents.pop(document_id, None)
+
+        if document and self._paths.get(document["path"]) == document_id:
+            del self._paths[document["path"]]
+
+    def __refresh_active(self):
+        """
+        Records the current state of the active document.
+        """
+        doc = self._bridge.get_active_document()
+
+        if not doc:
+            self._active_id = None
+            return
+
+        with self._bridge.response_logging_silenced():
+            values = self._bridge.rpc_snapshot(doc, self.FIELDS)
+
+        document = self.__describe(values, doc)
+        self.__record(document)
+        self._active_id = document["id"]
+
+    def __resync(self):
+        """
+        Records the state of all of the open documents.
+        """
+        self._bridge.logger.debug("Scanning the open documents.")
+
+        with self._bridge.response_logging_silenced():
+            matches = self._bridge.rpc_query(
+                self._bridge.app.documents,
+                select=self.FIELDS,
+                include_handles=True,
+            )
+
+        self._documents = dict()
+        self._paths = dict()
+
+        for match in matches:
+            self.__record(self.__describe(match, match.get("handle")))
+
+    def __update(self):
+        """
+        Makes the updates flagged by the events received since the last
+        access.
+        """
+        # the flags are only cleared once the updates succeed, so that they
+        # are attempted again on next access if the RPC calls fail.
+        if self._needs_resync:
+            self.__resync()
+            self._needs_resync = False
+            self._needs_active_refresh = True
+            self._closed_ids.clear()
+
+        for document_id in self._closed_ids:
+            self.__remove(document_id)
+
+        self._closed_ids.clear()
+
+        if self._needs_active_refresh:
+            self.__refresh_active()
+            self._needs_active_refresh = False
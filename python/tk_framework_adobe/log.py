@@ -8,7 +8,11 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 import os
+import sys
+import queue
 import logging
+import logging.handlers
+import threading
 
 
 class BootstrapLogHandler(logging.StreamHandler):
@@ -31,18 +35,132 @@ class BootstrapLogHandler(logging.StreamHandler):
         self.flush()
 
 
-def get_sgtk_logger(sgtk):
+class QueuedBootstrapLogHandler(logging.handlers.QueueHandler):
+    """
+    Queues emitted records for a background thread to write for js to pickup.
+
+    Logging during bootstrap then doesn't wait on the js process reading
+    stdout. The writer thread writes all of the records queued since its
+    last write at once, and flushes once per write. Raw strings, such as
+    the bootstrap progress markers, go through the same queue so that they
+    keep their place relative to the records, but they are flushed on their
+    own line as soon as they are dequeued.
+
+    The handler must be closed once bootstrap is complete, which writes the
+    records still queued and stops the writer thread.
+    """
+
+    # The maximum number of queued items written at once.
+    MAX_BATCH_SIZE = 200
+
+    def __init__(self, stream=None):
+        """
+        Constructor.
+
+        :param stream: The stream to write to. Defaults to stdout.
+        """
+        super().__init__(queue.SimpleQueue())
+
+        self._stream = stream or sys.stdout
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._write_queued, name="BootstrapLogWriter"
+        )
+        self._writer.daemon = True
+        self._writer.start()
+
+    def close(self):
+        """
+        Writes the records still queued, then stops the writer thread.
+        """
+        if not self._closed:
+            self._closed = True
+            self.queue.put(None)
+            self._writer.join()
+
+        super().close()
+
+    def write_raw(self, text):
+        """
+        Queues a raw string to be written on its own line and flushed right
+        away. Once the handler is closed, the string is written directly.
+
+        :param str text: The string to write.
+        """
+        if self._closed:
+            self.__write(text)
+        else:
+            self.queue.put(text)
+
+    def _write_queued(self):
+        """
+        Writes the queued items until the handler is closed. Runs in the
+        writer thread.
+        """
+        running = True
+
+        while running:
+            items = [self.queue.get()]
+
+            while len(items) < self.MAX_BATCH_SIZE:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+
+            for item in items:
+                if item is None:
+                    running = False
+                elif isinstance(item, str):
+                    # write the pending records first so that the raw string
+                    # is not mixed with them
+                    if lines:
+                        self.__write("\n".join(lines))
+                        lines = []
+                    self.__write(item)
+                else:
+                    # the record message was formatted when it was queued
+                    lines.append(item.getMessage())
+
+            if lines:
+                self.__write("\n".join(lines))
+
+    def __write(self, text):
+        """
+        Writes and flushes a string followed by a newline.
+
+        :param str text: The string to write.
+        """
+        try:
+            self._stream.write(text + "\n")
+            self._stream.flush()
+        except Exception:
+            # the js process may have stopped reading. nothing can be
+            # reported from here.
+            pass
+
+
+def get_sgtk_logger(sgtk, queued=False):
     """
     Sets up a std log handler for toolkit
 
     :param sgtk: An sgtk module reference.
+    :param bool queued: If True, sets up a QueuedBootstrapLogHandler, which
+                        must be closed once done with.
 
     :returns: A log handler.
     """
     # add a custom handler to the root logger so that all toolkit log messages
     # are forwarded back to python via the communicator
     bootstrap_log_formatter = logging.Formatter("[%(levelname)s]: %(message)s")
-    bootstrap_log_handler = BootstrapLogHandler()
+
+    if queued:
+        bootstrap_log_handler = QueuedBootstrapLogHandler()
+    else:
+        bootstrap_log_handler = BootstrapLogHandler()
+
     bootstrap_log_handler.setFormatter(bootstrap_log_formatter)
 
     if sgtk.LogManager().global_debug:
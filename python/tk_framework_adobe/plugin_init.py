@@ -9,8 +9,10 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 import sys
 import os
+import functools
 
 from . import log
+from .bootstrap_channel import get_channel, phase
 
 
 # Note: the sgtk_plugin_basic_photoshopcc module is created
@@ -21,20 +23,45 @@ except ImportError:
     pass
 
 
-def _progress_handler(value, message):
+def _progress_handler(value, message, log_handler=None):
     """
     Writes the progress values in a special format that can be intercepted by
     the panel during load.
 
     :param value: A float (0-1) value representing startup progress percentage.
     :param message: A message that indicates what is happening during startup.
+    :param log_handler: An optional QueuedBootstrapLogHandler to write the
+                        progress through, which keeps it in order with the
+                        log records queued by the handler.
     """
+    # Report the progress through the bootstrap channel if the js process
+    # set one up.
+    channel = get_channel()
+    if channel:
+        channel.progress(value, message)
+        return
 
     # A three part message separated by "|" to help indicate boundaries. The
     # panel will intercept logged strings of this format and translate them
     # to the display.
-    sys.stdout.write("|PLUGIN_BOOTSTRAP_PROGRESS,%s,%s|" % (value, message))
-    sys.stdout.flush()
+    marker = "|PLUGIN_BOOTSTRAP_PROGRESS,%s,%s|" % (value, message)
+
+    if log_handler:
+        log_handler.write_raw(marker)
+    else:
+        sys.stdout.write(marker)
+        sys.stdout.flush()
+
+
+def toolkit_plugin_preload(plugin_root_path):
+    """
+    Imports the toolkit core ahead of bootstrap. This is used by standby
+    processes, to get the imports out of the way before the process is
+    handed off for bootstrapping.
+
+    :param plugin_root_path: Path to the root of the plugin
+    """
+    _import_core(plugin_root_path)
 
 
 def toolkit_plugin_bootstrap(plugin_root_path):
@@ -45,17 +72,59 @@ def toolkit_plugin_bootstrap(plugin_root_path):
     """
 
     # import sgtk
-    tk_core_python_path = manifest.get_sgtk_pythonpath(plugin_root_path)
-    sys.path.insert(0, tk_core_python_path)
-    import sgtk
+    with phase("import_core"):
+        sgtk, tk_core_python_path = _import_core(plugin_root_path)
 
     logger = sgtk.LogManager.get_logger(__name__)
     logger.debug("Imported sgtk core from '%s'" % tk_core_python_path)
 
     # ---- setup logging
-    log_handler = log.get_sgtk_logger(sgtk)
+    log_handler = log.get_sgtk_logger(sgtk, queued=True)
     logger.debug("Added bootstrap log hander to root logger...")
 
+    try:
+        bootstrapped = _bootstrap_engine(sgtk, plugin_root_path, log_handler)
+    finally:
+        # ---- tear down logging
+        sgtk.LogManager().root_logger.removeHandler(log_handler)
+        log_handler.close()
+        logger.debug("Removed bootstrap log handler from root logger...")
+
+    if bootstrapped:
+        logger.info("Toolkit Bootstrapped!")
+
+
+def _import_core(plugin_root_path):
+    """
+    Imports the toolkit core resolved for the plugin. Does nothing if it has
+    already been imported.
+
+    :param plugin_root_path: Path to the root of the plugin
+
+    :returns: The sgtk module and the python path it was imported from.
+    """
+    tk_core_python_path = manifest.get_sgtk_pythonpath(plugin_root_path)
+
+    if tk_core_python_path not in sys.path:
+        sys.path.insert(0, tk_core_python_path)
+
+    import sgtk
+
+    return sgtk, tk_core_python_path
+
+
+def _bootstrap_engine(sgtk, plugin_root_path, log_handler):
+    """
+    Bootstraps the engine using a toolkit manager.
+
+    :param sgtk: An sgtk module reference.
+    :param plugin_root_path: Path to the root of the plugin
+    :param log_handler: The bootstrap log handler, to report progress with.
+
+    :returns: Whether the engine was started.
+    """
+    logger = sgtk.LogManager.get_logger(__name__)
+
     # set up the toolkit bootstrap manager
 
     # todo: For standalone workflows, need to handle authentication here
@@ -64,12 +133,15 @@ def toolkit_plugin_bootstrap(plugin_root_path):
     #       Also, need to check that the SHOTGUN_SITE env var matches
     #       the currently logged in site.
 
-    toolkit_mgr = sgtk.bootstrap.ToolkitManager()
-    # run the default init which sets plugin id, base config and bundle cache path
-    manifest.initialize_manager(toolkit_mgr, plugin_root_path)
+    with phase("initialize_manager"):
+        toolkit_mgr = sgtk.bootstrap.ToolkitManager()
+        # run the default init which sets plugin id, base config and bundle cache path
+        manifest.initialize_manager(toolkit_mgr, plugin_root_path)
 
     # set up progress reporting
-    toolkit_mgr.progress_callback = _progress_handler
+    toolkit_mgr.progress_callback = functools.partial(
+        _progress_handler, log_handler=log_handler
+    )
     logger.debug("Toolkit Manager: %s" % toolkit_mgr)
 
     entity = toolkit_mgr.get_entity_from_environment()
@@ -81,12 +153,9 @@ def toolkit_plugin_bootstrap(plugin_root_path):
         logger.error(
             "No engine to start is specified. Make shure SHOTGUN_ENGINE is set in the bootstrap of your engine."
         )
-        return
-
-    toolkit_mgr.bootstrap_engine(engine_to_start, entity=entity)
+        return False
 
-    # ---- tear down logging
-    sgtk.LogManager().root_logger.removeHandler(log_handler)
-    logger.debug("Removed bootstrap log handler from root logger...")
+    with phase("bootstrap_engine"):
+        toolkit_mgr.bootstrap_engine(engine_to_start, entity=entity)
 
-    logger.info("Toolkit Bootstrapped!")
+    return True
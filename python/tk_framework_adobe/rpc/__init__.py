@@ -8,4 +8,19 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
-from .communicator import Communicator
+
+def __getattr__(name):
+    """
+    Imports the Communicator on first access. The communicator module pulls
+    in the socket.io client and its dependencies, which are only needed once
+    a communicator is used.
+
+    :param str name: The name of the attribute accessed.
+    """
+    if name == "Communicator":
+        from .communicator import Communicator
+
+        globals()["Communicator"] = Communicator
+        return Communicator
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
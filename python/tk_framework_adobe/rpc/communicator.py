@@ -10,10 +10,14 @@
 import threading
 import sys
 import os
+import inspect
 import time
+import types
 import logging
 import contextlib
 
+from . import packages
+
 
 # Add our third-party packages to sys.path. We've created a zip file because some of the file paths
 # are pretty long. We're also normalizing the path or we're getting import errors.
@@ -32,32 +36,74 @@ pkgs_zip_path = os.path.normpath(
 if not os.path.exists(pkgs_zip_path):
     raise RuntimeError(f"Could not find the required packages at {pkgs_zip_path}")
 
-sys.path.insert(0, pkgs_zip_path)
+# The packages are imported from a compiled copy of the zip file's contents
+# when possible. See packages.get_packages_path.
+sys.path.insert(0, packages.get_packages_path(pkgs_zip_path))
 
 
 import socketIO_client_nexus
 import socketIO_client_nexus.exceptions
+from ..bootstrap_channel import phase
+from .job import Job
 from .proxy import ProxyScope, ProxyWrapper, ClassInstanceProxyWrapper
+from .trace import TraceBuffer
+from .transaction import Transaction
 
 import sgtk
 
-if os.environ.get("SGTK_ENFORCE_PROXY_LOCALHOST", "0").strip().lower() not in [
-    "1",
-    "true",
-    "y",
-    "yes",
-]:
-    # Hook socketIO_client_nexus.prepare_http_session to disable Proxy
+
+def _patch_http_session():
+    """
+    Hooks socketIO_client_nexus.prepare_http_session to disable proxies,
+    unless SGTK_ENFORCE_PROXY_LOCALHOST is set. The hook is only installed
+    once per process, even if this module is imported more than once under
+    different names.
+    """
+    if os.environ.get("SGTK_ENFORCE_PROXY_LOCALHOST", "0").strip().lower() in [
+        "1",
+        "true",
+        "y",
+        "yes",
+    ]:
+        return
+
     prepare_http_session_bak = socketIO_client_nexus.prepare_http_session
 
+    if getattr(prepare_http_session_bak, "_disables_proxy", False):
+        return
+
     def my_prepare_http_session(kw):
         http_session = prepare_http_session_bak(kw)
         http_session.trust_env = False
         return http_session
 
+    my_prepare_http_session._disables_proxy = True
     socketIO_client_nexus.prepare_http_session = my_prepare_http_session
 
 
+# The framework may be imported more than once in the same process, under
+# different module names, when toolkit restarts the engine. Detached
+# communicators are handed over to the next import through a registry kept in
+# a module registered in sys.modules under this name.
+_DETACHED_REGISTRY_NAME = "_tk_framework_adobe_detached_communicators"
+
+
+def _get_detached_registry():
+    """
+    Gets the process-wide registry of detached communicators, by identifier.
+
+    :rtype: dict
+    """
+    shared = sys.modules.get(_DETACHED_REGISTRY_NAME)
+
+    if shared is None:
+        shared = types.ModuleType(_DETACHED_REGISTRY_NAME)
+        shared.registry = dict()
+        shared = sys.modules.setdefault(_DETACHED_REGISTRY_NAME, shared)
+
+    return shared.registry
+
+
 class Communicator(object):
     """
     A communication manager that owns a socket.io client. The
@@ -66,12 +112,55 @@ class Communicator(object):
     time. Basic RPC calls are also implemented.
     """
 
-    _RESULTS = dict()
     _UID = 0
     _LOCK = threading.Lock()
     _RPC_EXECUTE_COMMAND = "execute_command"
     _REGISTRY = dict()
-    _COMMAND_REGISTRY = dict()
+
+    # The priority classes of RPC commands. The server evaluates commands
+    # one at a time, highest priority first. Control commands are short
+    # checks, like the state queries used to tell whether the host is still
+    # responsive, interactive commands are regular calls, and bulk commands
+    # are long-running work, like saves and exports.
+    PRIORITY_CONTROL = "control"
+    PRIORITY_INTERACTIVE = "interactive"
+    PRIORITY_BULK = "bulk"
+    PRIORITIES = (PRIORITY_CONTROL, PRIORITY_INTERACTIVE, PRIORITY_BULK)
+
+    # The cache scopes of RPC reads. The server can answer reads tagged with
+    # a scope from its cache. Session scoped results are kept for as long as
+    # the host is running, and document scoped results until a document is
+    # modified through RPC, saved, or switched.
+    CACHE_SESSION = "session"
+    CACHE_DOCUMENT = "document"
+    CACHE_SCOPES = (CACHE_SESSION, CACHE_DOCUMENT)
+
+    # The properties whose values can be kept by the property cache, by the
+    # type of the remote object they belong to. Methods of remote objects can
+    # always be kept. See property_cache().
+    CACHEABLE_PROPERTIES = {
+        "Application": ("activeDocument", "build", "locale", "name", "version"),
+        "Document": ("fullName", "name", "path"),
+        "File": ("absoluteURI", "fsName", "fullName", "name", "path"),
+        "Folder": ("absoluteURI", "fsName", "fullName", "name", "path"),
+    }
+
+    # The number of network trace records kept, if tracing is turned on
+    # through the environment. See trace.
+    _TRACE_SIZE = int(os.environ.get("SHOTGUN_ADOBE_NETWORK_TRACE", 0) or 0)
+
+    # The RPC methods that may change the state of the host, which empty the
+    # property cache.
+    _MUTATING_METHODS = (
+        "call",
+        "call_many",
+        "eval",
+        "invoke",
+        "job_start",
+        "set",
+        "set_many",
+        "transaction",
+    )
 
     def __init__(
         self,
@@ -109,9 +198,27 @@ class Communicator(object):
         self._logger = logger or logging.getLogger(__name__)
         self._event_processor = event_processor
         self._response_logging_silenced = False
+        self._prepared_functions = dict()
+        self._transaction = None
+        self._jobs = dict()
+        self._priority = None
+        self._cache_scope = None
+        self._property_cache = None
+        self._property_cache_depth = 0
+        self._property_cache_epoch = 0
+        self._results = dict()
+        self._command_registry = dict()
+        self._trace = TraceBuffer(self._TRACE_SIZE) if self._TRACE_SIZE else None
+
+        _patch_http_session()
+
+        with phase("communicator_connect"):
+            self._io = socketIO_client_nexus.SocketIO(host, port)
 
-        self._io = socketIO_client_nexus.SocketIO(host, port)
         self._io.on("return", self._handle_response)
+        self._io.on("job_progress", self._handle_job_progress)
+        self._io.on("job_finished", self._handle_job_finished)
+        self._io.on("reconnect", self._handle_reconnect)
 
         self._global_scope = None
         self._disconnect_callback = disconnect_callback
@@ -119,7 +226,8 @@ class Communicator(object):
         if disconnect_callback:
             self._io.on("disconnect", disconnect_callback)
 
-        self._get_global_scope()
+        with phase("get_global_scope"):
+            self._get_global_scope()
 
     ##########################################################################################
     # constructor
@@ -133,6 +241,16 @@ class Communicator(object):
         otherwise a new instance is constructed and returned after
         being recorded by the given identifier.
 
+        Instances released with detach() are handed out again to the first
+        caller with the same identifier, even from another import of the
+        framework, so that an engine restarted in-process gets back the live
+        connection of the previous engine, along with its global scope and
+        caches, rather than reconnecting. The disconnect_callback, logger,
+        network_debug and event_processor given are bound to the detached
+        instance, replacing those of its previous user. Detached instances
+        of another class, or of the same class from another version of the
+        framework, are disconnected instead.
+
         :param identifier: Some hashable identifier to associate
                            the instantiated communicator with.
         :param int port: The port to connect to. Default is 8090.
@@ -143,6 +261,27 @@ class Communicator(object):
         if identifier in cls._REGISTRY:
             instance = cls._REGISTRY[identifier]
             instance.logger.debug("Reusing Communicator by id '%s'" % identifier)
+            return instance
+
+        instance = _get_detached_registry().pop(identifier, None)
+
+        if instance is not None and not (
+            cls._is_compatible(instance) and instance._io.connected
+        ):
+            # either the server went away while the communicator was
+            # detached, or it isn't what the caller expects.
+            instance.logger.debug(
+                "Discarding detached Communicator by id '%s'" % identifier
+            )
+            instance.disconnect()
+            instance = None
+
+        if instance is not None:
+            instance._attach(**kwargs)
+            cls._REGISTRY[identifier] = instance
+            instance.logger.debug(
+                "Reusing detached Communicator by id '%s'" % identifier
+            )
         else:
             instance = cls(*args, **kwargs)
             instance._identifier = identifier
@@ -201,6 +340,16 @@ class Communicator(object):
         """
         return self._port
 
+    @property
+    def trace(self):
+        """
+        The TraceBuffer recording the commands sent and the responses
+        received, or None if tracing is turned off. Tracing is turned on by
+        setting the SHOTGUN_ADOBE_NETWORK_TRACE environment variable to the
+        number of records to keep.
+        """
+        return self._trace
+
     ##########################################################################################
     # context managers
 
@@ -216,15 +365,244 @@ class Communicator(object):
         yield
         self._response_logging_silenced = False
 
+    @contextlib.contextmanager
+    def cached(self, scope=CACHE_SESSION):
+        """
+        A context manager that tags the RPC reads made within it as
+        cacheable, allowing the server to answer them without going through
+        the host application when it already knows the result. Only reads
+        are cached: property gets, indexing, snapshots, trees and queries,
+        as well as calls, which are assumed to have no side effects when
+        made within this context. Tagging data that can change within its
+        scope will lead to stale results.
+
+        ..Example:
+            with communicator.cached(communicator.CACHE_SESSION):
+                version = communicator.app.version
+
+        :param str scope: Either CACHE_SESSION, for data that never changes
+                          while the host is running, or CACHE_DOCUMENT, for
+                          data read from documents. Document results are
+                          only reused by consecutive cached reads: they are
+                          dropped as soon as any other command is run, when
+                          documents are switched or saved, and after one
+                          second at most. Edits made by the user in the host
+                          may therefore go unnoticed for up to a second.
+
+        :raises: ValueError
+        """
+        if scope not in self.CACHE_SCOPES:
+            raise ValueError("Unknown RPC cache scope: %s" % scope)
+
+        previous = self._cache_scope
+        self._cache_scope = scope
+
+        try:
+            yield
+        finally:
+            self._cache_scope = previous
+
+    @contextlib.contextmanager
+    def property_cache(self):
+        """
+        A context manager that keeps the values of the remote properties
+        read within it, so that reading them again doesn't require a round
+        trip. Only the properties listed in CACHEABLE_PROPERTIES for the
+        type of their object, and methods, are kept. All values are
+        forgotten whenever a command that may change the state of the host
+        is emitted, like an assignment, a call or an evaluation, as well as
+        when invalidate_property_cache() is called, and on exit.
+
+        ..Example:
+            with communicator.property_cache():
+                doc = communicator.app.activeDocument
+                path = doc.fullName.fsName
+                ...
+                # No round trip.
+                doc = communicator.app.activeDocument
+        """
+        if self._property_cache_depth == 0:
+            self._property_cache = dict()
+
+        self._property_cache_depth += 1
+
+        try:
+            yield
+        finally:
+            self._property_cache_depth -= 1
+
+            if self._property_cache_depth == 0:
+                self._property_cache = None
+                self._property_cache_epoch += 1
+
+    @contextlib.contextmanager
+    def rpc_priority(self, priority):
+        """
+        A context manager that sets the priority class of the RPC commands
+        emitted within it. Commands default to PRIORITY_INTERACTIVE, and
+        jobs to PRIORITY_BULK.
+
+        ..Example:
+            with communicator.rpc_priority(communicator.PRIORITY_CONTROL):
+                doc = communicator.app.activeDocument
+
+        :param str priority: One of PRIORITY_CONTROL, PRIORITY_INTERACTIVE
+                             or PRIORITY_BULK.
+
+        :raises: ValueError
+        """
+        if priority not in self.PRIORITIES:
+            raise ValueError("Unknown RPC priority: %s" % priority)
+
+        previous = self._priority
+        self._priority = priority
+
+        try:
+            yield
+        finally:
+            self._priority = previous
+
+    @contextlib.contextmanager
+    def transaction(self, history_name=None):
+        """
+        A context manager that records the remote property assignments and
+        method calls made within it, rather than emitting them, and then
+        executes them all in a single RPC call on exit. When a history name
+        is given and the host supports it, the operations are grouped in a
+        single history state of the active document, which is reverted if
+        any of them fails. Nothing is executed if an exception is raised
+        within the block.
+
+        Assignments and calls made through proxy objects are recorded
+        automatically, and return a TransactionStep instead of a result.
+        Steps can be used as targets or arguments of later operations, and
+        hold the result of their operation once the transaction has run.
+        Property reads are not recorded: they still go through to the host,
+        and see the state from before the transaction.
+
+        ..Example:
+            with adobe.transaction("Rename layers") as tx:
+                copy = layer.duplicate()
+                tx.set(copy, "name", "Copy")
+                tx.set(copy, "opacity", 50)
+
+        :param str history_name: The name of the history state to group the
+                                 operations under.
+
+        :raises: RuntimeError
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Transactions can not be nested.")
+
+        transaction = Transaction(self, history_name)
+        self._transaction = transaction
+
+        try:
+            yield transaction
+        finally:
+            self._transaction = None
+
+        self.rpc_transaction(transaction)
+
     ##########################################################################################
     # RPC
 
+    def cancel_job(self, job):
+        """
+        Requests the cancellation of the given job. See Job.cancel() for
+        details.
+
+        :param job: The Job to cancel.
+        """
+        self.log_network_debug("Requesting the cancellation of %s", job)
+        self._io.emit("cancel_job", sgtk.util.json.dumps(job.id))
+
+    def detach(self):
+        """
+        Releases the communicator without disconnecting from the socket.io
+        server, so that get_or_create() can hand it out again, for instance
+        to an engine restarted in-process. The disconnect callback, logger
+        and event processor of the current user are forgotten, and the
+        communicator must not be used by it anymore.
+        """
+        self.log_network_debug("Detaching the communicator.")
+
+        if self._disconnect_callback:
+            self._io.off("disconnect")
+
+        self._disconnect_callback = None
+        self._event_processor = None
+        self._logger = logging.getLogger(__name__)
+
+        if self._REGISTRY.get(self._identifier) is self:
+            del self._REGISTRY[self._identifier]
+
+        _get_detached_registry()[self._identifier] = self
+
     def disconnect(self):
         """
         Disconnects from the socket.io server.
         """
         self._io.disconnect()
-        del self._REGISTRY[self._identifier]
+
+        if self._REGISTRY.get(self._identifier) is self:
+            del self._REGISTRY[self._identifier]
+
+        detached = _get_detached_registry()
+
+        if detached.get(self._identifier) is self:
+            del detached[self._identifier]
+
+    def invalidate_property_cache(self):
+        """
+        Forgets all of the property values kept by the property cache. This
+        must be called when the state of the host changes in ways that the
+        communicator doesn't know about, such as when the active document
+        changes.
+        """
+        self._property_cache_epoch += 1
+
+        if self._property_cache:
+            self.log_network_debug("Invalidating the property cache.")
+            self._property_cache.clear()
+
+    def invoke(self, name, *args):
+        """
+        Calls a function that was previously defined in the remote
+        process using prepare(). Any ordered arguments provided are
+        passed through to the function.
+
+        :param str name: The name the function was prepared under.
+
+        :returns: The data returned by the function.
+        :raises: ValueError, RuntimeError
+        """
+        if name not in self._prepared_functions:
+            raise ValueError("No function has been prepared as '%s'." % name)
+
+        self.log_network_debug("Sending an invoke message using invoke...")
+        self.log_network_debug("Invoking prepared function %s", name)
+
+        options = dict(
+            name=name,
+            args=self.__prepare_value(list(args)),
+        )
+
+        try:
+            return self.__run_rpc_command(
+                method="invoke",
+                proxy_object=None,
+                params=[options],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise RuntimeError(
+                "Failed to invoke prepared function %s with arguments %s"
+                % (
+                    name,
+                    list(args),
+                )
+            )
 
     def ping(self):
         """
@@ -232,6 +610,43 @@ class Communicator(object):
         """
         self._io._ping()
 
+    def prepare(self, name, source):
+        """
+        Defines a named function in the remote process, which can then be
+        called any number of times using invoke(). The source is sent and
+        parsed only once, which is much cheaper than using rpc_eval() for
+        snippets that are run repeatedly.
+
+        ..Example:
+            communicator.prepare(
+                "get_layer_names",
+                "function(doc) { var n = []; "
+                "for (var i=0; i<doc.layers.length; i++) n.push(doc.layers[i].name); "
+                "return n.join(','); }",
+            )
+            names = communicator.invoke("get_layer_names", doc)
+
+        :param str name: The name to register the function under. Preparing
+                         a function under an existing name replaces it.
+        :param str source: The source code of a function expression.
+
+        :raises: RuntimeError
+        """
+        self.log_network_debug("Sending a prepare message using prepare...")
+        self.log_network_debug("Preparing function %s: %s", name, source)
+
+        try:
+            self.__run_rpc_command(
+                method="prepare",
+                proxy_object=None,
+                params=[name, source],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise RuntimeError("Failed to prepare function %s: %s" % (name, source))
+
+        self._prepared_functions[name] = source
+
     def process_new_messages(self, wait=0.01, single_loop=False, process_events=True):
         """
         Processes new messages that have arrived but that have not been
@@ -246,7 +661,7 @@ class Communicator(object):
                                     will be called at the end of the wait
                                     duration.
         """
-        self.log_network_debug("Processing new messages, wait is %s" % wait)
+        self.log_network_debug("Processing new messages, wait is %s", wait)
 
         try:
             self._io._heartbeat_thread.hurry()
@@ -296,11 +711,16 @@ class Communicator(object):
                   called.
         :raises: RuntimeError
         """
+        if self._transaction is not None:
+            return self._transaction.call(
+                parent, proxy_object.data.get("name"), *params
+            )
+
         self.log_network_debug("Sending a call message using rpc_call...")
 
         if parent:
             params.insert(0, parent.uid)
-            self.log_network_debug("Parent given, UID is %s" % parent.uid)
+            self.log_network_debug("Parent given, UID is %s", parent.uid)
         else:
             self.log_network_debug("No parent given.")
             params.insert(0, None)
@@ -326,6 +746,108 @@ class Communicator(object):
                 )
             raise RuntimeError(msg)
 
+    def rpc_call_async(self, proxy_object, params=None, parent=None):
+        """
+        Executes a "call" RPC command as a job. Unlike rpc_call(), this
+        returns as soon as the server has started the job, without waiting
+        for the callable to complete. This is meant for long-running calls,
+        such as saving or exporting large documents, which would otherwise
+        block the caller until they are done.
+
+        ..Example:
+            job = communicator.rpc_call_async(doc.saveAs, [file_obj], parent=doc)
+            job.add_done_callback(on_saved)
+            ...
+            job.result()
+
+        :param proxy_object: The proxy object to call via RPC.
+        :param list params: The list of arguments to pass to the
+                            callable when it is called.
+        :param parent: The parent proxy object, if any. If given, the
+                       callable will be called as a method of the
+                       parent object. If a parent is not given, it
+                       will be called as a function of the global
+                       scope.
+
+        :returns: A Job tracking the call.
+        :raises: RuntimeError
+        """
+        self.log_network_debug("Sending a call message using rpc_call_async...")
+
+        params = list(params or [])
+
+        if parent:
+            params.insert(0, parent.uid)
+            description = "call of %s bound to %s" % (proxy_object, parent)
+        else:
+            params.insert(0, None)
+            description = "call of %s" % proxy_object
+
+        return self.__start_job(
+            method="call",
+            proxy_object=proxy_object,
+            params=params,
+            description=description,
+        )
+
+    def rpc_call_many(self, proxy_objects, method_name, args_list=None):
+        """
+        Calls the method of the given name on each of the given proxy
+        objects, in a single RPC call. A failed call does not prevent the
+        other calls from being made.
+
+        ..Example:
+            communicator.rpc_call_many(layers, "translate", [[10, 0]] * len(layers))
+
+        :param list proxy_objects: The proxy objects to call the method on.
+        :param str method_name: The name of the method to call.
+        :param list args_list: A list holding the list of arguments to call
+                               the method with for each object. If not
+                               given, the method is called without
+                               arguments.
+
+        :returns: A list holding, for each object, the data returned by the
+                  method, or a RuntimeError describing why the call failed.
+        :rtype: list
+        :raises: ValueError, RuntimeError
+        """
+        proxy_objects = list(proxy_objects)
+
+        if args_list is None:
+            args_list = [[]] * len(proxy_objects)
+
+        if len(args_list) != len(proxy_objects):
+            raise ValueError(
+                "Got %d argument lists for %d objects."
+                % (len(args_list), len(proxy_objects))
+            )
+
+        self.log_network_debug("Sending a call_many message using rpc_call_many...")
+        self.log_network_debug(
+            "Calling method %s on %d objects", method_name, len(proxy_objects)
+        )
+
+        options = dict(
+            uids=[proxy_object.uid for proxy_object in proxy_objects],
+            name=method_name,
+            args=[self.__prepare_value(list(args)) for args in args_list],
+        )
+
+        try:
+            results = self.__run_rpc_command(
+                method="call_many",
+                proxy_object=None,
+                params=[options],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise RuntimeError(
+                "Failed to call method %s on %d objects"
+                % (method_name, len(proxy_objects))
+            )
+
+        return self.__unpack_many_results(results)
+
     def rpc_is_equal(self, left, right):
         """
         Checks the equality of the given left and right values. If the
@@ -365,7 +887,7 @@ class Communicator(object):
                 wrapper_class=ProxyWrapper,
             )
         except RuntimeError:
-            self.log_network_debug("Comparison of packages failed: %s" % packages)
+            self.log_network_debug("Comparison of packages failed: %s", packages)
             raise ValueError("Unable to compare packages.")
 
     def rpc_eval(self, command):
@@ -378,7 +900,7 @@ class Communicator(object):
         :raises: RuntimeError
         """
         self.log_network_debug("Sending an eval message using rpc_eval...")
-        self.log_network_debug("Command is: %s" % command)
+        self.log_network_debug("Command is: %s", command)
 
         try:
             return self.__run_rpc_command(
@@ -390,6 +912,29 @@ class Communicator(object):
         except RuntimeError:
             raise RuntimeError("Evaluation failed: %s" % command)
 
+    def rpc_eval_async(self, command):
+        """
+        Evaluates the given string command via RPC as a job. Unlike
+        rpc_eval(), this returns as soon as the server has started the job,
+        without waiting for the evaluation to complete. Long-running
+        commands can report their progress by calling
+        rpc_report_progress(progress, message) in the remote process.
+
+        :param str command: The command to execute.
+
+        :returns: A Job tracking the evaluation.
+        :raises: RuntimeError
+        """
+        self.log_network_debug("Sending an eval message using rpc_eval_async...")
+        self.log_network_debug("Command is: %s", command)
+
+        return self.__start_job(
+            method="eval",
+            proxy_object=None,
+            params=[command],
+            description="evaluation of %s" % command,
+        )
+
     def rpc_get(self, proxy_object, property_name):
         """
         Gets the value of the given property for the given proxy
@@ -402,13 +947,23 @@ class Communicator(object):
         :returns: The value of the property of the remote object.
         :raises: AttributeError
         """
+        cache_key = self.__property_cache_key(proxy_object, property_name)
+
+        if cache_key is not None and cache_key in self._property_cache:
+            return self._property_cache[cache_key]
+
         self.log_network_debug("Sending a get message using rpc_get...")
         self.log_network_debug(
-            "Getting property %s from object UID %s" % (property_name, proxy_object.uid)
+            "Getting property %s from object UID %s", property_name, proxy_object.uid
         )
 
+        # Other messages are processed while waiting for the response, and
+        # some of them may invalidate the cache, in which case the value we
+        # get can't be trusted to still be current.
+        epoch = self._property_cache_epoch
+
         try:
-            return self.__run_rpc_command(
+            value = self.__run_rpc_command(
                 method="get",
                 proxy_object=proxy_object,
                 params=[property_name],
@@ -424,6 +979,11 @@ class Communicator(object):
                 )
             )
 
+        if cache_key is not None and epoch == self._property_cache_epoch:
+            self._property_cache[cache_key] = value
+
+        return value
+
     def rpc_get_index(self, proxy_object, index):
         """
         Gets the value at the given index of the given proxy object.
@@ -436,7 +996,7 @@ class Communicator(object):
         """
         self.log_network_debug("Sending a get_index message using rpc_get_index...")
         self.log_network_debug(
-            "Getting index %s of object UID %s" % (index, proxy_object.uid)
+            "Getting index %s of object UID %s", index, proxy_object.uid
         )
 
         try:
@@ -455,6 +1015,73 @@ class Communicator(object):
                 )
             )
 
+    def rpc_get_tree(
+        self,
+        proxy_object,
+        children_property,
+        fields,
+        max_depth=None,
+        include_handles=False,
+    ):
+        """
+        Gets the tree of remote objects found under the given child
+        collection of the given proxy object, in a single RPC call. Each
+        node of the tree is a dictionary holding the requested fields as
+        plain data, a "children" list if the item has children of its own,
+        and a "handle" proxy object if handles were requested.
+
+        ..Example:
+            communicator.rpc_get_tree(doc, "layers", ["name", "visible"])
+
+        :param proxy_object: The proxy object at the root of the tree.
+        :param str children_property: The name of the property holding
+                                      the child collection of each item.
+        :param list fields: The property names or dotted property paths
+                            to get for each item. Fields that can't be read
+                            on an item are omitted from its node.
+        :param int max_depth: The number of levels to get. If not given,
+                              the whole tree is returned.
+        :param bool include_handles: Whether to include a proxy object for
+                                     each item in the tree. Wrapping items
+                                     is costly, so this is off by default.
+
+        :returns: The list of nodes found under the root object.
+        :rtype: list
+        :raises: AttributeError
+        """
+        self.log_network_debug("Sending a tree message using rpc_get_tree...")
+        self.log_network_debug(
+            "Getting %s tree of object UID %s", children_property, proxy_object.uid
+        )
+
+        options = dict(
+            children=children_property,
+            fields=list(fields),
+            max_depth=-1 if max_depth is None else int(max_depth),
+            handles=bool(include_handles),
+        )
+
+        try:
+            nodes = self.__run_rpc_command(
+                method="tree",
+                proxy_object=proxy_object,
+                params=[options],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise AttributeError(
+                "Failed to get the %s tree of object %s"
+                % (
+                    children_property,
+                    proxy_object,
+                )
+            )
+
+        if include_handles:
+            self._wrap_tree_handles(nodes)
+
+        return nodes
+
     def rpc_new(self, class_name, *args):
         """
         Instantiates a new remote object of the given class name.
@@ -466,7 +1093,7 @@ class Communicator(object):
         :raises: RuntimeError
         """
         self.log_network_debug("Sending a 'new' message using rpc_new...")
-        self.log_network_debug("Instantiating class %s" % class_name)
+        self.log_network_debug("Instantiating class %s", class_name)
 
         try:
             return self.__run_rpc_command(
@@ -478,6 +1105,86 @@ class Communicator(object):
         except RuntimeError:
             raise RuntimeError("Failed to instantiate %s" % class_name)
 
+    def rpc_query(
+        self,
+        collection,
+        where=None,
+        select=None,
+        include_handles=False,
+        recursive=False,
+        children_property=None,
+    ):
+        """
+        Searches the given remote collection for the items matching the
+        given conditions. The filtering happens in the remote process, so
+        that only the matches are sent back.
+
+        ..Example:
+            communicator.rpc_query(
+                doc.layers,
+                where={"visible": True, "kind": "LayerKind.TEXT"},
+                select=["name"],
+                recursive=True,
+                children_property="layers",
+            )
+
+        :param collection: The proxy object of the collection to search.
+        :param dict where: The conditions that items must match, mapping
+                           property names or dotted property paths to the
+                           expected plain data values, as they would be
+                           returned by rpc_snapshot(). If not given, all
+                           items match.
+        :param list select: The property names or dotted property paths to
+                            get for each match. If not given, the proxy
+                            objects of the matching items are returned.
+        :param bool include_handles: Whether to include a proxy object for
+                                     each match under the "handle" key when
+                                     a selection is given.
+        :param bool recursive: Whether to also search the child collection
+                               of each item.
+        :param str children_property: The name of the property holding the
+                                      child collection of each item. This
+                                      is required for recursive queries.
+
+        :returns: A list of proxy objects, or a list of dictionaries of
+                  selected values if a selection was given.
+        :rtype: list
+        :raises: ValueError, RuntimeError
+        """
+        if recursive and not children_property:
+            raise ValueError("A children property is required for recursive queries.")
+
+        self.log_network_debug("Sending a query message using rpc_query...")
+        self.log_network_debug(
+            "Querying collection UID %s where %s", collection.uid, where
+        )
+
+        options = dict(
+            where=dict(where or {}),
+            select=list(select or []),
+            handles=bool(include_handles),
+            recursive=bool(recursive),
+            children=children_property,
+        )
+
+        try:
+            matches = self.__run_rpc_command(
+                method="query",
+                proxy_object=collection,
+                params=[options],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise RuntimeError("Failed to query %s where %s" % (collection, where))
+
+        if not select:
+            return [ProxyWrapper(match, self) for match in matches]
+
+        if include_handles:
+            self._wrap_tree_handles(matches)
+
+        return matches
+
     def rpc_set(self, proxy_object, property_name, value):
         """
         Sets the given property to the given value on the given proxy
@@ -489,10 +1196,15 @@ class Communicator(object):
 
         :raises: AttributeError
         """
+        if self._transaction is not None:
+            return self._transaction.set(proxy_object, property_name, value)
+
         self.log_network_debug("Sending a set message using rpc_set...")
         self.log_network_debug(
-            "Setting property %s to %s for object UID %s"
-            % (property_name, value, proxy_object.uid)
+            "Setting property %s to %s for object UID %s",
+            property_name,
+            value,
+            proxy_object.uid,
         )
 
         try:
@@ -512,6 +1224,146 @@ class Communicator(object):
                 )
             )
 
+    def rpc_set_many(self, proxy_objects, property_name, values):
+        """
+        Sets the given property on each of the given proxy objects, in a
+        single RPC call. A failure to set one of the values does not prevent
+        the others from being set.
+
+        ..Example:
+            communicator.rpc_set_many(layers, "visible", [False] * len(layers))
+
+        :param list proxy_objects: The proxy objects to set the property of.
+        :param str property_name: The name of the property to set.
+        :param list values: The values to set the property to, one per
+                            proxy object.
+
+        :returns: A list holding, for each object, None if the value was
+                  set, or a RuntimeError describing why it failed.
+        :rtype: list
+        :raises: ValueError, RuntimeError
+        """
+        proxy_objects = list(proxy_objects)
+        values = list(values)
+
+        if len(values) != len(proxy_objects):
+            raise ValueError(
+                "Got %d values for %d objects." % (len(values), len(proxy_objects))
+            )
+
+        self.log_network_debug("Sending a set_many message using rpc_set_many...")
+        self.log_network_debug(
+            "Setting property %s on %d objects", property_name, len(proxy_objects)
+        )
+
+        options = dict(
+            uids=[proxy_object.uid for proxy_object in proxy_objects],
+            name=property_name,
+            values=self.__prepare_value(values),
+        )
+
+        try:
+            results = self.__run_rpc_command(
+                method="set_many",
+                proxy_object=None,
+                params=[options],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise RuntimeError(
+                "Failed to set property %s on %d objects"
+                % (property_name, len(proxy_objects))
+            )
+
+        return self.__unpack_many_results(results)
+
+    def rpc_snapshot(self, proxy_object, property_names=None):
+        """
+        Gets the values of several properties of the given proxy object
+        in a single RPC call. Property names can be dotted paths, such
+        as "fullName.fsName". Values are returned as plain data: anything
+        that isn't a primitive, like an enumerator value, is returned as
+        its string representation. Properties that can't be read on the
+        remote object are omitted from the result.
+
+        :param proxy_object: The proxy object to get the property
+                             values from.
+        :param list property_names: The names of the properties to get.
+                                    If not given, all properties holding
+                                    a primitive value are returned.
+
+        :returns: A dictionary of property names and values.
+        :rtype: dict
+        :raises: AttributeError
+        """
+        property_names = list(property_names or [])
+
+        self.log_network_debug("Sending a snapshot message using rpc_snapshot...")
+        self.log_network_debug(
+            "Getting properties %s from object UID %s",
+            property_names or "(all)",
+            proxy_object.uid,
+        )
+
+        try:
+            return self.__run_rpc_command(
+                method="snapshot",
+                proxy_object=proxy_object,
+                params=property_names,
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise AttributeError(
+                "Failed to get properties %s of object %s"
+                % (
+                    property_names,
+                    proxy_object,
+                )
+            )
+
+    def rpc_transaction(self, transaction):
+        """
+        Executes the operations recorded in the given transaction in a
+        single RPC call, and records the data returned by each of them on
+        the transaction. It is usually more convenient to use the
+        transaction() context manager than to call this directly.
+
+        :param transaction: The Transaction to execute.
+
+        :raises: RuntimeError
+        """
+        self.log_network_debug("Sending a transaction message using rpc_transaction...")
+        self.log_network_debug("Executing %d operations", len(transaction.operations))
+
+        if not transaction.operations:
+            transaction.results = []
+            return
+
+        options = dict(
+            operations=transaction.operations,
+            history_name=transaction.history_name,
+        )
+
+        try:
+            results = self.__run_rpc_command(
+                method="transaction",
+                proxy_object=None,
+                params=[options],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            raise RuntimeError("Failed to execute transaction %s" % transaction)
+
+        if "error" in results:
+            raise RuntimeError(
+                "Transaction %s failed: %s" % (transaction, results["error"])
+            )
+
+        transaction.results = [
+            None if result is None else ProxyWrapper(result, self)
+            for result in results["results"]
+        ]
+
     def wait(self, timeout=0.1, single_loop=False, process_events=True):
         """
         Triggers a wait and the processing of any messages already
@@ -527,9 +1379,9 @@ class Communicator(object):
                                     will be called at the end of the wait
                                     duration.
         """
-        self.log_network_debug("Triggering a wait of duration %s" % timeout)
-        self.log_network_debug("single_loop is %s" % single_loop)
-        self.log_network_debug("process_events is %s" % process_events)
+        self.log_network_debug("Triggering a wait of duration %s", timeout)
+        self.log_network_debug("single_loop is %s", single_loop)
+        self.log_network_debug("process_events is %s", process_events)
         self.process_new_messages(
             wait=float(timeout),
             single_loop=single_loop,
@@ -539,18 +1391,88 @@ class Communicator(object):
     ##########################################################################################
     # logging
 
-    def log_network_debug(self, msg):
+    def log_network_debug(self, msg, *args):
         """
-        Logs a debug message if 'network_debug' is turned on.
-
-        :param str msg: The log message.
+        Logs a debug message if 'network_debug' is turned on. The message is
+        only formatted with the given arguments if it is actually logged, so
+        callers should pass the arguments rather than format the message
+        themselves.
+
+        :param str msg: The log message, a %-style format string if
+                        arguments are given.
+        :param args: The arguments to format the message with.
         """
-        if self.network_debug:
-            self.logger.debug(msg)
+        if self._network_debug and self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(msg, *args)
 
     ##########################################################################################
     # internal methods
 
+    @classmethod
+    def _is_compatible(cls, instance):
+        """
+        Whether the given communicator can be handed out by get_or_create()
+        of this class. It must be an instance of this class, or of a class
+        defined by the same source file under the same name, which is the
+        case when the framework has been imported again under another
+        module name.
+
+        :param instance: The communicator to check.
+
+        :rtype: bool
+        """
+        if isinstance(instance, cls):
+            return True
+
+        for instance_class in type(instance).__mro__:
+            if instance_class.__qualname__ != cls.__qualname__:
+                continue
+
+            try:
+                paths = [inspect.getsourcefile(c) for c in (instance_class, cls)]
+            except TypeError:
+                return False
+
+            return None not in paths and (
+                os.path.realpath(paths[0]) == os.path.realpath(paths[1])
+            )
+
+        return False
+
+    def _attach(
+        self,
+        disconnect_callback=None,
+        logger=None,
+        network_debug=None,
+        event_processor=None,
+        **kwargs,
+    ):
+        """
+        Binds the given settings of a new user of a detached communicator,
+        as given to get_or_create(). The settings not given are left
+        unchanged.
+
+        :param disconnect_callback: A callback to call if a disconnect
+                                    message is received from the host.
+        :param logger: A standard Python logger to use for network debug
+                       logging.
+        :param bool network_debug: Whether network debug logging is desired.
+        :param event_processor: A callable that will be called during each
+                                iteration of the response wait loop.
+        """
+        if disconnect_callback is not None:
+            self._disconnect_callback = disconnect_callback
+            self._io.on("disconnect", disconnect_callback)
+
+        if logger is not None:
+            self._logger = logger
+
+        if network_debug is not None:
+            self.network_debug = network_debug
+
+        if event_processor is not None:
+            self._event_processor = event_processor
+
     def _get_global_scope(self):
         """
         Emits a message requesting that the remote global scope be
@@ -558,13 +1480,14 @@ class Communicator(object):
         """
         self.log_network_debug("Getting the remote global scope...")
         payload = self._get_payload("get_global_scope")
-        self.log_network_debug("Payload: %s" % payload)
+        self.log_network_debug("Payload: %s", payload)
 
+        self._command_registry[payload["id"]] = payload
         self._io.emit(self._RPC_EXECUTE_COMMAND, payload)
         uid = payload["id"]
         results = self._wait_for_response(uid)
 
-        self.log_network_debug("Raw data response: %s" % results)
+        self.log_network_debug("Raw data response: %s", results)
 
         self._global_scope = ProxyScope(results, self)
 
@@ -595,45 +1518,102 @@ class Communicator(object):
         else:
             payload["params"] = self.__prepare_params(params)
 
-        self.log_network_debug("Payload constructed: %s" % payload)
+        options = dict()
+
+        if self._priority is not None:
+            options["priority"] = self._priority
+
+        if self._cache_scope is not None:
+            options["cache"] = self._cache_scope
+
+        if options:
+            payload["options"] = options
+
+        self.log_network_debug("Payload constructed: %s", payload)
 
         return payload
 
     def _handle_response(self, response, *args):
         """
-        Handles the response to an already-emitted message.
+        Handles the response to an already-emitted message. The server may
+        batch several responses into a single message, in which case each
+        of them is handled in turn.
 
         :param str response: The JSON encoded message response.
-
-        :returns: The decoded result data.
         """
         self.log_network_debug("Handling RPC response...")
 
-        result = sgtk.util.json.loads(response)
-        uid = result["id"]
-        self.log_network_debug("Response UID is %s" % uid)
+        results = sgtk.util.json.loads(response)
 
-        try:
-            self._RESULTS[uid] = sgtk.util.json.loads(result["result"])
-        except (TypeError, ValueError):
-            # TODO: This feels like it would cause an error later if the result is a string. We need
-            #  further clarification on what this catch is trying to achieve.
-            result = result.get("result")
-            self._RESULTS[uid] = result
-        except KeyError:
+        if not isinstance(results, list):
+            results = [results]
+
+        for result in results:
+            self.__record_result(result, response)
+
+    def _handle_job_finished(self, response, *args):
+        """
+        Handles the completion of a job started by this communicator.
+
+        :param str response: The JSON encoded message.
+        """
+        data = sgtk.util.json.loads(response)
+        job = self._jobs.pop(data["job_id"], None)
+
+        # The server only reports jobs to the client that started them, but
+        # a job is forgotten if its job_start call failed on our side after
+        # the server had started it.
+        if job is None:
+            return
+
+        self.log_network_debug("Job finished: %s", data)
+        self.invalidate_property_cache()
+
+        if data["state"] == Job.DONE:
+            try:
+                result = sgtk.util.json.loads(data["result"])
+            except (TypeError, ValueError):
+                result = data.get("result")
+            job._set_result(ProxyWrapper(result, self))
+        elif data["state"] == Job.FAILED:
             if not self._response_logging_silenced:
-                self.logger.error("RPC command (UID=%s) failed!" % uid)
-                self.logger.debug(
-                    "Failed command payload: %s" % self._COMMAND_REGISTRY[uid]
-                )
+                self.logger.error("RPC job %s failed!" % job)
                 self.logger.debug("Failure raw response: %s" % response)
-                self.logger.debug("Failure results: %s" % result)
-            # This is all happening with a deal of asynchronicity, so we
-            # don't want to raise here. We'll record that an error occurred,
-            # but let the listener decide how and when to raise.
-            self._RESULTS[uid] = RuntimeError()
+            job._set_error(RuntimeError("Failed %s" % job))
+        else:
+            job._set_cancelled()
 
-        self.log_network_debug("Processed response data: %s" % self._RESULTS[uid])
+    def _handle_job_progress(self, response, *args):
+        """
+        Handles a progress report for a job started by this communicator.
+
+        :param str response: The JSON encoded message.
+        """
+        data = sgtk.util.json.loads(response)
+        job = self._jobs.get(data["job_id"])
+
+        if job is not None:
+            job._set_progress(data["progress"], data.get("message"))
+
+    def _handle_reconnect(self, *args):
+        """
+        Handles the reconnection of the socket.io client to the server after
+        the connection was lost. Subclasses can reimplement this to restore
+        any state the server needs to know about.
+        """
+        self.logger.debug("Reconnected to the server.")
+
+    def _wrap_tree_handles(self, nodes):
+        """
+        Replaces the raw handle data of each node of a serialized tree with
+        the proxy object it describes, in place.
+
+        :param list nodes: The list of tree nodes to process.
+        """
+        for node in nodes:
+            if "handle" in node:
+                node["handle"] = ProxyWrapper(node["handle"], self)
+            self._wrap_tree_handles(node.get("children", []))
 
     def _wait_for_response(self, uid):
         """
@@ -643,9 +1623,9 @@ class Communicator(object):
 
         :returns: The raw returned results data.
         """
-        self.log_network_debug("Waiting for RPC response for UID %s..." % uid)
+        self.log_network_debug("Waiting for RPC response for UID %s...", uid)
 
-        while uid not in self._RESULTS:
+        while uid not in self._results:
             # If we were given an event processor, we can call that here. That
             # will be something like QApplication.processEvents, which will
             # force an iteration of the Qt event loop so that we're not
@@ -655,10 +1635,9 @@ class Communicator(object):
 
             self.wait(single_loop=True, process_events=False)
 
-        results = self._RESULTS[uid]
-        del self._RESULTS[uid]
+        results = self._results.pop(uid)
 
-        self.log_network_debug("Results arrived for UID %s" % uid)
+        self.log_network_debug("Results arrived for UID %s", uid)
         return results
 
     ##########################################################################################
@@ -694,6 +1673,153 @@ class Communicator(object):
 
         return processed
 
+    def __prepare_value(self, value):
+        """
+        Prepares a single value to be emitted as part of an RPC call. Unlike
+        __prepare_params(), nested lists are preserved as they are.
+
+        :param value: The value to prepare.
+
+        :returns: The prepared value, fit for emission.
+        """
+        if isinstance(value, (list, tuple)):
+            return [self.__prepare_value(item) for item in value]
+        elif isinstance(value, ProxyWrapper):
+            return value.data
+        else:
+            return value
+
+    def __start_job(self, method, proxy_object, params, description):
+        """
+        Starts running the requested JSON-RPC method as a job.
+
+        :param str method: The JSON-RPC method name to run.
+        :param proxy_object: The proxy object to send.
+        :param list params: The list of parameters to emit.
+        :param str description: A description of the command, used in
+                                messages.
+
+        :returns: A Job tracking the command.
+        :raises: RuntimeError
+        """
+        command = self._get_payload(
+            method=method,
+            proxy_object=proxy_object,
+            params=params,
+        )
+
+        job = Job(self, command["id"], description)
+        self._jobs[job.id] = job
+
+        options = dict(
+            job_id=job.id,
+            method=method,
+            params=command["params"],
+            priority=self._priority or self.PRIORITY_BULK,
+        )
+
+        try:
+            self.__run_rpc_command(
+                method="job_start",
+                proxy_object=None,
+                params=[options],
+                wrapper_class=ProxyWrapper,
+            )
+        except RuntimeError:
+            del self._jobs[job.id]
+            raise RuntimeError("Failed to start a job for the %s" % description)
+
+        self.log_network_debug("Started %s", job)
+        return job
+
+    def __unpack_many_results(self, results):
+        """
+        Converts the per-item results of a vectorized RPC call into the
+        returned data, wrapped as needed, or a RuntimeError for failed items.
+
+        :param list results: The raw per-item results.
+
+        :returns: The list of unpacked results.
+        """
+        unpacked = []
+
+        for result in results:
+            if "error" in result:
+                unpacked.append(RuntimeError(result["error"]))
+            elif result.get("result") is not None:
+                unpacked.append(ProxyWrapper(result["result"], self))
+            else:
+                unpacked.append(None)
+
+        return unpacked
+
+    def __property_cache_key(self, proxy_object, property_name):
+        """
+        Gets the key to keep the value of the given property under in the
+        property cache.
+
+        :param proxy_object: The proxy object the property belongs to.
+        :param str property_name: The name of the property.
+
+        :returns: The cache key, or None if the property cache is disabled
+                  or the property can't be cached.
+        """
+        if self._property_cache is None:
+            return None
+
+        data = proxy_object.data
+
+        if property_name in data.get("methods", {}) or property_name in (
+            self.CACHEABLE_PROPERTIES.get(data.get("instanceof"), ())
+        ):
+            return (proxy_object.uid, property_name)
+
+        return None
+
+    def __record_result(self, result, response):
+        """
+        Records the result data of a single RPC command response, for the
+        command's caller to pick up.
+
+        :param dict result: The decoded JSON-RPC response.
+        :param str response: The raw message the response arrived in.
+        """
+        uid = result["id"]
+        self.log_network_debug("Response UID is %s", uid)
+
+        payload = self._command_registry.pop(uid, None)
+
+        if payload is None:
+            # Older servers broadcast every response to every client, so
+            # this may well be the response to some other client's command.
+            self.log_network_debug("Ignoring response to unknown UID %s", uid)
+            return
+
+        if self._trace is not None:
+            self._trace.record(
+                TraceBuffer.RECEIVE, uid, payload["method"], len(response)
+            )
+
+        try:
+            self._results[uid] = sgtk.util.json.loads(result["result"])
+        except (TypeError, ValueError):
+            # TODO: This feels like it would cause an error later if the result is a string. We need
+            #  further clarification on what this catch is trying to achieve.
+            result = result.get("result")
+            self._results[uid] = result
+        except KeyError:
+            if not self._response_logging_silenced:
+                self.logger.error("RPC command (UID=%s) failed!" % uid)
+                self.logger.debug("Failed command payload: %s", payload)
+                self.logger.debug("Failure raw response: %s", response)
+                self.logger.debug("Failure results: %s", result)
+            # This is all happening with a deal of asynchronicity, so we
+            # don't want to raise here. We'll record that an error occurred,
+            # but let the listener decide how and when to raise.
+            self._results[uid] = RuntimeError()
+
+        self.log_network_debug("Processed response data: %s", self._results[uid])
+
     def __run_rpc_command(
         self, method, proxy_object, params, wrapper_class, attach_parent=None
     ):
@@ -717,7 +1843,13 @@ class Communicator(object):
             params=params,
         )
 
-        self._COMMAND_REGISTRY[payload["id"]] = payload
+        self._command_registry[payload["id"]] = payload
+
+        if method in self._MUTATING_METHODS:
+            self.invalidate_property_cache()
+
+        if self._trace is not None:
+            self._trace.record(TraceBuffer.SEND, payload["id"], method)
 
         self._io.emit(self._RPC_EXECUTE_COMMAND, payload)
         results = self._wait_for_response(payload["id"])
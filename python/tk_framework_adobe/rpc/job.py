@@ -0,0 +1,244 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+import time
+
+
+class Job(object):
+    """
+    A handle on a long-running RPC command executed in the background by the
+    server. The command is submitted without waiting for it to complete, and
+    its progress and completion are pushed back to the communicator, which
+    updates the job as those messages are processed.
+
+    Jobs can be polled using done(), awaited using wait() or result(), or
+    given callbacks to call on completion. Note that progress and completion
+    are only noticed while the communicator processes new messages, which
+    happens during other RPC calls, wait() calls, or in the host engine's
+    regular message processing.
+    """
+
+    # The job has been submitted but has not started running.
+    PENDING = "pending"
+    # The job is being executed by the host application.
+    RUNNING = "running"
+    # The job completed successfully. Its result is available.
+    DONE = "done"
+    # The job failed. Its error is available.
+    FAILED = "failed"
+    # The job was cancelled before completing.
+    CANCELLED = "cancelled"
+
+    def __init__(self, communicator, job_id, description):
+        """
+        Constructor.
+
+        :param communicator: The Communicator that submitted the job.
+        :param int job_id: The unique id of the job.
+        :param str description: A description of the job's command, used
+                                in error messages.
+        """
+        self._communicator = communicator
+        self._id = job_id
+        self._description = description
+        self._state = self.PENDING
+        self._progress = 0.0
+        self._message = None
+        self._result = None
+        self._error = None
+        self._done_callbacks = []
+
+    ##########################################################################################
+    # properties
+
+    @property
+    def error(self):
+        """
+        The exception describing why the job failed, or None.
+        """
+        return self._error
+
+    @property
+    def id(self):
+        """
+        The unique id of the job.
+        """
+        return self._id
+
+    @property
+    def message(self):
+        """
+        The last progress message reported for the job, if any.
+        """
+        return self._message
+
+    @property
+    def progress(self):
+        """
+        The last progress value reported for the job, from 0.0 to 1.0.
+        """
+        return self._progress
+
+    @property
+    def state(self):
+        """
+        The current state of the job: PENDING, RUNNING, DONE, FAILED or
+        CANCELLED.
+        """
+        return self._state
+
+    ##########################################################################################
+    # public methods
+
+    def add_done_callback(self, callback):
+        """
+        Registers a callable to call with the job once it is finished. If
+        the job is already finished, the callable is called immediately.
+
+        :param callback: The callable to register.
+        """
+        if self.done():
+            callback(self)
+        else:
+            self._done_callbacks.append(callback)
+
+    def cancel(self):
+        """
+        Requests the cancellation of the job. A job that has not started
+        yet is dropped by the server. The host application can not be
+        interrupted, so a job that has already started runs to completion,
+        but it is still reported as cancelled and its result is discarded.
+        The job's state changes once the server has acknowledged the
+        request.
+        """
+        if not self.done():
+            self._communicator.cancel_job(self)
+
+    def done(self):
+        """
+        Whether the job is finished, whether it completed, failed, or was
+        cancelled.
+
+        :rtype: bool
+        """
+        return self._state in (self.DONE, self.FAILED, self.CANCELLED)
+
+    def result(self, timeout=None):
+        """
+        Waits for the job to finish and returns its result.
+
+        :param float timeout: The maximum duration to wait for, in seconds.
+                              If not given, waits until the job finishes.
+
+        :returns: The data returned by the job's command.
+        :raises: RuntimeError if the job failed or was cancelled, and
+                 TimeoutError if it didn't finish in time.
+        """
+        if not self.wait(timeout):
+            raise TimeoutError("Timed out waiting for %s." % self)
+
+        if self._state == self.CANCELLED:
+            raise RuntimeError("%s was cancelled." % self)
+        elif self._state == self.FAILED:
+            raise self._error
+
+        return self._result
+
+    def wait(self, timeout=None):
+        """
+        Processes new messages until the job is finished.
+
+        :param float timeout: The maximum duration to wait for, in seconds.
+                              If not given, waits until the job finishes.
+
+        :returns: Whether the job is finished.
+        :rtype: bool
+        """
+        start = time.time()
+
+        while not self.done():
+            if timeout is not None and (time.time() - start) >= timeout:
+                break
+            self._communicator.wait(single_loop=True)
+
+        return self.done()
+
+    ##########################################################################################
+    # internal methods
+
+    def _set_cancelled(self):
+        """
+        Marks the job as cancelled.
+        """
+        self._state = self.CANCELLED
+        self._finish()
+
+    def _set_error(self, error):
+        """
+        Marks the job as failed.
+
+        :param error: The exception describing why the job failed.
+        """
+        self._state = self.FAILED
+        self._error = error
+        self._finish()
+
+    def _set_progress(self, progress, message=None):
+        """
+        Records the progress reported for the job, which also means that it
+        is running.
+
+        :param float progress: The progress value, from 0.0 to 1.0.
+        :param str message: An optional progress message.
+        """
+        self._state = self.RUNNING
+        self._progress = float(progress)
+
+        if message is not None:
+            self._message = message
+
+    def _set_result(self, result):
+        """
+        Marks the job as completed.
+
+        :param result: The data returned by the job's command.
+        """
+        self._state = self.DONE
+        self._progress = 1.0
+        self._result = result
+        self._finish()
+
+    def _finish(self):
+        """
+        Calls the registered completion callbacks.
+        """
+        callbacks = self._done_callbacks
+        self._done_callbacks = []
+
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                self._communicator.logger.exception(
+                    "Error in the completion callback of %s" % self
+                )
+
+    ##########################################################################################
+    # magic methods
+
+    def __repr__(self):
+        """
+        Stringifies the job.
+        """
+        return "<%s %s: %s, %s>" % (
+            self.__class__.__name__,
+            self._id,
+            self._description,
+            self._state,
+        )
@@ -0,0 +1,131 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+import os
+import sys
+import shutil
+import hashlib
+import zipfile
+import tempfile
+import compileall
+
+# Setting this environment variable to a true value imports the third-party
+# packages straight from the bundled zip file.
+DISABLE_CACHE_ENV_VAR = "SHOTGUN_ADOBE_DISABLE_PACKAGE_CACHE"
+
+# The file written to a cache directory once it is complete.
+_COMPLETE_MARKER = ".complete"
+
+
+def get_packages_path(pkgs_zip_path):
+    """
+    Gets the path to import the bundled third-party packages from.
+
+    Importing from a zip file is slow, and the modules imported that way are
+    compiled again every time. The packages are therefore extracted once to
+    a per-user cache directory and compiled there, and that directory is
+    used instead of the zip file. The cache directory is named after the
+    hash of the zip file, so a new bundle is extracted to a new directory.
+
+    If the packages can't be extracted, or the cache is disabled through the
+    SHOTGUN_ADOBE_DISABLE_PACKAGE_CACHE environment variable, the zip file
+    is used.
+
+    :param str pkgs_zip_path: The path to the zip file bundling the packages.
+
+    :returns: The path to add to sys.path.
+    :rtype: str
+    """
+    if os.environ.get(DISABLE_CACHE_ENV_VAR, "0").strip().lower() in [
+        "1",
+        "true",
+        "y",
+        "yes",
+    ]:
+        return pkgs_zip_path
+
+    try:
+        return _extract_packages(pkgs_zip_path)
+    except Exception:
+        # the cache is an optimization. nothing is lost by not using it.
+        return pkgs_zip_path
+
+
+def _extract_packages(pkgs_zip_path):
+    """
+    Extracts and compiles the packages bundled in the given zip file to the
+    cache directory, unless that was done already.
+
+    :param str pkgs_zip_path: The path to the zip file bundling the packages.
+
+    :returns: The path to the extracted packages.
+    :rtype: str
+    """
+    sha256 = hashlib.sha256()
+
+    with open(pkgs_zip_path, "rb") as pkgs_zip:
+        for chunk in iter(lambda: pkgs_zip.read(1024 * 1024), b""):
+            sha256.update(chunk)
+
+    cache_root = os.path.join(_get_cache_root(), "tk-framework-adobe", "pkgs")
+    cache_path = os.path.join(
+        cache_root,
+        "%s.%s-%s"
+        % (sys.version_info.major, sys.version_info.minor, sha256.hexdigest()[:16]),
+    )
+
+    if os.path.exists(os.path.join(cache_path, _COMPLETE_MARKER)):
+        return cache_path
+
+    # extract to a temporary directory first, and move it into place once
+    # complete, so that other processes never see a partial cache.
+    os.makedirs(cache_root, exist_ok=True)
+    temp_path = tempfile.mkdtemp(prefix="tmp-", dir=cache_root)
+
+    try:
+        with zipfile.ZipFile(pkgs_zip_path) as pkgs_zip:
+            pkgs_zip.extractall(temp_path)
+
+        # the compiled files record where the source files will end up, so
+        # that tracebacks point to them. files that can't be compiled are
+        # compiled on import as usual. nothing must be printed, since stdout
+        # is read by the js process.
+        compileall.compile_dir(temp_path, ddir=cache_path, quiet=2)
+
+        open(os.path.join(temp_path, _COMPLETE_MARKER), "w").close()
+
+        try:
+            os.rename(temp_path, cache_path)
+        except OSError:
+            # another process may have extracted the same packages first.
+            # it's fine to use those.
+            if not os.path.exists(os.path.join(cache_path, _COMPLETE_MARKER)):
+                raise
+    finally:
+        shutil.rmtree(temp_path, ignore_errors=True)
+
+    return cache_path
+
+
+def _get_cache_root():
+    """
+    Gets the per-user cache directory of the current platform.
+
+    :rtype: str
+    """
+    if sys.platform == "win32":
+        return os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Local")
+        )
+    elif sys.platform == "darwin":
+        return os.path.expanduser(os.path.join("~", "Library", "Caches"))
+
+    return os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+        os.path.join("~", ".cache")
+    )
@@ -0,0 +1,94 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+import collections
+import time
+
+
+class TraceBuffer(object):
+    """
+    A fixed size ring buffer of network trace records. Recording a trace is
+    cheap: each record is a tuple of the raw values describing the event,
+    and nothing is formatted until the records are read. Once the buffer is
+    full, the oldest records are discarded.
+
+    Each record is a (timestamp, event, uid, method, size) tuple, where size
+    is the length of the raw message for received responses, or None.
+    """
+
+    # A JSON-RPC command was sent to the server.
+    SEND = "send"
+    # The response to a JSON-RPC command was received from the server.
+    RECEIVE = "receive"
+
+    def __init__(self, size):
+        """
+        Constructor.
+
+        :param int size: The maximum number of records kept.
+        """
+        self._records = collections.deque(maxlen=size)
+
+    ##########################################################################################
+    # properties
+
+    @property
+    def records(self):
+        """
+        The list of records kept, oldest first.
+        """
+        return list(self._records)
+
+    ##########################################################################################
+    # public methods
+
+    def clear(self):
+        """
+        Discards all of the records kept.
+        """
+        self._records.clear()
+
+    def format(self):
+        """
+        Formats the records kept into a human readable report, one line per
+        record.
+
+        :rtype: str
+        """
+        lines = []
+
+        for timestamp, event, uid, method, size in self._records:
+            line = "%.6f %-7s UID %s %s" % (timestamp, event, uid, method)
+
+            if size is not None:
+                line += " (%d bytes)" % size
+
+            lines.append(line)
+
+        return "\n".join(lines)
+
+    def record(self, event, uid, method, size=None):
+        """
+        Records a trace.
+
+        :param str event: The event traced, SEND or RECEIVE.
+        :param int uid: The unique id of the command.
+        :param str method: The JSON-RPC method name of the command.
+        :param int size: The length of the raw message, if known.
+        """
+        self._records.append((time.time(), event, uid, method, size))
+
+    ##########################################################################################
+    # magic methods
+
+    def __len__(self):
+        """
+        The number of records kept.
+        """
+        return len(self._records)
@@ -0,0 +1,197 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+from .proxy import ProxyWrapper
+
+
+class TransactionStep(object):
+    """
+    A reference to an operation recorded in a Transaction. Steps can be
+    used as the target or as an argument of later operations of the same
+    transaction, which allows acting on objects that don't exist yet, like
+    the layer returned by a recorded duplicate() call.
+    """
+
+    def __init__(self, transaction, index):
+        """
+        Constructor.
+
+        :param transaction: The Transaction the step belongs to.
+        :param int index: The index of the recorded operation.
+        """
+        # We have to use super here because __setattr__ records property
+        # assignments as operations of the transaction.
+        super().__setattr__("_transaction", transaction)
+        super().__setattr__("_index", index)
+
+    @property
+    def index(self):
+        """
+        The index of the recorded operation in its transaction.
+        """
+        return self._index
+
+    @property
+    def result(self):
+        """
+        The data returned by the recorded operation. This is only available
+        once the transaction has been executed.
+
+        :raises: RuntimeError
+        """
+        results = self._transaction.results
+
+        if results is None:
+            raise RuntimeError("The transaction has not been executed yet.")
+
+        return results[self._index]
+
+    def __setattr__(self, name, value):
+        """
+        Records the assignment of the given property on the object this step
+        refers to as a new operation of the transaction.
+
+        :param str name: The name of the property to set.
+        :param value: The value to set the property to.
+        """
+        self._transaction.set(self, name, value)
+
+    def __repr__(self):
+        """
+        Stringifies the step.
+        """
+        return "<%s %d of %r>" % (
+            self.__class__.__name__,
+            self._index,
+            self._transaction,
+        )
+
+
+class Transaction(object):
+    """
+    A set of operations on remote objects that are recorded in Python, and
+    then executed in the remote process as a single evaluation. Transactions
+    are created by the Communicator.transaction() context manager.
+    """
+
+    def __init__(self, communicator, history_name=None):
+        """
+        Constructor.
+
+        :param communicator: An active Communicator object connected to some
+                             server process.
+        :param str history_name: The name of the single history state the
+                                 operations are grouped under, if any.
+        """
+        self._communicator = communicator
+        self._history_name = history_name
+        self._operations = []
+        self._results = None
+
+    @property
+    def history_name(self):
+        """
+        The name of the history state the operations are grouped under.
+        """
+        return self._history_name
+
+    @property
+    def operations(self):
+        """
+        The list of recorded operations, encoded for emission.
+        """
+        return self._operations
+
+    @property
+    def results(self):
+        """
+        The list of data returned by each operation once the transaction has
+        been executed, or None before that.
+        """
+        return self._results
+
+    @results.setter
+    def results(self, results):
+        self._results = results
+
+    def call(self, target, method_name, *args):
+        """
+        Records a method call.
+
+        :param target: The proxy object or TransactionStep to call the
+                       method on. If None, a function of the global scope
+                       of the given name is called.
+        :param str method_name: The name of the method to call.
+
+        :returns: A TransactionStep referring to the call's result.
+        """
+        return self.__record(
+            op="call",
+            target=self.__encode(target),
+            name=method_name,
+            args=self.__encode(list(args)),
+        )
+
+    def set(self, target, property_name, value):
+        """
+        Records a property assignment.
+
+        :param target: The proxy object or TransactionStep to set the
+                       property of.
+        :param str property_name: The name of the property to set.
+        :param value: The value to set the property to.
+
+        :returns: A TransactionStep referring to the assignment.
+        """
+        return self.__record(
+            op="set",
+            target=self.__encode(target),
+            name=property_name,
+            value=self.__encode(value),
+        )
+
+    def __encode(self, value):
+        """
+        Encodes the given value so that references to proxy objects and to
+        previous steps can be resolved in the remote process.
+
+        :param value: The value to encode.
+
+        :returns: The encoded value, fit for emission.
+        """
+        if isinstance(value, TransactionStep):
+            return {"__step": value.index}
+        elif isinstance(value, ProxyWrapper):
+            return {"__uniqueid": value.uid}
+        elif isinstance(value, (list, tuple)):
+            return [self.__encode(item) for item in value]
+        else:
+            return value
+
+    def __record(self, **operation):
+        """
+        Records the given operation.
+
+        :returns: A TransactionStep referring to the recorded operation.
+        """
+        if self._results is not None:
+            raise RuntimeError("The transaction has already been executed.")
+
+        self._operations.append(operation)
+        return TransactionStep(self, len(self._operations) - 1)
+
+    def __repr__(self):
+        """
+        Stringifies the transaction.
+        """
+        return "<%s: %s, %d operation(s)>" % (
+            self.__class__.__name__,
+            self._history_name or "unnamed",
+            len(self._operations),
+        )
@@ -13,6 +13,8 @@ sys.dont_write_bytecode = True
 
 
 import os
+import json
+import time
 import traceback
 from environment_utils import get_extension_install_directory
 
@@ -37,9 +39,17 @@ def bootstrap(root_path, port, engine_name, app_id):
     :param app_id: The application id
     """
     # first add our plugin python logic sys.path
+    import_start = time.monotonic()
     sys.path.insert(0, os.path.join(get_extension_install_directory(), "python"))
     sys.path.insert(0, root_path)
     import tk_framework_adobe
+    from tk_framework_adobe import bootstrap_channel
+
+    # report how long startup took so far to the js process, if it set up
+    # a channel to report bootstrap progress through
+    channel = bootstrap_channel.get_channel()
+    if channel:
+        channel.record_phase("import_framework", import_start, time.monotonic())
 
     # set the port in the env so that the engine can pick it up. this also
     # allows engine restarts to find the proper port.
@@ -83,7 +93,8 @@ def bootstrap(root_path, port, engine_name, app_id):
     # create and set up the Qt app. we don't want the app to close when the
     # last window is shut down since it's running in parallel to the CC product.
     # We'll manage shutdown
-    app = QtGui.QApplication([app_name])
+    with bootstrap_channel.phase("create_qt_application"):
+        app = QtGui.QApplication([app_name])
 
     # the icon that will display for the python process in the dock/task bar
     app_icon = QtGui.QIcon(os.path.join(root_path, "icon_256.png"))
@@ -94,7 +105,16 @@ def bootstrap(root_path, port, engine_name, app_id):
     app.setQuitOnLastWindowClosed(False)
 
     # some operations can't be done until a qapplication exists.
-    engine.post_qt_init()
+    with bootstrap_channel.phase("post_qt_init"):
+        engine.post_qt_init()
+
+    # bootstrap is complete. tell the js process where the log files are, so
+    # that it can write the startup timeline there, and close the channel
+    # used to report the bootstrap progress, if the js process set one up.
+    channel = bootstrap_channel.get_channel()
+    if channel:
+        channel.send("complete", log_folder=sgtk.LogManager().log_folder)
+        channel.close()
 
     # log metrics for the app name and version
     host_info = engine.host_info
@@ -140,19 +160,83 @@ def bootstrap(root_path, port, engine_name, app_id):
     sys.exit(ret)
 
 
+def standby(root_path):
+    """
+    Entry point for standby python processes.
+
+    A standby process is spawned ahead of time by javascript, so that it can
+    take over when the manager is reloaded, or when the python process dies.
+    It does the imports that don't depend on the bootstrap settings, then
+    waits for javascript to hand it off by writing a JSON encoded line to
+    stdin, with the "port", "engine_name" and "app_id" to bootstrap with, and
+    optionally an "env" dictionary of environment variables to set.
+
+    This is only a partial warm start: it saves the python startup and the
+    framework, core and socket.io client imports. The toolkit bootstrap,
+    which may swap the core, the engine startup and the creation of the
+    QApplication all still happen after the handoff, since they depend on
+    the bootstrap settings, and Qt can't be imported before the core has
+    picked the Qt binding to use.
+
+    :param root_path: The path to the plugin on disk
+
+    :returns: The (port, engine_name, app_id) tuple to bootstrap with, or
+              None if javascript closed stdin without handing off.
+    """
+    sys.path.insert(0, os.path.join(get_extension_install_directory(), "python"))
+    sys.path.insert(0, root_path)
+
+    # the imports may fail, for example if the plugin's core could not be
+    # resolved. the standby process carries on, since the errors will be
+    # reported when bootstrapping, but they are logged by javascript, which
+    # reads the output of the standby process.
+    try:
+        import tk_framework_adobe
+
+        if not (os.environ.get("TANK_CONTEXT") and os.environ.get("TANK_ENGINE")):
+            tk_framework_adobe.toolkit_plugin_preload(root_path)
+
+        # import the third-party packages used to communicate with javascript
+        from tk_framework_adobe.rpc import communicator
+    except Exception:
+        sys.stderr.write(
+            "Unable to preload the standby process: %s" % (traceback.format_exc(),)
+        )
+        sys.stderr.flush()
+
+    line = sys.stdin.readline()
+
+    if not line.strip():
+        return None
+
+    handoff = json.loads(line)
+    os.environ.update(handoff.get("env") or {})
+
+    return (handoff["port"], handoff["engine_name"], handoff["app_id"])
+
+
 # executed from javascript
 if __name__ == "__main__":
 
-    # the communication port is supplied by javascript. the toolkit engine
-    # env to bootstrap into is also supplied by javascript
-    (port, engine_name, app_id) = sys.argv[1:4]
-
     # wrap the entire plugin boostrap process so that we can respond to any
     # errors and display them in the panel.
     try:
         # root path is the 'sgtk' directory 2 levels up from this file
         root_path = os.path.dirname(os.path.dirname(__file__))
 
+        if sys.argv[1:2] == ["--standby"]:
+            # the bootstrap settings are supplied by javascript on handoff
+            settings = standby(root_path)
+
+            if settings is None:
+                sys.exit(EXIT_STATUS_CLEAN)
+
+            (port, engine_name, app_id) = settings
+        else:
+            # the communication port is supplied by javascript. the toolkit
+            # engine env to bootstrap into is also supplied by javascript
+            (port, engine_name, app_id) = sys.argv[1:4]
+
         # startup the plugin which includes setting up the socket io client,
         # bootstrapping the engine, and starting the Qt event loop
         bootstrap(root_path, port, engine_name, app_id)
@@ -0,0 +1,98 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+import os
+import sys
+import json
+import subprocess
+import unittest
+
+# The root folder of the framework.
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The modules that must not be imported until they are used.
+DEFERRED_MODULES = [
+    "socketIO_client_nexus",
+    "requests",
+    "sgtk",
+    "tk_framework_adobe.rpc.communicator",
+]
+
+
+class TestImportBudget(unittest.TestCase):
+    """
+    Guards the import time of the framework, by checking that importing it
+    doesn't pull in the socket.io client, toolkit or the communicator.
+    """
+
+    def test_plugin_import(self):
+        """
+        Importing the framework the way the plugin bootstrap does.
+        """
+        modules = self._run_in_subprocess(
+            os.path.join(ROOT_PATH, "python"),
+            "import tk_framework_adobe, tk_framework_adobe.rpc",
+            "sorted(sys.modules)",
+        )
+
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_framework_import(self):
+        """
+        Importing the framework's python folder as a package, the way
+        toolkit does.
+        """
+        modules = self._run_in_subprocess(
+            ROOT_PATH, "import python", "sorted(sys.modules)"
+        )
+
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, modules)
+            self.assertNotIn("python." + module, modules)
+
+    def test_lazy_modules_listed(self):
+        """
+        Only the lazily imported modules available on the current platform
+        are listed, and listing them doesn't import them.
+        """
+        (names, modules) = self._run_in_subprocess(
+            ROOT_PATH, "import python", "[dir(python), sorted(sys.modules)]"
+        )
+
+        self.assertIn("adobe_bridge", names)
+        self.assertIn("document_registry", names)
+        self.assertEqual("win_32_api" in names, sys.platform == "win32")
+        self.assertNotIn("python.tk_framework_adobe.adobe_bridge", modules)
+
+    def _run_in_subprocess(self, path, statement, expression):
+        """
+        Runs the given statement in a new python process, and evaluates the
+        given expression afterward.
+
+        :param str path: The path to add to sys.path first.
+        :param str statement: The statement to run.
+        :param str expression: The expression to evaluate.
+
+        :returns: The JSON serializable value of the expression.
+        """
+        script = "\n".join(
+            [
+                "import sys, json",
+                "sys.path.insert(0, %r)" % path,
+                statement,
+                "print(json.dumps(%s))" % expression,
+            ]
+        )
+        output = subprocess.check_output([sys.executable, "-c", script], cwd=path)
+        return json.loads(output.decode("utf-8").splitlines()[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
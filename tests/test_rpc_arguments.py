@@ -0,0 +1,118 @@
+# Copyright (c) 2019 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+import os
+import json
+import shutil
+import subprocess
+import unittest
+
+# The root folder of the framework.
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The ExtendScript RPC helpers.
+RPC_JS_PATH = os.path.join(ROOT_PATH, "cep", "js", "shotgun", "ECMA", "rpc.js")
+
+# Loads the RPC helpers in a node sandbox, without the ExtendScript
+# preprocessor directives, evaluates the expression given as argument and
+# prints its JSON encoded value.
+NODE_SCRIPT = """
+const fs = require("fs");
+const vm = require("vm");
+
+const source = fs.readFileSync(process.argv[1], "utf8")
+    .replace(/^\\uFEFF/, "")
+    .replace(/^#.*$/mg, "");
+
+const context = {JSON: JSON};
+vm.createContext(context);
+vm.runInContext(source, context);
+
+console.log(JSON.stringify(vm.runInContext(process.argv[2], context)));
+"""
+
+
+@unittest.skipUnless(shutil.which("node"), "node is not available")
+class TestRpcArguments(unittest.TestCase):
+    """
+    Checks that the arguments sent to ExtendScript keep their nesting.
+    """
+
+    def test_prepare_nested_arguments(self):
+        """
+        Lists given as arguments are passed on as lists.
+        """
+        self.assertEqual(
+            self._evaluate('prepare_arguments([["a", "b"], 1])'), [["a", "b"], 1]
+        )
+        self.assertEqual(self._evaluate("prepare_arguments([[10, 0]])"), [[10, 0]])
+        self.assertEqual(
+            self._evaluate("prepare_arguments([[[1, 2], [3]], []])"),
+            [[[1, 2], [3]], []],
+        )
+
+    def test_prepare_nested_wrappers(self):
+        """
+        Wrapper objects are replaced with their concrete object, including
+        within lists.
+        """
+        self.assertEqual(
+            self._evaluate(
+                '__OBJECT_REGISTRY[7] = {name: "doc"}; '
+                "prepare_arguments([[{__uniqueid: 7}, 1], {__uniqueid: 7}])"
+            ),
+            [[{"name": "doc"}, 1], {"name": "doc"}],
+        )
+
+    def test_invoke_nested_arguments(self):
+        """
+        Prepared functions are called with lists given as arguments.
+        """
+        self.assertEqual(
+            self._evaluate(
+                'rpc_prepare("f", "function() { '
+                '__ARGS = Array.prototype.slice.call(arguments); }"); '
+                'rpc_invoke("f", [["a", "b"], 1]); __ARGS'
+            ),
+            [["a", "b"], 1],
+        )
+
+    def test_call_many_nested_arguments(self):
+        """
+        Methods called on many objects are called with lists given as
+        arguments.
+        """
+        self.assertEqual(
+            self._evaluate(
+                "__ARGS = []; "
+                "__OBJECT_REGISTRY[1] = {m: function() { "
+                "__ARGS.push(Array.prototype.slice.call(arguments)); }}; "
+                "__OBJECT_REGISTRY[2] = __OBJECT_REGISTRY[1]; "
+                'rpc_call_many({uids: [1, 2], name: "m", '
+                "args: [[[10, 0], [20, 5]], [[1, 2]]]}); __ARGS"
+            ),
+            [[[10, 0], [20, 5]], [[1, 2]]],
+        )
+
+    def _evaluate(self, expression):
+        """
+        Evaluates the given expression once the RPC helpers are loaded.
+
+        :param str expression: The expression to evaluate.
+
+        :returns: The JSON serializable value of the expression.
+        """
+        output = subprocess.check_output(
+            ["node", "-e", NODE_SCRIPT, RPC_JS_PATH, expression]
+        )
+        return json.loads(output.decode("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()